@@ -1,17 +1,20 @@
 # Main.py
+import argparse
+import os
+import random
 import pygame
 import sys
-from src.player import Player
-from src.enemy import Dog
-from src.tilemap import Tilemap
+from src.enemy import prepare_glitch_frames
+from src.fonts import get_font
+from src.input_recording import InputRecorder, load_input_recording
 from src.light_system import LightSystem
+from src.minigame import OPERATOR_DIFFICULTIES, prepare_minigame_text
+from src.profiler import FrameProfiler, profile_section, set_active_profiler
+from src.simulation import Simulation, SimulationInput
 from src.ui import UI
 from src.colors import *
-from src.minigame import *
 
 
-pygame.init()
-
 GAME_CONFIG = {
     "game_width": 1440,
     "game_height": 960,
@@ -20,7 +23,11 @@ GAME_CONFIG = {
     "target_fps": 60,
     "game_title": "Pythy",
     "tile_size": 48,
-    "scale_factor": 1
+    "scale_factor": 1,
+    "map_file_path": "assets/maps/Garden_1.json",
+    "operator_difficulty": "normal",
+    "profiler_csv_path": "profiler_frames.csv",
+    "replay_csv_path": "replay_frames.csv"
 }
 
 class Camera:
@@ -82,7 +89,16 @@ class Camera:
         )
 
 class Game:
-    def __init__(self):
+    def __init__(self, input_recorder=None, input_recording=None, is_uncapped=False):
+        """
+        Met een input_recorder wordt de invoer van elke tick opgenomen, met een input_recording
+        wordt een opname afgespeeld in plaats van het toetsenbord te lezen.
+        Met is_uncapped draait de game zo snel als het kan, zonder fps limiet.
+        """
+        self.input_recorder = input_recorder
+        self.input_recording = input_recording
+        self.is_uncapped = is_uncapped
+
         self.display_window = pygame.display.set_mode(
             (GAME_CONFIG["screen_width"], GAME_CONFIG["screen_height"])
         )
@@ -94,15 +110,39 @@ class Game:
         
         self.game_clock = pygame.time.Clock()
         self.is_running = True
-        self.is_paused = False
         
-        self.player_character = Player(1035, 800)
-        self.enemy_list = [Dog(500, 400), Dog(1500, 400)]
-        
-        # laad map with 48x48 tiles
-        self.game_map = Tilemap(tile_size=GAME_CONFIG["tile_size"])
+        # bij opnemen en afspelen komen de seed, de map en de moeilijkheid uit de opname en worden paden in de tick zelf gezocht,
+        # want een pad van een worker thread komt niet elke run op dezelfde tick binnen
+        if input_recording is not None:
+            random_seed, map_file_path = input_recording.random_seed, input_recording.map_file_path
+            operator_difficulty = input_recording.operator_difficulty
+        elif input_recorder is not None:
+            random_seed, map_file_path = input_recorder.random_seed, input_recorder.map_file_path
+            operator_difficulty = input_recorder.operator_difficulty
+        else:
+            random_seed, map_file_path = None, GAME_CONFIG["map_file_path"]
+            operator_difficulty = GAME_CONFIG["operator_difficulty"]
+        is_deterministic = input_recording is not None or input_recorder is not None
+
+        # de spelwereld zelf draait in de simulatie, de game tekent alleen en geeft invoer door
+        self.simulation = Simulation(
+            map_file_path,
+            GAME_CONFIG["game_width"],
+            GAME_CONFIG["game_height"],
+            tile_size=GAME_CONFIG["tile_size"],
+            use_path_service=not is_deterministic,
+            random_seed=random_seed,
+            operator_difficulty=operator_difficulty
+        )
+        self.player_character = self.simulation.player_character
+        self.enemy_list = self.simulation.enemy_list
+        self.game_map = self.simulation.game_map
+
+        # render de glitch frames van de honden vooraf
+        prepare_glitch_frames(self.enemy_list[0].size_width, self.enemy_list[0].size_height)
+        # en alle vaste teksten van de minigames
+        prepare_minigame_text()
         
-        self.game_map.load_from_file("assets/maps/Garden_1.json")
         self.game_map.load_background_image("assets/backgrounds/background_garden.png")
 
         self.camera = Camera(
@@ -120,253 +160,205 @@ class Game:
             GAME_CONFIG["game_height"]
         )
         
-        self.depth_sorted_objects = []
+        # toetsen die sinds de vorige update zijn ingedrukt of losgelaten
+        self.pending_key_events = []
 
-        # minigame state
-        self.is_minigame_active = False
-        self.active_minigame_session = None
-        self.last_interaction_location = None
+        # half doorzichtig zwart vlak om de wereld te dimmen (pauze en telefoon)
+        self.dim_overlay_surface = pygame.Surface((GAME_CONFIG["game_width"], GAME_CONFIG["game_height"]))
+        self.dim_overlay_surface.set_alpha(128)
+        self.dim_overlay_surface.fill(BLACK)
 
-        # messages
-        self.active_info_message = ""
-        self.message_display_timer = 0
+        # snapshot van de gedimde wereld bij pauze of een open telefoon
+        self.static_screen_key = None
+        self.static_screen_snapshot = None
+        self.static_world_snapshot = None
+        self.previous_overlay_rect = None
+
+        # meet elk frame per onderdeel, F3 toont de overlay en F4 schrijft de frames naar CSV
+        # (bij een replay worden alle frames bewaard voor het verslag aan het einde)
+        self.frame_profiler = FrameProfiler(history_size=None if input_recording is not None else 600)
+        set_active_profiler(self.frame_profiler)
 
     def handle_events(self):
         """
-        Verwerkt alle gebruikersinvoer en controleert op interacties met de spelwereld.
+        Verzamelt alle gebruikersinvoer, de toetsen worden in de volgende update aan de simulatie gegeven.
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.is_running = False
 
-            # Als er een minigame actief is, gaan alle events naar de telefoon
-            if self.active_minigame_session:
-                self.active_minigame_session.handle_input(event)
+            # de profiler toetsen horen niet bij het spel zelf
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.frame_profiler.toggle_overlay()
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                self.frame_profiler.dump_csv(GAME_CONFIG["profiler_csv_path"])
                 continue
 
-            if event.type == pygame.KEYDOWN:
-                # Interactie met de wereld via de spatiebalk
-                if event.key == pygame.K_SPACE:
-                    # Bereken het exacte middelpunt van de speler
-                    player_center_coordinate_x = self.player_character.position_coordinate_x + self.player_character.size_width // 2
-                    player_center_coordinate_y = self.player_character.position_coordinate_y + self.player_character.size_height // 2
-                    
-                    # Haal de informatie van de tegel op (ID en locatie in het grid)
-                    tile_type, row_index, column_index = self.game_map.get_interaction_tile_info(
-                        player_center_coordinate_x, 
-                        player_center_coordinate_y, 
-                        40
-                    )
-
-                    # Logica voor de Operator Shooter (Tegel 2)
-                    if tile_type == 2:
-                        if (row_index, column_index) not in self.player_character.completed_minigame_locations:
-                            self.last_interaction_location = (row_index, column_index)
-                            logic_module = OperatorMinigame(360, 490)
-                            self.active_minigame_session = CellphoneInterface(
-                                GAME_CONFIG["game_width"], 
-                                GAME_CONFIG["game_height"], 
-                                logic_module
-                            )
-                        else:
-                            self.active_info_message = "You have already mastered this challenge!"
-                            self.message_display_timer = 120
-                    
-                    # Logica voor het Informatiebord (Tegel 3)
-                    elif tile_type == 3:
-                        self.active_info_message = "This is the church of Py, search the garden for objects and press spacebar next to them to absorb their keys or something"
-                        self.message_display_timer = 270
-
-                    # Logica voor de Python Track Minigame (Tegel 4)
-                    elif tile_type == 4:
-                        # Start de Python Track minigame op de telefoon
-                        if (row_index, column_index) not in self.player_character.completed_minigame_locations:
-                            self.last_interaction_location = (row_index, column_index)
-                            # Maak de logica module aan voor het track-spel
-                            logic_module = PythonTrackMinigame(360, 490) 
-                            self.active_minigame_session = CellphoneInterface(
-                                GAME_CONFIG["game_width"], 
-                                GAME_CONFIG["game_height"],
-                                logic_module
-                            )
-                        else:
-                            # Toon een melding als de speler deze track al heeft voltooid
-                            self.active_info_message = "This track has already been conquered!"
-                            self.message_display_timer = 120
-                            
-                    elif tile_type == 5:
-                        # Start de Python Quiz op de telefoon
-                        if (row_index, column_index) not in self.player_character.completed_minigame_locations:
-                            self.last_interaction_location = (row_index, column_index)
-                            
-                            logic_module = PythonQuizMinigame(360, 580) 
-                            
-                            self.active_minigame_session = CellphoneInterface(
-                                GAME_CONFIG["game_width"], 
-                                GAME_CONFIG["game_height"],
-                                logic_module
-                            )
-                        else:
-                            self.active_info_message = "This quiz has already been completed!"
-                            self.message_display_timer = 120
-
-                    # Logica voor de Finale Poort (Tegel 9)
-                    elif tile_type == 9:
-                        if self.player_character.keys_collected_count >= 3:
-                            self.active_info_message = "Well done, you have seen the power of python and mastered it. (end of game currently)"
-                        else:
-                            self.active_info_message = "You don't respect the power of python yet, even though the door it is judging you to be unworthy of walking through it"
-                        self.message_display_timer = 180
-
-                # Pauzeer het spel met de Escape-toets
-                if event.key == pygame.K_ESCAPE:
-                    self.is_paused = not self.is_paused
-
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                self.pending_key_events.append((event.type, event.key))
 
     def start_python_minigame(self):
         """
         Zet het spel op pauze en activeert de status voor het Python minispel.
         """
-        self.is_paused = True
-        self.is_minigame_active = True
+        self.simulation.is_paused = True
         print("Python minigame has started.")
 
     def update(self):
-        # controleer of de telefoon op dit moment open staat
-        if self.active_minigame_session:
-            self.active_minigame_session.update()
-            
-            # kijk of de minigame sessie net is afgelopen
-            if not self.active_minigame_session.is_active:
-                # pak de eindscore van de applicatie die op de telefoon draaide
-                final_score_points = self.active_minigame_session.current_application.total_score_points
-                
-                if final_score_points >= 100:
-                    # voeg de locatie toe aan de lijst met voltooide uitdagingen
-                    if self.last_interaction_location not in self.player_character.completed_minigame_locations:
-                        self.player_character.keys_collected_count += 1
-                        self.player_character.completed_minigame_locations.add(self.last_interaction_location)
-                        self.active_info_message = "You feel closer to python"
-                        self.message_display_timer = 180
-                
-                # sluit de telefoon sessie af
-                self.active_minigame_session = None
-            
-            return
-        
-        # controleer of het spel op pauze staat via het menu
-        if self.is_paused:
-            return
-        
-        # vanaf hier begint de normale logica van de wereld
-        keys = pygame.key.get_pressed()
-        horizontal_movement = 0
-        vertical_movement = 0
-        
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            horizontal_movement -= self.player_character.move_speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            horizontal_movement += self.player_character.move_speed
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            vertical_movement -= self.player_character.move_speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            vertical_movement += self.player_character.move_speed
-        
-        self.player_character.move(horizontal_movement, vertical_movement, self.game_map.walls)
-        self.player_character.update()
+        # lees de bewegingstoetsen en geef alles als een tick aan de simulatie
+        if self.input_recording is not None:
+            # bij een replay komt de invoer uit de opname, het toetsenbord doet niet mee
+            self.pending_key_events = []
+            simulation_input = self.input_recording.next_input()
+            if simulation_input is None:
+                self.is_running = False
+                return
+        else:
+            keys = pygame.key.get_pressed()
+            simulation_input = SimulationInput(
+                move_left=keys[pygame.K_LEFT] or keys[pygame.K_a],
+                move_right=keys[pygame.K_RIGHT] or keys[pygame.K_d],
+                move_up=keys[pygame.K_UP] or keys[pygame.K_w],
+                move_down=keys[pygame.K_DOWN] or keys[pygame.K_s],
+                key_events=self.pending_key_events
+            )
+            self.pending_key_events = []
+        if self.input_recorder is not None:
+            self.input_recorder.record_tick(simulation_input)
+        self.simulation.tick(simulation_input)
 
-        # werk de camera en de vijanden bij
+        # werk de camera bij
         map_width_pixels = self.game_map.map_width * self.game_map.tile_size
         map_height_pixels = self.game_map.map_height * self.game_map.tile_size
         self.camera.follow_player(self.player_character, map_width_pixels, map_height_pixels)
 
-        player_current_position = (self.player_character.position_coordinate_x, self.player_character.position_coordinate_y)
+    def draw(self):
+        """Tekent de volledige spelwereld en UI elementen."""
+        # bij pauze of een open telefoon staat de wereld stil, dan wordt alleen bijgewerkt wat verandert
+        if self.simulation.active_minigame_session or self.simulation.is_paused:
+            self.draw_static_screen()
+            return
+        self.static_screen_key = None
+        self.static_screen_snapshot = None
+        self.static_world_snapshot = None
 
-        for enemy in self.enemy_list:
-            enemy.update(player_current_position, self.game_map.walls, tile_size=self.game_map.tile_size)
-            enemy.separate_from_other_enemies(self.enemy_list, separation_distance=90)
-            
-            if self.detect_collision(self.player_character, enemy):
-                self.player_character.take_damage(10)
-        
-        # sorteer de objecten voor het diepte effect
-        self.depth_sorted_objects = [self.player_character] + self.enemy_list
-        self.depth_sorted_objects.sort(key=lambda object_instance: object_instance.position_coordinate_y)
+        self.draw_world()
 
-        # werk de timer van de informatieberichten bij
-        if self.message_display_timer > 0:
-            self.message_display_timer -= 1
-        else:
-            self.active_info_message = ""
-
-    def detect_collision(self, object_one, object_two):
-        """Controleert of twee objecten elkaar overlappen."""
-        return (
-            object_one.position_coordinate_x < object_two.position_coordinate_x + object_two.size_width and
-            object_one.position_coordinate_x + object_one.size_width > object_two.position_coordinate_x and
-            object_one.position_coordinate_y < object_two.position_coordinate_y + object_two.size_height and
-            object_one.position_coordinate_y + object_one.size_height > object_two.position_coordinate_y
-        )
+        with profile_section("ui"):
+            self.draw_user_interface()
 
-    def draw(self):
-        """Tekent de volledige spelwereld en UI elementen."""
+        # Profiler overlay (niet zelf gemeten)
+        self.frame_profiler.draw_overlay(self.game_surface)
+
+        # Update display
+        with profile_section("flip"):
+            self.display_window.blit(self.game_surface, (0, 0))
+            pygame.display.flip()
+
+    def draw_world(self):
+        """Tekent de achtergrond, de objecten en de verlichting."""
         self.game_surface.fill(DARK_GRAY)
         
         # Achtergrond
-        self.game_map.draw_background(self.game_surface, self.camera.camera_x, self.camera.camera_y)
+        with profile_section("background"):
+            self.game_map.draw_background(self.game_surface, self.camera.camera_x, self.camera.camera_y)
         
         # Wereld objecten
-        for game_object in self.depth_sorted_objects:
-            screen_x, screen_y = self.camera.apply_to_position(
-                game_object.position_coordinate_x, 
-                game_object.position_coordinate_y
-            )
-            game_object.draw_at_position(self.game_surface, screen_x, screen_y)
+        with profile_section("entities"):
+            for game_object in self.simulation.depth_sorted_objects:
+                screen_x, screen_y = self.camera.apply_to_position(
+                    game_object.position_coordinate_x, 
+                    game_object.position_coordinate_y
+                )
+                game_object.draw_at_position(self.game_surface, screen_x, screen_y)
         
         # Verlichting
-        player_screen_x, player_screen_y = self.camera.apply_to_position(
-            self.player_character.position_coordinate_x,
-            self.player_character.position_coordinate_y
-        )
-        self.lighting_system.apply_lighting(
-            self.game_surface,
-            (player_screen_x, player_screen_y),
-            (self.player_character.size_width, self.player_character.size_height)
-        )
-        
-        # Telefoon/Minigame
-        if self.active_minigame_session:
-            overlay_surface = pygame.Surface((GAME_CONFIG["game_width"], GAME_CONFIG["game_height"]))
-            overlay_surface.set_alpha(128)
-            overlay_surface.fill(BLACK)
-            self.game_surface.blit(overlay_surface, (0, 0))
-            self.active_minigame_session.draw(self.game_surface)
-        
+        with profile_section("lighting"):
+            player_screen_x, player_screen_y = self.camera.apply_to_position(
+                self.player_character.position_coordinate_x,
+                self.player_character.position_coordinate_y
+            )
+            self.lighting_system.apply_lighting(
+                self.game_surface,
+                (player_screen_x, player_screen_y),
+                (self.player_character.size_width, self.player_character.size_height)
+            )
+
+    def draw_user_interface(self):
+        """Tekent de health bar, de sleutels en het informatiebericht (of de hint bij een interactief object)."""
         # Health bar en algemene UI
         self.user_interface.draw(self.game_surface, self.player_character)
 
         # Informatieberichten (Borden)
-        if self.active_info_message != "":
-            self.user_interface.draw_info_message(self.game_surface, self.active_info_message)
-        
-        # Pauze scherm
-        if self.is_paused:
-            self.draw_pause_screen()
+        if self.simulation.active_info_message != "":
+            self.user_interface.draw_info_message(self.game_surface, self.simulation.active_info_message)
+        elif self.simulation.nearby_interactable is not None and not self.simulation.active_minigame_session:
+            # hint dat de speler met de spatiebalk iets kan doen
+            self.user_interface.draw_interaction_prompt(self.game_surface, self.simulation.nearby_interactable.tile_type)
 
-        # Update display
-        self.display_window.blit(self.game_surface, (0, 0))
-        pygame.display.flip()
+    def draw_static_screen(self):
+        """
+        Tekent het pauzescherm of de open telefoon. De gedimde wereld wordt een keer als snapshot
+        bewaard; daarna wordt alleen het stuk van de telefoon (en de profiler overlay)
+        opnieuw getekend en met display.update naar het scherm gestuurd.
+        """
+        minigame_session = self.simulation.active_minigame_session
+        static_screen_key = (self.simulation.is_paused, minigame_session, self.simulation.active_info_message)
+
+        if static_screen_key != self.static_screen_key:
+            # eerste frame: de hele wereld een keer tekenen en dimmen
+            self.draw_world()
+            with profile_section("ui"):
+                if minigame_session:
+                    self.game_surface.blit(self.dim_overlay_surface, (0, 0))
+                    # de telefoon komt tussen de wereld en de UI, dus ook een versie zonder UI bewaren
+                    self.static_world_snapshot = self.game_surface.copy()
+                self.draw_user_interface()
+                if self.simulation.is_paused:
+                    self.draw_pause_screen()
+            self.static_screen_snapshot = self.game_surface.copy()
+            self.static_screen_key = static_screen_key
+            self.previous_overlay_rect = None
+            redraw_full_screen = True
+        else:
+            redraw_full_screen = False
+
+        dirty_rects = []
+        if minigame_session:
+            with profile_section("minigame"):
+                # herstel het hele gebied waar de (schuddende) telefoon kan staan,
+                # teken de telefoon opnieuw en de UI er weer overheen
+                phone_area_rect = minigame_session.get_maximum_screen_rect()
+                self.game_surface.blit(self.static_world_snapshot, phone_area_rect, phone_area_rect)
+                minigame_session.draw(self.game_surface)
+                self.game_surface.set_clip(phone_area_rect)
+                self.draw_user_interface()
+                self.game_surface.set_clip(None)
+                dirty_rects.append(phone_area_rect)
+
+        # Profiler overlay (niet zelf gemeten)
+        if self.previous_overlay_rect:
+            self.game_surface.blit(self.static_screen_snapshot, self.previous_overlay_rect, self.previous_overlay_rect)
+            dirty_rects.append(self.previous_overlay_rect)
+        overlay_rect = self.frame_profiler.draw_overlay(self.game_surface)
+        if overlay_rect:
+            dirty_rects.append(overlay_rect)
+        self.previous_overlay_rect = overlay_rect
+
+        with profile_section("flip"):
+            if redraw_full_screen:
+                self.display_window.blit(self.game_surface, (0, 0))
+                pygame.display.flip()
+            elif dirty_rects:
+                for dirty_rect in dirty_rects:
+                    self.display_window.blit(self.game_surface, dirty_rect, dirty_rect)
+                pygame.display.update(dirty_rects)
 
     def draw_pause_screen(self):
-        overlay = pygame.Surface(
-            (GAME_CONFIG["game_width"], GAME_CONFIG["game_height"])
-        )
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.game_surface.blit(overlay, (0, 0))
+        self.game_surface.blit(self.dim_overlay_surface, (0, 0))
         
-        font = pygame.font.Font(None, 36)
-        text = font.render("PAUSED", True, WHITE)
+        text = get_font(36).render("PAUSED", True, WHITE)
         rect = text.get_rect(center=(GAME_CONFIG["game_width"] // 2, GAME_CONFIG["game_height"] // 2))
         self.game_surface.blit(text, rect)
 
@@ -385,15 +377,76 @@ class Game:
 
     def run(self):
         while self.is_running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.game_clock.tick(GAME_CONFIG["target_fps"])
+            # de frametijd is het werk van een frame, zonder het wachten op de fps limiet
+            self.frame_profiler.begin_frame()
+            with profile_section("events"):
+                self.handle_events()
+            with profile_section("update"):
+                self.update()
+            # de replay is afgelopen of het venster is gesloten, dit frame niet meer tekenen
+            if not self.is_running:
+                break
+            with profile_section("draw"):
+                self.draw()
+            self.frame_profiler.end_frame()
+            if self.is_uncapped:
+                self.game_clock.tick()
+            else:
+                self.game_clock.tick(GAME_CONFIG["target_fps"])
+        self.simulation.close()
+        if self.input_recorder is not None:
+            self.input_recorder.close()
+        if self.input_recording is not None:
+            self.report_replay()
         pygame.quit()
         sys.exit()
 
+    def report_replay(self):
+        """Schrijft de frametijden van de replay naar CSV en print een korte samenvatting."""
+        self.frame_profiler.dump_csv(GAME_CONFIG["replay_csv_path"])
+        frame_count = len(self.frame_profiler.frame_durations)
+        if frame_count == 0:
+            return
+        print(
+            f"Replay: {frame_count} frames, "
+            f"gemiddeld {self.frame_profiler.get_average_frame_time(frame_count):.2f} ms, "
+            f"p99 {self.frame_profiler.get_frame_time_percentile(99):.2f} ms, "
+            f"max {max(self.frame_profiler.frame_durations):.2f} ms"
+        )
+
+
+def parse_arguments(argument_list=None):
+    """Leest de opties voor opnemen en afspelen van de commandoregel."""
+    argument_parser = argparse.ArgumentParser(description=GAME_CONFIG["game_title"])
+    argument_parser.add_argument("--record", metavar="PAD", help="neem de invoer van deze sessie op in een bestand")
+    argument_parser.add_argument("--replay", metavar="PAD", help="speel een opgenomen sessie af")
+    argument_parser.add_argument("--headless", action="store_true", help="draai zonder venster (SDL dummy driver)")
+    argument_parser.add_argument("--uncapped", action="store_true", help="geen fps limiet, zo snel als het kan")
+    argument_parser.add_argument("--operator-difficulty", choices=sorted(OPERATOR_DIFFICULTIES), default=GAME_CONFIG["operator_difficulty"], help="moeilijkheid van de operator shooter (bij --replay komt die uit de opname)")
+    argument_parser.add_argument("--replay-csv", default=GAME_CONFIG["replay_csv_path"], help="CSV-bestand met de frametijden van de replay")
+    return argument_parser.parse_args(argument_list)
 
 
 if __name__ == "__main__":
-    game = Game()
+    arguments = parse_arguments()
+    if arguments.record and arguments.replay:
+        sys.exit("--record en --replay kunnen niet samen gebruikt worden")
+    # de dummy driver moet gekozen zijn voordat pygame start
+    if arguments.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    GAME_CONFIG["replay_csv_path"] = arguments.replay_csv
+    GAME_CONFIG["operator_difficulty"] = arguments.operator_difficulty
+    pygame.init()
+
+    input_recorder = None
+    input_recording = None
+    if arguments.record:
+        input_recorder = InputRecorder(
+            arguments.record, random.getrandbits(63), GAME_CONFIG["map_file_path"], GAME_CONFIG["operator_difficulty"]
+        )
+    if arguments.replay:
+        input_recording = load_input_recording(arguments.replay)
+
+    game = Game(input_recorder=input_recorder, input_recording=input_recording, is_uncapped=arguments.uncapped)
     game.run()
\ No newline at end of file
@@ -0,0 +1,640 @@
+"""
+Benchmarks voor de zware onderdelen van de game.
+
+Draait zonder scherm (SDL dummy video driver) en meet elk onderdeel bij groeiende
+invoer: mapgroottes van Garden_1 (40x22) tot 512x512 en 2 tot 1000 vijanden.
+De resultaten worden als JSON weggeschreven, zodat versies vergeleken kunnen worden.
+
+Gebruik:
+    python -m benchmarks.run_benchmarks [--output bench_output.json] [--quick] [--only naam ...]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.enemy import Dog
+from src.enemy_swarm import EnemySwarm
+from src.game_random import seed_gameplay_random
+from src.hierarchical_pathfinding import HierarchicalPathfinder
+from src.incremental_pathfinding import DStarLitePlanner
+from src.light_system import LightSystem
+from src.map_format import write_binary_map
+from src.minigame import OPERATOR_DIFFICULTIES, OperatorMinigame
+from src.pathfinding import FlowField, a_star, find_path
+from src.player import Player
+from src.simulation import Simulation, SimulationInput
+from src.spatial_hash import SpatialHash
+from src.tilemap import Tilemap
+
+# Mapgroottes (breedte, hoogte) in tegels, de eerste is de grootte van Garden_1
+MAP_SIZES = [(40, 22), (64, 64), (128, 128), (256, 256), (512, 512)]
+QUICK_MAP_SIZES = [(40, 22), (64, 64), (128, 128)]
+
+# Aantallen vijanden voor de benchmarks die met het aantal vijanden schalen
+ENEMY_COUNTS = [2, 10, 50, 100, 250, 500, 1000]
+QUICK_ENEMY_COUNTS = [2, 10, 50, 100]
+
+# Alle benchmarks op naam, gevuld door de register_benchmark decorator
+BENCHMARKS = {}
+
+
+def register_benchmark(benchmark_name):
+    """Registreert een benchmark functie onder een naam."""
+    def decorator(benchmark_function):
+        BENCHMARKS[benchmark_name] = benchmark_function
+        return benchmark_function
+    return decorator
+
+
+def time_call(function, repeat_count=5):
+    """Voert een functie een paar keer uit en geeft de mediane tijd in seconden terug."""
+    durations = []
+    for _ in range(repeat_count):
+        start_time = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start_time)
+    return statistics.median(durations)
+
+
+def make_benchmark_grid(map_width, map_height, clutter_fraction=0.08, seed=1):
+    """
+    Maakt een collision grid met een muur rondom, rijen pilaren zoals in de tuin
+    en wat willekeurige losse muren. Dezelfde seed geeft altijd dezelfde map.
+    """
+    random_generator = random.Random(seed)
+    grid = [[0] * map_width for _ in range(map_height)]
+
+    for column_index in range(map_width):
+        grid[0][column_index] = 1
+        grid[map_height - 1][column_index] = 1
+    for row_index in range(map_height):
+        grid[row_index][0] = 1
+        grid[row_index][map_width - 1] = 1
+
+    for row_index in range(1, map_height - 1):
+        for column_index in range(1, map_width - 1):
+            # pilaren om de vier tegels, om de vijf rijen
+            if row_index % 5 == 0 and column_index % 4 == 0:
+                grid[row_index][column_index] = 1
+            elif random_generator.random() < clutter_fraction:
+                grid[row_index][column_index] = 1
+
+    # houd de hoeken vrij voor start en doel van de pathfinding benchmarks
+    for row_index in range(1, 4):
+        for column_index in range(1, 4):
+            grid[row_index][column_index] = 0
+            grid[map_height - 1 - row_index][map_width - 1 - column_index] = 0
+
+    return grid
+
+
+def make_benchmark_tilemap(map_width, map_height, clutter_fraction=0.08, tile_size=48):
+    """Maakt een Tilemap met een gegenereerde map."""
+    tilemap_instance = Tilemap(tile_size=tile_size)
+    tilemap_instance.load_from_data({"collision": make_benchmark_grid(map_width, map_height, clutter_fraction)})
+    return tilemap_instance
+
+
+def make_enemies(enemy_count, area_width_pixels, area_height_pixels, seed=2):
+    """Plaatst een aantal honden willekeurig in een gebied."""
+    random_generator = random.Random(seed)
+    return [
+        Dog(random_generator.uniform(0, area_width_pixels), random_generator.uniform(0, area_height_pixels))
+        for _ in range(enemy_count)
+    ]
+
+
+def corner_positions(tilemap_instance):
+    """Start linksboven en doel rechtsonder in de vrije hoeken van een benchmark map."""
+    tile_size = tilemap_instance.tile_size
+    start_position = (2 * tile_size + tile_size // 2, 2 * tile_size + tile_size // 2)
+    goal_position = (
+        (tilemap_instance.map_width - 3) * tile_size + tile_size // 2,
+        (tilemap_instance.map_height - 3) * tile_size + tile_size // 2,
+    )
+    return start_position, goal_position
+
+
+@register_benchmark("a_star")
+def benchmark_a_star(quick):
+    """Een volledige zoekopdracht van hoek tot hoek op het navigatie-grid."""
+    results = []
+    for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES):
+        tilemap_instance = make_benchmark_tilemap(map_width, map_height)
+        navigation_grid = tilemap_instance.get_navigation_grid()
+        start_position, goal_position = corner_positions(tilemap_instance)
+        repeat_count = 5 if map_width * map_height <= 128 * 128 else 1
+
+        seconds = time_call(lambda: a_star(start_position, goal_position, navigation_grid), repeat_count)
+        results.append({"map_size": [map_width, map_height], "seconds": seconds})
+    return results
+
+
+@register_benchmark("jump_point_search")
+def benchmark_jump_point_search(quick):
+    """
+    Jump Point Search tegenover a_star van hoek tot hoek, met het aantal uitgebreide knopen,
+    op een lege map, een map met alleen pilaren en maps met steeds meer losse muren.
+    """
+    results = []
+    for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES):
+        for map_kind, clutter_fraction in (("open", None), ("pillars", 0.0), ("cluttered", 0.08), ("dense", 0.14)):
+            if clutter_fraction is None:
+                # alleen de muur rondom
+                collision_grid = [
+                    [1 if row_index in (0, map_height - 1) or column_index in (0, map_width - 1) else 0 for column_index in range(map_width)]
+                    for row_index in range(map_height)
+                ]
+                tilemap_instance = Tilemap()
+                tilemap_instance.load_from_data({"collision": collision_grid})
+            else:
+                tilemap_instance = make_benchmark_tilemap(map_width, map_height, clutter_fraction)
+            navigation_grid = tilemap_instance.get_navigation_grid()
+            start_position, goal_position = corner_positions(tilemap_instance)
+            repeat_count = 5 if map_width * map_height <= 128 * 128 else 1
+
+            # de tabellen van Jump Point Search worden een keer per grid gemaakt en tellen apart
+            table_seconds = time_call(navigation_grid.get_jump_point_tables, 1)
+            result = {"map_size": [map_width, map_height], "map_kind": map_kind, "table_seconds": table_seconds}
+            for algorithm in ("a_star", "jump_point"):
+                search_statistics = {}
+                found_path = find_path(
+                    start_position, goal_position, navigation_grid,
+                    algorithm=algorithm, search_statistics=search_statistics
+                )
+                result[f"{algorithm}_seconds"] = time_call(
+                    lambda: find_path(start_position, goal_position, navigation_grid, algorithm=algorithm), repeat_count
+                )
+                result[f"{algorithm}_expanded_nodes"] = search_statistics["expanded_node_count"]
+                result[f"{algorithm}_path_length"] = len(found_path) if found_path else None
+            results.append(result)
+    return results
+
+
+@register_benchmark("hierarchical_pathfinding")
+def benchmark_hierarchical_pathfinding(quick):
+    """
+    HPA* tegenover a_star van hoek tot hoek: het opbouwen van de doorgangen (een keer per map),
+    een zoektocht die alleen het volgende stuk uitwerkt en een volledig uitgewerkt pad.
+    """
+    results = []
+    for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES):
+        tilemap_instance = make_benchmark_tilemap(map_width, map_height)
+        navigation_grid = tilemap_instance.get_navigation_grid()
+        start_position, goal_position = corner_positions(tilemap_instance)
+        repeat_count = 5 if map_width * map_height <= 128 * 128 else 1
+
+        build_seconds = time_call(lambda: HierarchicalPathfinder(navigation_grid), repeat_count)
+        hierarchical_pathfinder = HierarchicalPathfinder(navigation_grid)
+        # de eerste zoektocht rekent de afstanden binnen de clusters uit, die tellen apart
+        first_query_seconds = time_call(lambda: hierarchical_pathfinder.find_path(start_position, goal_position), 1)
+
+        # een doel dat ingemetseld is: a_star doorzoekt dan de hele map, HPA* alleen de abstracte graaf
+        walled_grid = make_benchmark_grid(map_width, map_height)
+        for offset in range(-5, 1):
+            walled_grid[map_height - 6][map_width - 1 + offset] = 1
+            walled_grid[map_height - 1 + offset][map_width - 6] = 1
+        walled_tilemap = Tilemap(tile_size=tilemap_instance.tile_size)
+        walled_tilemap.load_from_data({"collision": walled_grid})
+        walled_navigation_grid = walled_tilemap.get_navigation_grid()
+        walled_pathfinder = HierarchicalPathfinder(walled_navigation_grid)
+        walled_pathfinder.find_path(start_position, goal_position)
+
+        results.append({
+            "map_size": [map_width, map_height],
+            "a_star_seconds": time_call(lambda: a_star(start_position, goal_position, navigation_grid), repeat_count),
+            "unreachable_a_star_seconds": time_call(
+                lambda: a_star(start_position, goal_position, walled_navigation_grid), repeat_count
+            ),
+            "unreachable_hierarchical_seconds": time_call(
+                lambda: walled_pathfinder.find_path(start_position, goal_position), repeat_count
+            ),
+            "build_seconds": build_seconds,
+            "first_query_seconds": first_query_seconds,
+            "next_segment_seconds": time_call(
+                lambda: hierarchical_pathfinder.find_path(start_position, goal_position), repeat_count
+            ),
+            "full_path_seconds": time_call(
+                lambda: hierarchical_pathfinder.find_path(start_position, goal_position, refined_segment_count=None),
+                repeat_count,
+            ),
+        })
+    return results
+
+
+def walk_along_path(position, path, distance):
+    """Loopt een afstand in pixels over een pad (lijst met waypoints, wordt ingekort)."""
+    position_x, position_y = position
+    while path and distance > 0:
+        target_x, target_y = path[0]
+        target_distance = ((target_x - position_x) ** 2 + (target_y - position_y) ** 2) ** 0.5
+        if target_distance <= distance:
+            position_x, position_y = target_x, target_y
+            distance -= target_distance
+            path.pop(0)
+        else:
+            position_x += (target_x - position_x) / target_distance * distance
+            position_y += (target_y - position_y) / target_distance * distance
+            distance = 0
+    return position_x, position_y
+
+
+@register_benchmark("incremental_pathfinding")
+def benchmark_incremental_pathfinding(quick):
+    """
+    Een achtervolging: de speler loopt langs een paar punten en een hond zoekt elke 30 frames een nieuw pad.
+    D* Lite die zijn zoekwerk bewaart, tegenover D* Lite die elke keer opnieuw begint (even goede paden)
+    en de gewone a_star. Gemeten wordt de gemiddelde tijd en het aantal uitgebreide knopen per zoektocht.
+    """
+    results = []
+    for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES[:4]):
+        tilemap_instance = make_benchmark_tilemap(map_width, map_height)
+        navigation_grid = tilemap_instance.get_navigation_grid()
+        start_position, goal_position = corner_positions(tilemap_instance)
+        map_width_pixels = tilemap_instance.map_width * tilemap_instance.tile_size
+        map_height_pixels = tilemap_instance.map_height * tilemap_instance.tile_size
+        player_route = [
+            (map_width_pixels * 0.5, map_height_pixels * 0.5), (map_width_pixels * 0.8, map_height_pixels * 0.3),
+            (map_width_pixels * 0.3, map_height_pixels * 0.8), (map_width_pixels * 0.9, map_height_pixels * 0.9),
+        ]
+
+        def chase(planner_kind, frame_count=600, recalculation_interval=30):
+            planner = DStarLitePlanner(navigation_grid) if planner_kind != "a_star" else None
+            player_position, player_path, route_index = goal_position, [], 0
+            dog_position, dog_path = start_position, []
+            search_seconds, expanded_node_count, search_count = 0.0, 0, 0
+            for frame_index in range(frame_count):
+                if not player_path:
+                    player_path = find_path(player_position, player_route[route_index % len(player_route)], navigation_grid) or []
+                    route_index += 1
+                player_position = walk_along_path(player_position, player_path, 4.0)
+                if frame_index % recalculation_interval == 0:
+                    if planner_kind == "d_star_lite_reset":
+                        planner.goal_index = None
+                    search_statistics = {}
+                    started_at = time.perf_counter()
+                    if planner is None:
+                        dog_path = find_path(dog_position, player_position, navigation_grid, search_statistics=search_statistics) or []
+                    else:
+                        dog_path = planner.find_path(dog_position, player_position) or []
+                    search_seconds += time.perf_counter() - started_at
+                    if planner is None:
+                        expanded_node_count += search_statistics["expanded_node_count"]
+                    else:
+                        expanded_node_count += planner.last_expanded_node_count
+                    search_count += 1
+                dog_position = walk_along_path(dog_position, dog_path, 2.5)
+            return search_seconds / search_count, expanded_node_count / search_count
+
+        result = {"map_size": [map_width, map_height]}
+        for planner_kind in ("d_star_lite", "d_star_lite_reset", "a_star"):
+            seconds_per_search, expanded_nodes_per_search = chase(planner_kind)
+            result[f"{planner_kind}_seconds_per_search"] = seconds_per_search
+            result[f"{planner_kind}_expanded_nodes_per_search"] = expanded_nodes_per_search
+        results.append(result)
+    return results
+
+
+@register_benchmark("chasing_pathfinding")
+def benchmark_chasing_pathfinding(quick):
+    """
+    Paden voor een groep achtervolgers naar dezelfde speler:
+    een a_star per vijand tegenover een gedeeld stromingsveld plus een opzoeking per vijand.
+    """
+    results = []
+    tilemap_instance = make_benchmark_tilemap(128, 128)
+    navigation_grid = tilemap_instance.get_navigation_grid()
+    _, goal_position = corner_positions(tilemap_instance)
+    map_width_pixels = tilemap_instance.map_width * tilemap_instance.tile_size
+    map_height_pixels = tilemap_instance.map_height * tilemap_instance.tile_size
+
+    for enemy_count in (QUICK_ENEMY_COUNTS if quick else ENEMY_COUNTS):
+        enemy_list = make_enemies(enemy_count, map_width_pixels, map_height_pixels)
+        enemy_centers = [(enemy.position_coordinate_x + 40, enemy.position_coordinate_y + 20) for enemy in enemy_list]
+
+        def a_star_per_enemy():
+            for enemy_center in enemy_centers:
+                a_star(enemy_center, goal_position, navigation_grid)
+
+        def shared_flow_field():
+            flow_field = FlowField(navigation_grid)
+            flow_field.update(goal_position)
+            for enemy_center in enemy_centers:
+                flow_field.get_next_waypoint(*enemy_center)
+
+        a_star_seconds = time_call(a_star_per_enemy, 1)
+        flow_field_seconds = time_call(shared_flow_field, 3)
+        results.append({
+            "map_size": [128, 128],
+            "enemy_count": enemy_count,
+            "a_star_seconds": a_star_seconds,
+            "flow_field_seconds": flow_field_seconds,
+        })
+    return results
+
+
+@register_benchmark("nearest_interactable")
+def benchmark_nearest_interactable(quick):
+    """Het dichtstbijzijnde interactieve object opzoeken vanaf duizend plekken, zoals de UI dat elk frame doet."""
+    results = []
+    for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES):
+        collision_grid = make_benchmark_grid(map_width, map_height)
+        # om de 12 tegels een object van 2x1 tegels, net als de deur
+        for row_index in range(6, map_height - 6, 12):
+            for column_index in range(6, map_width - 6, 12):
+                collision_grid[row_index][column_index] = collision_grid[row_index][column_index + 1] = 9
+        tilemap_instance = Tilemap()
+        tilemap_instance.load_from_data({"collision": collision_grid})
+        random_generator = random.Random(4)
+        query_positions = [
+            (random_generator.uniform(0, map_width * 48), random_generator.uniform(0, map_height * 48)) for _ in range(1000)
+        ]
+
+        def query_all():
+            for query_x, query_y in query_positions:
+                tilemap_instance.get_nearest_interactable(query_x, query_y, 40)
+
+        results.append({
+            "map_size": [map_width, map_height],
+            "interactable_count": len(tilemap_instance.interactable_index.interactable_objects),
+            "build_seconds": time_call(lambda: tilemap_instance.interactable_index.build(collision_grid), 3),
+            "thousand_queries_seconds": time_call(query_all),
+        })
+    return results
+
+
+@register_benchmark("wall_collision")
+def benchmark_wall_collision(quick):
+    """Duizend stappen van de speler met muur-detectie via de tegel-query."""
+    results = []
+    for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES):
+        tilemap_instance = make_benchmark_tilemap(map_width, map_height)
+        player_instance = Player(2 * tilemap_instance.tile_size, 2 * tilemap_instance.tile_size)
+
+        def walk_back_and_forth():
+            for step_index in range(1000):
+                direction = 4.0 if (step_index // 50) % 2 == 0 else -4.0
+                player_instance.move(direction, direction, tilemap_instance)
+
+        seconds = time_call(walk_back_and_forth)
+        results.append({"map_size": [map_width, map_height], "moves": 1000, "seconds": seconds})
+    return results
+
+
+@register_benchmark("separate_from_other_enemies")
+def benchmark_separation(quick):
+    """Een frame afstoting tussen alle vijanden: alle paren tegenover buren uit de spatial hash."""
+    results = []
+    for enemy_count in (QUICK_ENEMY_COUNTS if quick else ENEMY_COUNTS):
+        enemy_list = make_enemies(enemy_count, 1920, 1056)
+        enemy_spatial_hash = SpatialHash(cell_size=90)
+
+        def separate_all_pairs():
+            for enemy in enemy_list:
+                enemy.separate_from_other_enemies(enemy_list, separation_distance=90)
+
+        def separate_with_spatial_hash():
+            enemy_spatial_hash.rebuild(enemy_list)
+            for enemy in enemy_list:
+                enemy.separate_from_other_enemies(enemy_list, separation_distance=90, spatial_hash=enemy_spatial_hash)
+
+        repeat_count = 3 if enemy_count <= 250 else 1
+        results.append({
+            "enemy_count": enemy_count,
+            "seconds": time_call(separate_all_pairs, repeat_count),
+            "spatial_hash_seconds": time_call(separate_with_spatial_hash, repeat_count),
+        })
+    return results
+
+
+@register_benchmark("enemy_update")
+def benchmark_enemy_update(quick):
+    """Een frame vijand-logica met een gedeeld stromingsveld: losse Dog objecten tegenover de numpy swarm."""
+    results = []
+    tilemap_instance = make_benchmark_tilemap(128, 128)
+    flow_field = FlowField(tilemap_instance.get_navigation_grid())
+    player_position = (64 * 48, 64 * 48)
+    flow_field.update(player_position)
+
+    for enemy_count in (QUICK_ENEMY_COUNTS if quick else ENEMY_COUNTS):
+        # de honden staan rond de speler, zodat de meeste achtervolgen of aanvallen
+        enemy_list = make_enemies(enemy_count, 1400, 1400)
+        enemy_swarm = EnemySwarm(initial_capacity=enemy_count)
+        for enemy in enemy_list:
+            enemy.position_coordinate_x += player_position[0] - 700
+            enemy.position_coordinate_y += player_position[1] - 700
+            enemy.pathfinding_mode = "flow_field"
+            enemy_swarm.add_dog(enemy.position_coordinate_x, enemy.position_coordinate_y).pathfinding_mode = "flow_field"
+
+        def update_individual_dogs():
+            for enemy in enemy_list:
+                enemy.update(player_position, tilemap_instance, flow_field=flow_field)
+
+        def update_swarm():
+            enemy_swarm.update(player_position, tilemap_instance, flow_field=flow_field)
+
+        results.append({
+            "enemy_count": enemy_count,
+            "seconds": time_call(update_individual_dogs),
+            "swarm_seconds": time_call(update_swarm),
+        })
+    return results
+
+
+@register_benchmark("simulation_ticks")
+def benchmark_simulation_ticks(quick):
+    """Ticks van de simulatie zonder scherm op Garden_1, met de speler die naar rechts loopt."""
+    tick_count = 500 if quick else 2000
+
+    def run_simulation():
+        simulation_instance = Simulation("assets/maps/Garden_1.json", 1440, 960, player_start_position=(1035, 800))
+        simulation_instance.run_ticks(SimulationInput(move_right=True), tick_count)
+
+    seconds = time_call(run_simulation, 3)
+    return [{"tick_count": tick_count, "seconds": seconds, "seconds_per_tick": seconds / tick_count}]
+
+
+@register_benchmark("apply_lighting")
+def benchmark_lighting(quick):
+    """De lichtpass op een scherm van 1440x960 bij verschillende lichtstralen."""
+    results = []
+    screen_surface = pygame.Surface((1440, 960))
+    for light_radius in (100, 250, 500):
+        lighting_system = LightSystem(1440, 960, light_radius=light_radius)
+
+        def light_frames():
+            for frame_index in range(20):
+                lighting_system.apply_lighting(screen_surface, (600 + frame_index * 4, 400), (48, 96))
+
+        seconds = time_call(light_frames) / 20
+        results.append({"light_radius": light_radius, "seconds_per_frame": seconds})
+    return results
+
+
+@register_benchmark("enemy_draw_at_position")
+def benchmark_enemy_draw(quick):
+    """Een frame tekenen van alle vijanden."""
+    results = []
+    screen_surface = pygame.Surface((1440, 960))
+    for enemy_count in (QUICK_ENEMY_COUNTS if quick else ENEMY_COUNTS):
+        enemy_list = make_enemies(enemy_count, 1360, 920)
+
+        def draw_all():
+            for enemy in enemy_list:
+                enemy.draw_at_position(screen_surface, enemy.position_coordinate_x, enemy.position_coordinate_y)
+
+        seconds = time_call(draw_all)
+        results.append({"enemy_count": enemy_count, "seconds": seconds})
+    return results
+
+
+@register_benchmark("operator_minigame")
+def benchmark_operator_minigame(quick):
+    """
+    De operator shooter met de spatiebalk vastgehouden en de speler heen en weer:
+    gemiddelde tijd per frame voor update en tekenen, en hoeveel kogels er op het schermpje staan.
+    """
+    results = []
+    display_surface = pygame.Surface((360, 490))
+    for difficulty in OPERATOR_DIFFICULTIES:
+        seed_gameplay_random(1)
+        operator_minigame = OperatorMinigame(360, 490, difficulty=difficulty)
+        # het spel mag niet afgelopen zijn voordat de meting klaar is
+        operator_minigame.target_score_points = float("inf")
+        frame_count = 300 if quick else 1200
+        projectile_counts = []
+        update_seconds = 0.0
+        draw_seconds = 0.0
+        for frame_index in range(frame_count):
+            if frame_index % 3 == 0:
+                # normaal schiet elke toetsaanslag een kogel, bij bullet hell schiet vasthouden een waaier
+                operator_minigame.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+            if frame_index % 120 == 0:
+                moving_key = pygame.K_LEFT if frame_index % 240 == 0 else pygame.K_RIGHT
+                operator_minigame.handle_input(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT))
+                operator_minigame.handle_input(pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT))
+                operator_minigame.handle_input(pygame.event.Event(pygame.KEYDOWN, key=moving_key))
+
+            started_at = time.perf_counter()
+            operator_minigame.update()
+            update_seconds += time.perf_counter() - started_at
+            started_at = time.perf_counter()
+            operator_minigame.draw(display_surface)
+            draw_seconds += time.perf_counter() - started_at
+            projectile_counts.append(len(operator_minigame.projectile_pool))
+
+        results.append({
+            "difficulty": difficulty,
+            "frame_count": frame_count,
+            "update_seconds_per_frame": update_seconds / frame_count,
+            "draw_seconds_per_frame": draw_seconds / frame_count,
+            "average_projectile_count": statistics.mean(projectile_counts),
+            "maximum_projectile_count": max(projectile_counts),
+            "final_operator_count": len(operator_minigame.operator_pool),
+        })
+    return results
+
+
+@register_benchmark("tilemap_draw_layer")
+def benchmark_draw_layer(quick):
+    """Een frame tekenen van de collision-laag met de camera in het midden van de map."""
+    results = []
+    screen_surface = pygame.Surface((1440, 960))
+    for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES):
+        tilemap_instance = make_benchmark_tilemap(map_width, map_height)
+        camera_x = max(0, map_width * tilemap_instance.tile_size // 2 - 720)
+        camera_y = max(0, map_height * tilemap_instance.tile_size // 2 - 480)
+
+        seconds = time_call(lambda: tilemap_instance.draw_layer(screen_surface, "collision", camera_x, camera_y))
+        results.append({"map_size": [map_width, map_height], "seconds": seconds})
+    return results
+
+
+@register_benchmark("map_loading")
+def benchmark_map_loading(quick):
+    """Een map laden uit JSON tegenover het binaire formaat, inclusief muren en navigatie-grid."""
+    results = []
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        for map_width, map_height in (QUICK_MAP_SIZES if quick else MAP_SIZES):
+            collision_grid = make_benchmark_grid(map_width, map_height)
+            json_map_path = os.path.join(temporary_directory, f"map_{map_width}x{map_height}.json")
+            binary_map_path = os.path.join(temporary_directory, f"map_{map_width}x{map_height}.pmap")
+            with open(json_map_path, "w", encoding="utf-8") as file_handle:
+                json.dump({"collision": collision_grid}, file_handle)
+            write_binary_map(binary_map_path, {"collision": collision_grid})
+
+            def load_map(map_path):
+                tilemap_instance = Tilemap()
+                # de laadmeldingen horen niet in de benchmark uitvoer
+                with contextlib.redirect_stdout(io.StringIO()):
+                    tilemap_instance.load_from_file(map_path)
+                tilemap_instance.get_navigation_grid()
+
+            results.append({
+                "map_size": [map_width, map_height],
+                "json_seconds": time_call(lambda: load_map(json_map_path)),
+                "binary_seconds": time_call(lambda: load_map(binary_map_path)),
+                "json_bytes": os.path.getsize(json_map_path),
+                "binary_bytes": os.path.getsize(binary_map_path),
+            })
+    return results
+
+
+def run_benchmarks(selected_names=None, quick=False):
+    """Draait de gekozen benchmarks (standaard allemaal) en geeft de resultaten terug."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    results = {}
+    for benchmark_name, benchmark_function in BENCHMARKS.items():
+        if selected_names and benchmark_name not in selected_names:
+            continue
+        print(f"benchmark: {benchmark_name}")
+        results[benchmark_name] = benchmark_function(quick)
+        for result_entry in results[benchmark_name]:
+            print(f"    {result_entry}")
+    return results
+
+
+def main(argument_list=None):
+    argument_parser = argparse.ArgumentParser(description="Benchmarks voor de zware onderdelen van de game.")
+    argument_parser.add_argument("--output", default="bench_output.json", help="pad van het JSON bestand met resultaten")
+    argument_parser.add_argument("--quick", action="store_true", help="alleen de kleinere invoer meten")
+    argument_parser.add_argument("--only", nargs="*", help="alleen deze benchmarks draaien")
+    arguments = argument_parser.parse_args(argument_list)
+
+    results = run_benchmarks(arguments.only, arguments.quick)
+    report = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python_version": platform.python_version(),
+            "pygame_version": pygame.version.ver,
+            "platform": platform.platform(),
+            "quick": arguments.quick,
+        },
+        "results": results,
+    }
+
+    with open(arguments.output, "w", encoding="utf-8") as file_handle:
+        json.dump(report, file_handle, indent=2)
+    print(f"Resultaten weggeschreven naar {arguments.output}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
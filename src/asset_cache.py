@@ -0,0 +1,125 @@
+# src/asset_cache.py
+import numpy
+import pygame
+
+
+class AssetCache:
+    """
+    Centrale opslag voor afbeeldingen. Elk bestand wordt maar een keer van schijf gelezen
+    en (als er een scherm is) naar het formaat van het scherm omgezet: convert voor
+    ondoorzichtige afbeeldingen, convert_alpha alleen als er echt doorzichtige pixels zijn.
+    Afgeleide varianten (uitgeknipt, geschaald, gespiegeld) worden per transformatie bewaard,
+    zodat tekenen zelf nooit meer een transform hoeft te doen.
+    """
+
+    def __init__(self):
+        # (bestandspad, alpha) -> (surface, of hij al naar het schermformaat is omgezet)
+        self.images = {}
+        # (bestandspad, uitsnede, schaal, spiegelen, alpha) -> surface
+        self.variants = {}
+        # (bestandspad, aantal frames, framegrootte, schaal, spiegelen) -> tuple met frames
+        self.frame_sequences = {}
+        self.disk_load_count = 0
+
+    def load_image(self, file_path, has_alpha=None):
+        """
+        Geeft de originele afbeelding terug. has_alpha=None kijkt zelf of de afbeelding
+        doorzichtige pixels heeft, False forceert een ondoorzichtige afbeelding.
+        Gooit pygame.error als het bestand niet geladen kan worden.
+        """
+        cache_key = (file_path, has_alpha)
+        cached_entry = self.images.get(cache_key)
+        display_available = pygame.display.get_surface() is not None
+
+        if cached_entry is not None:
+            image_surface, is_converted = cached_entry
+            if is_converted or not display_available:
+                return image_surface
+            # de afbeelding is geladen voordat er een scherm was, zet hem nu alsnog om
+            # en gooi de varianten weg die nog uit de niet-omgezette versie gemaakt zijn
+            self._forget_variants(file_path)
+        else:
+            try:
+                image_surface = pygame.image.load(file_path)
+            except FileNotFoundError as error_message:
+                raise pygame.error(str(error_message))
+            self.disk_load_count += 1
+
+        if display_available:
+            image_surface = self._convert_to_display_format(image_surface, has_alpha)
+        self.images[cache_key] = (image_surface, display_available)
+        return image_surface
+
+    def get_image(self, file_path, scale_size=None, flip_horizontal=False, source_rectangle=None, has_alpha=None):
+        """
+        Geeft een variant van een afbeelding terug: eerst uitgeknipt (source_rectangle),
+        dan geschaald naar scale_size en eventueel horizontaal gespiegeld.
+        """
+        source_key = tuple(source_rectangle) if source_rectangle is not None else None
+        scale_key = tuple(scale_size) if scale_size is not None else None
+        variant_key = (file_path, source_key, scale_key, flip_horizontal, has_alpha)
+
+        image_surface = self.load_image(file_path, has_alpha)
+        if source_key is None and scale_key is None and not flip_horizontal:
+            return image_surface
+
+        variant_surface = self.variants.get(variant_key)
+        if variant_surface is None:
+            variant_surface = image_surface
+            if source_key is not None:
+                # uitknippen op een doorzichtige surface, zodat lege randen doorzichtig blijven
+                variant_surface = pygame.Surface(source_key[2:], pygame.SRCALPHA)
+                variant_surface.blit(image_surface, (0, 0), source_key)
+            if scale_key is not None:
+                variant_surface = pygame.transform.scale(variant_surface, scale_key)
+            if flip_horizontal:
+                variant_surface = pygame.transform.flip(variant_surface, True, False)
+            self.variants[variant_key] = variant_surface
+        return variant_surface
+
+    def get_frames(self, file_path, frame_count, frame_size, scale_size=None, flip_horizontal=False):
+        """
+        Knipt een horizontale spritesheet op in frame_count vierkante frames van frame_size pixels
+        en geeft ze (geschaald en/of gespiegeld) als tuple terug.
+        """
+        scale_key = tuple(scale_size) if scale_size is not None else None
+        sequence_key = (file_path, frame_count, frame_size, scale_key, flip_horizontal)
+        # laadt (of zet alsnog om) de sheet, oude frames worden dan vanzelf weggegooid
+        self.load_image(file_path)
+        frame_sequence = self.frame_sequences.get(sequence_key)
+        if frame_sequence is None:
+            frame_sequence = tuple(
+                self.get_image(
+                    file_path,
+                    scale_size=scale_key,
+                    flip_horizontal=flip_horizontal,
+                    source_rectangle=(frame_index * frame_size, 0, frame_size, frame_size),
+                )
+                for frame_index in range(frame_count)
+            )
+            self.frame_sequences[sequence_key] = frame_sequence
+        return frame_sequence
+
+    def clear(self):
+        """Gooit alle geladen afbeeldingen en varianten weg."""
+        self.images.clear()
+        self.variants.clear()
+        self.frame_sequences.clear()
+
+    def _forget_variants(self, file_path):
+        """Gooit alle varianten van een bestand weg."""
+        for variant_key in [variant_key for variant_key in self.variants if variant_key[0] == file_path]:
+            del self.variants[variant_key]
+        for sequence_key in [sequence_key for sequence_key in self.frame_sequences if sequence_key[0] == file_path]:
+            del self.frame_sequences[sequence_key]
+
+    @staticmethod
+    def _convert_to_display_format(image_surface, has_alpha):
+        """Zet een afbeelding om naar het schermformaat, met alpha alleen als dat nodig is."""
+        if has_alpha is None:
+            has_alpha = image_surface.get_masks()[3] != 0 and int(numpy.min(pygame.surfarray.pixels_alpha(image_surface))) < 255
+        return image_surface.convert_alpha() if has_alpha else image_surface.convert()
+
+
+# De gedeelde cache die door de hele game gebruikt wordt
+asset_cache = AssetCache()
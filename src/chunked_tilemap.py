@@ -0,0 +1,453 @@
+"""src/chunked_tilemap.py"""
+import argparse
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+import pygame
+
+from src.interactable_index import (
+    INTERACTABLE_TILE_TYPES, InteractableObject, find_nearest_interactable, group_interactable_tiles
+)
+from src.pathfinding import NavGrid
+from src.tilemap import BLOCKING_TILE_TYPES, TILE_CHUNK_SIZE, Tilemap
+
+# Naam van het bestand met de gegevens van een opgedeelde map
+MANIFEST_FILE_NAME = "manifest.json"
+
+# Standaard aantal tegels per kant van een opgeslagen regio
+DEFAULT_REGION_SIZE = 32
+
+
+class MapRegion:
+    """
+    Een los opgeslagen stuk van een grote map, met alle lagen en
+    een plat grid van blokkerende tegels voor collision queries.
+    """
+
+    def __init__(self, region_column: int, region_row: int, region_width: int, region_height: int,
+                 layers: Dict[str, List[List[int]]]) -> None:
+        self.region_column = region_column
+        self.region_row = region_row
+        self.region_width = region_width
+        self.region_height = region_height
+        self.layers = layers
+        self.blocking_tiles = bytearray(region_width * region_height)
+        self.update_blocking_tiles()
+
+    def update_blocking_tiles(self) -> None:
+        """Vult het blokkerende grid opnieuw uit de collision-laag."""
+        collision_rows = self.layers.get("collision", [])
+        for row_offset, row in enumerate(collision_rows):
+            for column_offset, tile_type in enumerate(row):
+                self.blocking_tiles[row_offset * self.region_width + column_offset] = 1 if tile_type in BLOCKING_TILE_TYPES else 0
+
+
+class ChunkedTilemap(Tilemap):
+    """
+    Tilemap voor grote werelden die in regio's op schijf staat (een manifest plus een bestand per regio).
+    Regio's worden pas geladen als ze nodig zijn en de minst recent gebruikte worden weer
+    weggegooid als er meer dan maximum_loaded_regions in het geheugen staan.
+    Collision, get_tile en get_nearest_interactable werken gewoon over de grenzen van regio's heen.
+    """
+
+    def __init__(self, tile_size: int = 48, maximum_loaded_regions: int = 64) -> None:
+        super().__init__(tile_size=tile_size)
+        self.maximum_loaded_regions = max(1, maximum_loaded_regions)
+
+        self.map_directory: str = ""
+        self.region_size: int = DEFAULT_REGION_SIZE
+        self.region_column_count: int = 0
+        self.region_row_count: int = 0
+        # regio's die geen bestand hebben zijn helemaal leeg
+        self.stored_region_keys = set()
+
+        # geladen regio's, de minst recent gebruikte staat vooraan
+        self.loaded_regions: "OrderedDict[Tuple[int, int], MapRegion]" = OrderedDict()
+        # veranderde tegels per regio, (laag, rij, kolom) binnen de regio -> tegel.
+        # Zo kan ook een veranderde regio weggegooid worden: bij het opnieuw laden komen de veranderingen er weer overheen
+        self.tile_overrides: Dict[Tuple[int, int], Dict[Tuple[str, int, int], int]] = {}
+        self.region_load_count = 0
+        # stream_around waarschuwt maar een keer als de straal niet in het budget past
+        self.has_warned_about_stream_radius = False
+
+    def load_from_file(self, file_path: str) -> None:
+        """
+        Laadt het manifest van een opgedeelde map (het bestand zelf of de map waarin het staat).
+        De regio's zelf worden pas geladen als ze nodig zijn.
+        """
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, MANIFEST_FILE_NAME)
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as file_handle:
+                manifest = json.load(file_handle)
+
+            self.map_directory = os.path.dirname(file_path)
+            self.load_manifest(manifest)
+            print(f"Map manifest succesvol geladen: {file_path}")
+
+        except Exception as error_message:
+            print(f"Fout opgetreden bij het laden van de map: {error_message}")
+
+    def load_manifest(self, manifest: Dict) -> None:
+        """Neemt de afmetingen en de lijst met regio's over uit een ingelezen manifest."""
+        self.map_width = manifest["map_width"]
+        self.map_height = manifest["map_height"]
+        self.region_size = manifest["region_size"]
+        self.region_column_count = (self.map_width + self.region_size - 1) // self.region_size
+        self.region_row_count = (self.map_height + self.region_size - 1) // self.region_size
+        self.stored_region_keys = {tuple(region_key) for region_key in manifest["regions"]}
+
+        # de lagen zelf staan in de regio's, hier alleen de namen zodat draw_layer ze kent
+        self.layers = {layer_name: [] for layer_name in manifest["layer_names"]}
+        self.walls = []
+        self.blocking_tiles = bytearray()
+        self.navigation_grid = None
+        self.layer_chunk_surfaces = {}
+        self.loaded_regions.clear()
+        self.tile_overrides.clear()
+
+    def _get_region(self, region_column: int, region_row: int) -> MapRegion:
+        """Geeft een regio terug en laadt hem als dat nog niet gebeurd is."""
+        region_key = (region_column, region_row)
+        region = self.loaded_regions.get(region_key)
+        if region is not None:
+            self.loaded_regions.move_to_end(region_key)
+            return region
+
+        region = self._load_region(region_column, region_row)
+        self.loaded_regions[region_key] = region
+        self._evict_regions()
+        return region
+
+    def _load_region(self, region_column: int, region_row: int) -> MapRegion:
+        """Leest een regio van schijf, of maakt een lege regio als er geen bestand voor is."""
+        region_width = min(self.region_size, self.map_width - region_column * self.region_size)
+        region_height = min(self.region_size, self.map_height - region_row * self.region_size)
+        self.region_load_count += 1
+
+        if (region_column, region_row) in self.stored_region_keys:
+            region_path = os.path.join(self.map_directory, region_file_name(region_column, region_row))
+            with open(region_path, "r", encoding="utf-8") as file_handle:
+                layers = json.load(file_handle)["layers"]
+        else:
+            layers = {}
+
+        for layer_name in self.layers:
+            if layer_name not in layers:
+                layers[layer_name] = [[0] * region_width for _ in range(region_height)]
+
+        for (layer_name, row_offset, column_offset), tile_type in self.tile_overrides.get((region_column, region_row), {}).items():
+            layers[layer_name][row_offset][column_offset] = tile_type
+
+        return MapRegion(region_column, region_row, region_width, region_height, layers)
+
+    def _evict_regions(self) -> None:
+        """Gooit de minst recent gebruikte regio's weg tot het budget weer klopt."""
+        for region_key in list(self.loaded_regions):
+            if len(self.loaded_regions) <= self.maximum_loaded_regions:
+                break
+            del self.loaded_regions[region_key]
+            self._forget_baked_chunks(*region_key)
+
+    def _forget_baked_chunks(self, region_column: int, region_row: int) -> None:
+        """Gooit de gebakken tegel-chunks weg die over een weggegooide regio liggen."""
+        chunk_column_start = region_column * self.region_size // TILE_CHUNK_SIZE
+        chunk_column_end = ((region_column + 1) * self.region_size - 1) // TILE_CHUNK_SIZE
+        chunk_row_start = region_row * self.region_size // TILE_CHUNK_SIZE
+        chunk_row_end = ((region_row + 1) * self.region_size - 1) // TILE_CHUNK_SIZE
+
+        for layer_chunks in self.layer_chunk_surfaces.values():
+            for chunk_row in range(chunk_row_start, chunk_row_end + 1):
+                for chunk_column in range(chunk_column_start, chunk_column_end + 1):
+                    layer_chunks.pop((chunk_column, chunk_row), None)
+
+    def stream_around(self, world_coordinate_x, world_coordinate_y, radius_pixels):
+        """
+        Laadt alle regio's binnen een vierkant rond een punt (bijvoorbeeld de speler of de camera),
+        zodat er tijdens het spelen niet midden in een frame van schijf gelezen hoeft te worden.
+        Past het vierkant niet in maximum_loaded_regions, dan worden alleen de regio's het dichtst
+        bij het punt geladen; anders zou de laatste regio de eerste alweer wegduwen.
+        """
+        if self.map_width == 0 or self.map_height == 0:
+            return
+
+        region_pixel_size = self.region_size * self.tile_size
+        region_column_start = max(0, int((world_coordinate_x - radius_pixels) // region_pixel_size))
+        region_column_end = min(self.region_column_count - 1, int((world_coordinate_x + radius_pixels) // region_pixel_size))
+        region_row_start = max(0, int((world_coordinate_y - radius_pixels) // region_pixel_size))
+        region_row_end = min(self.region_row_count - 1, int((world_coordinate_y + radius_pixels) // region_pixel_size))
+
+        region_keys = [
+            (region_column, region_row)
+            for region_row in range(region_row_start, region_row_end + 1)
+            for region_column in range(region_column_start, region_column_end + 1)
+        ]
+        if len(region_keys) > self.maximum_loaded_regions:
+            if not self.has_warned_about_stream_radius:
+                print(f"Waarschuwing: straal van {radius_pixels} pixels heeft {len(region_keys)} regio's nodig, "
+                      f"maar er passen er maar {self.maximum_loaded_regions} in het geheugen")
+                self.has_warned_about_stream_radius = True
+
+            def get_distance_to_region(region_key):
+                region_center_x = (region_key[0] + 0.5) * region_pixel_size
+                region_center_y = (region_key[1] + 0.5) * region_pixel_size
+                return (region_center_x - world_coordinate_x) ** 2 + (region_center_y - world_coordinate_y) ** 2
+
+            region_keys = sorted(region_keys, key=get_distance_to_region)[:self.maximum_loaded_regions]
+            # de dichtstbijzijnde regio als laatste, dan is hij het meest recent gebruikt
+            region_keys.reverse()
+
+        for region_key in region_keys:
+            self._get_region(*region_key)
+
+    def get_tile_at(self, layer_name, column_index, row_index):
+        """
+        Geeft de tegelwaarde terug op een grid-positie (kolom, rij), of None buiten de map.
+        """
+        if layer_name not in self.layers:
+            return None
+        if not (0 <= row_index < self.map_height and 0 <= column_index < self.map_width):
+            return None
+
+        region = self._get_region(column_index // self.region_size, row_index // self.region_size)
+        return region.layers[layer_name][row_index % self.region_size][column_index % self.region_size]
+
+    def set_tile(self, layer_name: str, column_index: int, row_index: int, tile_type: int) -> None:
+        """
+        Verandert een tegel in een laag. De verandering wordt ook in tile_overrides bewaard,
+        zodat de regio gewoon weggegooid en later opnieuw geladen kan worden.
+        Bij de collision-laag worden alleen de tegels rond deze tegel in het navigatie-grid bijgewerkt.
+        """
+        if layer_name not in self.layers:
+            return
+        if not (0 <= row_index < self.map_height and 0 <= column_index < self.map_width):
+            return
+
+        region_key = (column_index // self.region_size, row_index // self.region_size)
+        row_offset = row_index % self.region_size
+        column_offset = column_index % self.region_size
+        region = self._get_region(*region_key)
+        region.layers[layer_name][row_offset][column_offset] = tile_type
+        self.tile_overrides.setdefault(region_key, {})[(layer_name, row_offset, column_offset)] = tile_type
+
+        layer_chunks = self.layer_chunk_surfaces.get(layer_name)
+        if layer_chunks is not None:
+            layer_chunks.pop((column_index // TILE_CHUNK_SIZE, row_index // TILE_CHUNK_SIZE), None)
+        if layer_name == "collision":
+            region.update_blocking_tiles()
+            if self.navigation_grid is not None:
+                self.navigation_grid = self._patch_navigation_grid(self.navigation_grid, column_index, row_index)
+
+    def _patch_navigation_grid(self, navigation_grid: NavGrid, column_index: int, row_index: int) -> NavGrid:
+        """
+        Geeft een kopie van het navigatie-grid waarin alleen de vakjes rond een veranderde tegel
+        opnieuw bepaald zijn, zonder de rest van de map te laden.
+        Een tegel blokkeert ook het vakje rechts, onder en rechtsonder (de extra rand van NavGrid.from_tilemap),
+        dus een vakje is bezet als het zelf of zijn buur links, boven of linksboven blokkeert.
+        Het is een nieuw object zodat de HPA* en D* Lite pathfinders zien dat het grid veranderd is.
+        """
+        grid_width = navigation_grid.grid_width
+        blocked_tiles = bytearray(navigation_grid.blocked_tiles)
+
+        for grid_y in (row_index, row_index + 1):
+            for grid_x in (column_index, column_index + 1):
+                if grid_x >= grid_width or grid_y >= navigation_grid.grid_height:
+                    continue
+                is_blocked = (
+                    self.is_tile_blocking(grid_x, grid_y)
+                    or self.is_tile_blocking(grid_x - 1, grid_y)
+                    or self.is_tile_blocking(grid_x, grid_y - 1)
+                    or self.is_tile_blocking(grid_x - 1, grid_y - 1)
+                )
+                blocked_tiles[grid_y * grid_width + grid_x] = 1 if is_blocked else 0
+
+        return NavGrid(grid_width, navigation_grid.grid_height, navigation_grid.tile_size, blocked_tiles)
+
+    def is_tile_blocking(self, column_index: int, row_index: int) -> bool:
+        """
+        Geeft aan of de tegel op de gegeven grid-positie beweging blokkeert.
+        Tegels buiten de map blokkeren niet.
+        """
+        if 0 <= column_index < self.map_width and 0 <= row_index < self.map_height:
+            region = self._get_region(column_index // self.region_size, row_index // self.region_size)
+            region_index = (row_index % self.region_size) * region.region_width + column_index % self.region_size
+            return region.blocking_tiles[region_index] == 1
+        return False
+
+    def collides_with_rect(self, rectangle: pygame.Rect) -> bool:
+        """
+        Controleert of een hitbox een blokkerende tegel raakt, ook als hij over de grens van regio's valt.
+        """
+        if rectangle.width <= 0 or rectangle.height <= 0:
+            return False
+
+        column_start = max(0, rectangle.left // self.tile_size)
+        column_end = min(self.map_width - 1, (rectangle.right - 1) // self.tile_size)
+        row_start = max(0, rectangle.top // self.tile_size)
+        row_end = min(self.map_height - 1, (rectangle.bottom - 1) // self.tile_size)
+
+        for row_index in range(row_start, row_end + 1):
+            for column_index in range(column_start, column_end + 1):
+                if self.is_tile_blocking(column_index, row_index):
+                    return True
+        return False
+
+    def collides_with_rects(self, lefts, tops, widths, heights) -> numpy.ndarray:
+        """
+        Versie van collides_with_rect voor veel hitboxen tegelijk (numpy arrays met float posities).
+        Posities worden net als bij pygame.Rect naar nul afgerond.
+        """
+        collisions = numpy.zeros(len(lefts), dtype=bool)
+        for hitbox_index in range(len(lefts)):
+            collisions[hitbox_index] = self.collides_with_rect(pygame.Rect(
+                int(lefts[hitbox_index]), int(tops[hitbox_index]),
+                int(widths[hitbox_index]), int(heights[hitbox_index])
+            ))
+        return collisions
+
+    def get_navigation_grid(self) -> NavGrid:
+        """
+        Geeft het navigatie-grid voor de hele map terug. Het grid wordt regio voor regio
+        opgebouwd, zodat er nooit meer dan het budget aan regio's tegelijk geladen is.
+        """
+        if self.navigation_grid is not None:
+            return self.navigation_grid
+
+        grid_width = self.map_width
+        grid_height = self.map_height
+        navigation_grid = NavGrid(grid_width, grid_height, self.tile_size)
+        blocked_tiles = navigation_grid.blocked_tiles
+
+        for region_row in range(self.region_row_count):
+            for region_column in range(self.region_column_count):
+                region = self._get_region(region_column, region_row)
+                column_offset = region_column * self.region_size
+                row_offset = region_row * self.region_size
+
+                for region_index, is_blocking in enumerate(region.blocking_tiles):
+                    if not is_blocking:
+                        continue
+                    # zelfde extra rand rechts en onder als NavGrid.from_tilemap
+                    grid_x = column_offset + region_index % region.region_width
+                    grid_y = row_offset + region_index // region.region_width
+                    tile_index = grid_y * grid_width + grid_x
+                    blocked_tiles[tile_index] = 1
+                    if grid_x + 1 < grid_width:
+                        blocked_tiles[tile_index + 1] = 1
+                    if grid_y + 1 < grid_height:
+                        blocked_tiles[tile_index + grid_width] = 1
+                        if grid_x + 1 < grid_width:
+                            blocked_tiles[tile_index + grid_width + 1] = 1
+
+        self.navigation_grid = navigation_grid
+        return navigation_grid
+
+    def get_nearest_interactable(self, world_coordinate_x, world_coordinate_y, search_radius) -> Optional[InteractableObject]:
+        """
+        Geeft het dichtstbijzijnde interactieve object binnen een straal rondom een punt, of None.
+        Een index over de hele map zou alle regio's laden, daarom worden hier alleen de tegels
+        rond het punt bekeken en wordt elk gevonden object over de regio's heen samengevoegd.
+        """
+        grid_column_start = int((world_coordinate_x - search_radius) // self.tile_size)
+        grid_column_end = int((world_coordinate_x + search_radius) // self.tile_size)
+        grid_row_start = int((world_coordinate_y - search_radius) // self.tile_size)
+        grid_row_end = int((world_coordinate_y + search_radius) // self.tile_size)
+
+        def get_tile_type(row_index, column_index):
+            return self.get_tile_at("collision", column_index, row_index)
+
+        candidate_objects = []
+        visited_positions = set()
+        for row_index in range(grid_row_start, grid_row_end + 1):
+            for column_index in range(grid_column_start, grid_column_end + 1):
+                if (row_index, column_index) in visited_positions:
+                    continue
+                if get_tile_type(row_index, column_index) in INTERACTABLE_TILE_TYPES:
+                    candidate_objects.append(group_interactable_tiles(get_tile_type, row_index, column_index, visited_positions))
+
+        return find_nearest_interactable(candidate_objects, world_coordinate_x, world_coordinate_y, search_radius, self.tile_size)
+
+    def get_tile(self, layer_name, world_coordinate_x, world_coordinate_y):
+        """
+        Geeft de tegelwaarde terug op een specifieke pixelpositie in de wereld.
+        """
+        return self.get_tile_at(layer_name, int(world_coordinate_x // self.tile_size), int(world_coordinate_y // self.tile_size))
+
+
+def region_file_name(region_column: int, region_row: int) -> str:
+    """Bestandsnaam van een regio binnen de map van een opgedeelde map."""
+    return f"region_{region_column}_{region_row}.json"
+
+
+def load_tilemap(map_path: str, tile_size: int = 48) -> Tilemap:
+    """
+    Laadt een map: een map-directory of manifest wordt een ChunkedTilemap,
+    een gewoon JSON-bestand een Tilemap.
+    """
+    if os.path.isdir(map_path) or os.path.basename(map_path) == MANIFEST_FILE_NAME:
+        tilemap_instance = ChunkedTilemap(tile_size=tile_size)
+    else:
+        tilemap_instance = Tilemap(tile_size=tile_size)
+    tilemap_instance.load_from_file(map_path)
+    return tilemap_instance
+
+
+def convert_map_to_regions(map_file_path: str, output_directory: str, region_size: int = DEFAULT_REGION_SIZE) -> None:
+    """
+    Deelt een JSON-map op in regio's van region_size x region_size tegels.
+    Regio's waarin alleen lege tegels staan krijgen geen eigen bestand.
+    """
+    with open(map_file_path, "r", encoding="utf-8") as file_handle:
+        data = json.load(file_handle)
+
+    layers = {"collision": data["grid"], "background": []} if "grid" in data else data
+    collision_layer = layers.get("collision", [])
+    map_height = len(collision_layer)
+    map_width = len(collision_layer[0]) if collision_layer else 0
+
+    os.makedirs(output_directory, exist_ok=True)
+    stored_regions = []
+    for row_start in range(0, map_height, region_size):
+        for column_start in range(0, map_width, region_size):
+            region_layers = {}
+            for layer_name, layer_rows in layers.items():
+                region_rows = [row[column_start:column_start + region_size] for row in layer_rows[row_start:row_start + region_size]]
+                if any(any(row) for row in region_rows):
+                    region_layers[layer_name] = region_rows
+
+            if not region_layers:
+                continue
+
+            region_key = (column_start // region_size, row_start // region_size)
+            with open(os.path.join(output_directory, region_file_name(*region_key)), "w", encoding="utf-8") as file_handle:
+                json.dump({"layers": region_layers}, file_handle)
+            stored_regions.append(list(region_key))
+
+    manifest = {
+        "map_width": map_width,
+        "map_height": map_height,
+        "region_size": region_size,
+        "layer_names": list(layers),
+        "regions": stored_regions,
+    }
+    with open(os.path.join(output_directory, MANIFEST_FILE_NAME), "w", encoding="utf-8") as file_handle:
+        json.dump(manifest, file_handle)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Deelt een JSON-map op in regio's voor de ChunkedTilemap.")
+    argument_parser.add_argument("map_file", help="de JSON-map die opgedeeld moet worden")
+    argument_parser.add_argument("output_directory", help="map waarin het manifest en de regio's komen")
+    argument_parser.add_argument("--region-size", type=int, default=DEFAULT_REGION_SIZE, help="tegels per kant van een regio")
+    arguments = argument_parser.parse_args()
+
+    convert_map_to_regions(arguments.map_file, arguments.output_directory, arguments.region_size)
+    print(f"Map opgedeeld in regio's: {arguments.output_directory}")
+
+
+if __name__ == "__main__":
+    main()
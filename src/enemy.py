@@ -1,11 +1,98 @@
 import pygame
 import math
-import random
 from src.colors import *
-from .pathfinding import a_star
+from .game_random import visual_random
+from .pathfinding import find_path
+from .incremental_pathfinding import DStarLitePlanner
+from .profiler import profile_section
 
 # src/enemy.py
 
+# Tekens waaruit het glitch effect van de vijanden bestaat
+GLITCH_CHARACTERS = ["0", "1", "{", "}", ";", "==", "!=", "&&", "||", "=>", "NULL", "ptr"]
+
+# Hoeveel voorgerenderde glitch frames er per (grootte, kleur) worden gemaakt
+GLITCH_FRAME_POOL_SIZE = 16
+
+# Kleur van het glitch effect per staat, alles wat niet in de lijst staat is grijs (idle)
+GLITCH_STATE_COLORS = {
+    "attack": ORANGE,
+    "chase": RED,
+    "recover": PURPLE,
+}
+
+# Gedeelde caches zodat het font systeem maar een keer wordt aangesproken
+_glitch_font = None
+_glitch_glyph_cache = {}
+_glitch_frame_pools = {}
+
+
+def _get_glitch_font():
+    """Maakt het Courier font een keer aan, pas als er voor het eerst getekend wordt."""
+    global _glitch_font
+    if _glitch_font is None:
+        _glitch_font = pygame.font.SysFont("Courier", 20, bold=True)
+    return _glitch_font
+
+
+def _get_glitch_glyph(character, color):
+    """Geeft een gerenderd teken terug, elk (teken, kleur) paar wordt maar een keer gerenderd."""
+    cache_key = (character, color)
+    glyph_surface = _glitch_glyph_cache.get(cache_key)
+    if glyph_surface is None:
+        glyph_surface = _get_glitch_font().render(character, True, color)
+        _glitch_glyph_cache[cache_key] = glyph_surface
+    return glyph_surface
+
+
+def get_glitch_frames(size_width, size_height, base_color):
+    """
+    Geeft een pool met voorgerenderde glitch frames terug voor een vijand van deze grootte en kleur.
+    Elk frame bevat al de gloed, de willekeurige tekens en soms een glitch-lijn,
+    zodat tekenen maar een blit per vijand kost.
+    Net als toen alles direct op het scherm werd getekend mogen tekens en de lijn buiten
+    de vijand uitsteken, daarom is het frame rechts en onder groter dan de vijand zelf.
+    """
+    cache_key = (size_width, size_height, base_color)
+    frame_pool = _glitch_frame_pools.get(cache_key)
+    if frame_pool is not None:
+        return frame_pool
+
+    # ruimte voor het breedste en hoogste teken op de laatste positie, en de lijn die een pixel verder loopt
+    glyph_sizes = [_get_glitch_glyph(character, base_color).get_size() for character in GLITCH_CHARACTERS]
+    frame_width = max(size_width + 1, size_width - 15 + max(glyph_width for glyph_width, _ in glyph_sizes))
+    frame_height = max(size_height + 1, size_height - 15 + max(glyph_height for _, glyph_height in glyph_sizes))
+
+    frame_pool = []
+    for _ in range(GLITCH_FRAME_POOL_SIZE):
+        # Een subtiele achtergrond gloed alleen over de vijand zelf, 40 is de transparantie
+        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+        frame_surface.fill((*base_color, 40), (0, 0, size_width, size_height))
+
+        # Willekeurige karakters binnen het gebied van de vijand
+        for _ in range(visual_random.randint(5, 8)):
+            character = visual_random.choice(GLITCH_CHARACTERS)
+            random_offset_x = visual_random.randint(0, size_width - 15)
+            random_offset_y = visual_random.randint(0, size_height - 15)
+            frame_surface.blit(_get_glitch_glyph(character, base_color), (random_offset_x, random_offset_y))
+
+        # Af en toe een horizontale glitch-lijn
+        if visual_random.random() < 0.3:
+            line_y = visual_random.randint(0, size_height)
+            pygame.draw.line(frame_surface, WHITE, (0, line_y), (size_width, line_y), 1)
+
+        frame_pool.append(frame_surface)
+
+    _glitch_frame_pools[cache_key] = frame_pool
+    return frame_pool
+
+
+def prepare_glitch_frames(size_width, size_height):
+    """Bouwt de frame pools voor alle staten vooraf, zodat de eerste frames niet haperen."""
+    for base_color in (GRAY, *GLITCH_STATE_COLORS.values()):
+        get_glitch_frames(size_width, size_height, base_color)
+
+
 class Enemy:
     """
     Basis klasse voor alle vijanden in het spel.
@@ -24,15 +111,17 @@ class Enemy:
         # Deze moeten door subklassen worden ingesteld
         self.size_width = 0
         self.size_height = 0
-
-        # Initialisatie van font voor het glitch effect
-        self.glitch_font = pygame.font.SysFont("Courier", 20, bold=True)
-        self.glitch_characters = ["0", "1", "{", "}", ";", "==", "!=", "&&", "||", "=>", "NULL", "ptr"]
         
-    def separate_from_other_enemies(self, all_enemies, separation_distance=80):
+    def separate_from_other_enemies(self, all_enemies, separation_distance=80, spatial_hash=None):
         """
         Zorgt ervoor dat vijanden elkaar niet overlappen door een afstotende kracht.
+        Met een SpatialHash worden alleen de vijanden in de buurt bekeken.
         """
+        if spatial_hash is not None:
+            all_enemies = spatial_hash.query_radius(
+                self.position_coordinate_x, self.position_coordinate_y, separation_distance
+            )
+
         steer_coordinate_x = 0
         steer_coordinate_y = 0
         for other_enemy in all_enemies:
@@ -56,41 +145,11 @@ class Enemy:
         """
         Tekent de vijand als een verzameling glitchy programmeercodes.
         De kleur verandert op basis van de huidige staat van de vijand.
+        Elke frame wordt een willekeurig voorgerenderd glitch frame gekozen.
         """
-        base_color = {
-            "attack": ORANGE,
-            "chase": RED,
-            "recover": PURPLE,
-        }.get(self.current_state, GRAY)
-
-        # Teken een subtiele achtergrond gloed
-        glitch_rect = pygame.Rect(screen_x, screen_y, self.size_width, self.size_height)
-        subtle_surface = pygame.Surface((self.size_width, self.size_height), pygame.SRCALPHA)
-        subtle_surface.fill((*base_color, 40)) # 40 is de transparantie
-        screen.blit(subtle_surface, glitch_rect)
-
-        # Teken willekeurige karakters binnen het gebied van de vijand
-        for _ in range(random.randint(5, 8)):
-            character = random.choice(self.glitch_characters)
-            
-            # Willekeurige positie binnen de bounding box
-            random_offset_x = random.randint(0, self.size_width - 15)
-            random_offset_y = random.randint(0, self.size_height - 15)
-            
-            # Rendert de tekst
-            text_surface = self.glitch_font.render(character, True, base_color)
-            screen.blit(text_surface, (screen_x + random_offset_x, screen_y + random_offset_y))
-
-        # Voeg af en toe een horizontale glitch-lijn toe
-        if random.random() < 0.3:
-            line_y = random.randint(0, self.size_height)
-            pygame.draw.line(
-                screen, 
-                WHITE, 
-                (screen_x, screen_y + line_y), 
-                (screen_x + self.size_width, screen_y + line_y), 
-                1
-            )
+        base_color = GLITCH_STATE_COLORS.get(self.current_state, GRAY)
+        frame_pool = get_glitch_frames(self.size_width, self.size_height, base_color)
+        screen.blit(visual_random.choice(frame_pool), (screen_x, screen_y))
     
     def find_player(self, player_position):
         """
@@ -109,6 +168,7 @@ class Enemy:
     def move(self, direction_x, direction_y, speed, walls):
         """
         Beweeg de vijand in een bepaalde richting met muur-detectie.
+        walls mag een Tilemap zijn (snelle tegel-query) of een lijst met rects.
         """
         distance = math.hypot(direction_x, direction_y)
 
@@ -134,6 +194,9 @@ class Enemy:
             self.size_width,
             self.size_height
         )
+        # Een Tilemap test alleen de tegels onder de hitbox in plaats van elke muur
+        if hasattr(walls, "collides_with_rect"):
+            return walls.collides_with_rect(enemy_rectangle)
         for wall in walls:
             if enemy_rectangle.colliderect(wall):
                 return True
@@ -161,16 +224,32 @@ class Dog(Enemy):
         self.path_recalculation_timer = 0
         self.path_recalculation_interval = 30  
 
+        # "a_star": eigen pad per hond, "flow_field": gedeeld stromingsveld richting de speler,
+        # "hierarchical": HPA* over de clusters van de map, alleen het volgende stuk wordt uitgewerkt,
+        # "jump_point": eigen pad per hond met Jump Point Search (hetzelfde soort pad als "a_star"),
+        # "incremental": eigen D* Lite planner per hond die zijn zoekwerk bewaart en alleen herstelt
+        self.pathfinding_mode = "a_star"
+        # de D* Lite planner van deze hond, wordt pas gemaakt bij de eerste zoektocht
+        self.incremental_planner = None
+
+        # optionele PathRequestService: dan wordt het A* pad op een worker thread gezocht
+        # en loopt de hond over zijn oude pad tot het nieuwe binnen is
+        self.path_service = None
+
         # Aanval instellingen
         self.attack_duration_timer = 0
         self.maximum_attack_duration = 20
         self.recovery_timer = 0
         self.maximum_recovery_time = 90
 
-    def update(self, player_position, walls, tile_size=48):
+    def update(self, player_position, walls, tile_size=48, flow_field=None):
         """
         Hoofd-update van de vijand-logica per frame.
+        Met pathfinding_mode "flow_field" en een gedeeld FlowField wordt er geen eigen pad berekend.
         """
+        if self.pathfinding_mode != "flow_field":
+            flow_field = None
+
         distance_to_player, difference_x, difference_y = self.find_player(player_position)
         
         self.path_recalculation_timer -= 1
@@ -178,21 +257,8 @@ class Dog(Enemy):
         self._update_state_logic(distance_to_player)
         
         # Bereken pad indien nodig
-        if self.current_state in ("chase", "attack"):
-            if (self.path_recalculation_timer <= 0 or 
-                not self.current_path or 
-                self._has_reached_target()):
-                
-                new_path = a_star(
-                    start_pos=(self.position_coordinate_x + self.size_width // 2, 
-                               self.position_coordinate_y + self.size_height // 2),
-                    goal_pos=(player_position[0] + 24, player_position[1] + 46),
-                    walls=walls,
-                    tile_size=tile_size
-                )
-                self.current_path = new_path or []
-                self.path_recalculation_timer = self.path_recalculation_interval
-                self.current_target_node = self.current_path[0] if self.current_path else None
+        if self.current_state in ("chase", "attack") and flow_field is None:
+            self._recalculate_path_if_needed(player_position, walls, tile_size)
 
         # Gedrag per staat
         if self.current_state == "idle":
@@ -202,7 +268,81 @@ class Dog(Enemy):
         elif self.current_state == "attack":
             self._handle_attack_logic(difference_x, difference_y, walls)
         else: # chase
-            self._follow_calculated_path(walls)
+            self._follow_calculated_path(walls, flow_field)
+
+    def _recalculate_path_if_needed(self, player_position, walls, tile_size=48):
+        """Berekent een nieuw A* pad als de timer is afgelopen of het huidige pad op is."""
+        # neem een pad over dat de path service inmiddels heeft afgeleverd
+        if self.path_service is not None and self.path_service.has_result(self):
+            self.current_path = self.path_service.take_result(self) or []
+            self.current_target_node = self.current_path[0] if self.current_path else None
+
+        if not (self.path_recalculation_timer <= 0 or 
+                not self.current_path or 
+                self._has_reached_target()):
+            return
+
+        # Een Tilemap levert een kant-en-klaar navigatie-grid, dan hoeven de muren niet opnieuw
+        if hasattr(walls, "get_navigation_grid"):
+            pathfinding_walls = walls.get_navigation_grid()
+        else:
+            pathfinding_walls = walls
+
+        if self.pathfinding_mode == "hierarchical" and hasattr(walls, "get_hierarchical_pathfinder"):
+            with profile_section("a_star"):
+                new_path = walls.get_hierarchical_pathfinder().find_path(
+                    (self.position_coordinate_x + self.size_width // 2, self.position_coordinate_y + self.size_height // 2),
+                    (player_position[0] + 24, player_position[1] + 46)
+                )
+            self.current_path = new_path or []
+            self.path_recalculation_timer = self.path_recalculation_interval
+            self.current_target_node = self.current_path[0] if self.current_path else None
+            return
+
+        if self.pathfinding_mode == "incremental" and pathfinding_walls is not walls:
+            if self.incremental_planner is None:
+                self.incremental_planner = DStarLitePlanner(pathfinding_walls)
+            with profile_section("a_star"):
+                new_path = self.incremental_planner.find_path(
+                    (self.position_coordinate_x + self.size_width // 2, self.position_coordinate_y + self.size_height // 2),
+                    (player_position[0] + 24, player_position[1] + 46),
+                    pathfinding_walls
+                )
+            self.current_path = new_path or []
+            self.path_recalculation_timer = self.path_recalculation_interval
+            self.current_target_node = self.current_path[0] if self.current_path else None
+            return
+
+        if self.path_service is not None and pathfinding_walls is not walls:
+            # wacht op de lopende zoektocht, tenzij de timer om is en het doel dus verouderd
+            if self.path_service.has_pending_request(self) and self.path_recalculation_timer > 0:
+                return
+            self.path_service.request_path(
+                self,
+                (self.position_coordinate_x + self.size_width // 2, self.position_coordinate_y + self.size_height // 2),
+                (player_position[0] + 24, player_position[1] + 46),
+                pathfinding_walls,
+                algorithm=self._get_search_algorithm()
+            )
+            self.path_recalculation_timer = self.path_recalculation_interval
+            return
+
+        with profile_section("a_star"):
+            new_path = find_path(
+                start_pos=(self.position_coordinate_x + self.size_width // 2, 
+                           self.position_coordinate_y + self.size_height // 2),
+                goal_pos=(player_position[0] + 24, player_position[1] + 46),
+                walls=pathfinding_walls,
+                tile_size=tile_size,
+                algorithm=self._get_search_algorithm()
+            )
+        self.current_path = new_path or []
+        self.path_recalculation_timer = self.path_recalculation_interval
+        self.current_target_node = self.current_path[0] if self.current_path else None
+
+    def _get_search_algorithm(self):
+        """Het zoekalgoritme voor een eigen pad: Jump Point Search of de gewone A*."""
+        return "jump_point" if self.pathfinding_mode == "jump_point" else "a_star"
 
     def _update_state_logic(self, distance):
         """Bepaalt de huidige staat op basis van de afstand tot de speler."""
@@ -221,8 +361,24 @@ class Dog(Enemy):
         else:
             self.current_state = "idle"
 
-    def _follow_calculated_path(self, walls):
-        """Beweegt de vijand langs de knooppunten van het A* pad."""
+    def _follow_calculated_path(self, walls, flow_field=None):
+        """
+        Beweegt de vijand langs de knooppunten van het A* pad,
+        of naar de volgende tegel uit het gedeelde stromingsveld.
+        """
+        if flow_field is not None:
+            self.current_target_node = flow_field.get_next_waypoint(
+                self.position_coordinate_x + self.size_width // 2,
+                self.position_coordinate_y + self.size_height // 2
+            )
+            if not self.current_target_node:
+                return
+            target_x, target_y = self.current_target_node
+            direction_x = target_x - (self.position_coordinate_x + self.size_width // 2)
+            direction_y = target_y - (self.position_coordinate_y + self.size_height // 2)
+            self.move(direction_x, direction_y, self.movement_speed, walls)
+            return
+
         if not self.current_target_node:
             return
 
@@ -0,0 +1,261 @@
+# src/enemy_swarm.py
+import numpy
+
+from src.enemy import Dog
+
+# Staten als getallen, zodat ze in een numpy array passen
+STATE_IDLE = 0
+STATE_CHASE = 1
+STATE_ATTACK = 2
+STATE_RECOVER = 3
+STATE_NAMES = ("idle", "chase", "attack", "recover")
+STATE_CODES = {state_name: state_code for state_code, state_name in enumerate(STATE_NAMES)}
+
+# Alle velden van een hond die in de swarm als array worden opgeslagen, met hun type
+SWARM_FIELD_TYPES = {
+    "position_coordinate_x": numpy.float64,
+    "position_coordinate_y": numpy.float64,
+    "size_width": numpy.int64,
+    "size_height": numpy.int64,
+    "movement_speed": numpy.float64,
+    "player_detection_range": numpy.float64,
+    "attack_range": numpy.float64,
+    "attack_duration_timer": numpy.int64,
+    "maximum_attack_duration": numpy.int64,
+    "recovery_timer": numpy.int64,
+    "maximum_recovery_time": numpy.int64,
+    "path_recalculation_timer": numpy.int64,
+    "state_code": numpy.int8,
+    "uses_flow_field": numpy.bool_,
+}
+
+
+class _SwarmField:
+    """Descriptor die een attribuut van een SwarmDog naar zijn plek in de swarm arrays doorstuurt."""
+
+    def __init__(self, field_name):
+        self.field_name = field_name
+
+    def __get__(self, swarm_dog, owner):
+        if swarm_dog is None:
+            return self
+        return swarm_dog.enemy_swarm.arrays[self.field_name][swarm_dog.swarm_index].item()
+
+    def __set__(self, swarm_dog, value):
+        swarm_dog.enemy_swarm.arrays[self.field_name][swarm_dog.swarm_index] = value
+
+
+class SwarmDog(Dog):
+    """
+    Een hond waarvan de positie, staat en timers in de arrays van een EnemySwarm staan.
+    Gedraagt zich verder als een gewone Dog, zodat tekenen, diepte sorteren,
+    afstoten en het A* pad per hond gewoon blijven werken.
+    """
+
+    position_coordinate_x = _SwarmField("position_coordinate_x")
+    position_coordinate_y = _SwarmField("position_coordinate_y")
+    size_width = _SwarmField("size_width")
+    size_height = _SwarmField("size_height")
+    movement_speed = _SwarmField("movement_speed")
+    player_detection_range = _SwarmField("player_detection_range")
+    attack_range = _SwarmField("attack_range")
+    attack_duration_timer = _SwarmField("attack_duration_timer")
+    maximum_attack_duration = _SwarmField("maximum_attack_duration")
+    recovery_timer = _SwarmField("recovery_timer")
+    maximum_recovery_time = _SwarmField("maximum_recovery_time")
+    path_recalculation_timer = _SwarmField("path_recalculation_timer")
+
+    def __init__(self, enemy_swarm, swarm_index, start_coordinate_x, start_coordinate_y):
+        # de plek in de swarm moet bekend zijn voordat Dog de velden gaat zetten
+        self.enemy_swarm = enemy_swarm
+        self.swarm_index = swarm_index
+        super().__init__(start_coordinate_x, start_coordinate_y)
+
+    @property
+    def current_state(self):
+        return STATE_NAMES[self.enemy_swarm.arrays["state_code"][self.swarm_index]]
+
+    @current_state.setter
+    def current_state(self, state_name):
+        self.enemy_swarm.arrays["state_code"][self.swarm_index] = STATE_CODES[state_name]
+
+    @property
+    def pathfinding_mode(self):
+        return self.enemy_swarm.pathfinding_modes[self.swarm_index]
+
+    @pathfinding_mode.setter
+    def pathfinding_mode(self, mode_name):
+        self.enemy_swarm.pathfinding_modes[self.swarm_index] = mode_name
+        self.enemy_swarm.arrays["uses_flow_field"][self.swarm_index] = mode_name == "flow_field"
+
+
+class EnemySwarm:
+    """
+    Container die de gegevens van alle honden als numpy arrays opslaat (struct-of-arrays).
+    Staatwissels, lunges, hersteltijd en de afstand tot de speler worden voor alle
+    honden tegelijk uitgerekend. Alleen het A* pad per hond blijft per object.
+    """
+
+    def __init__(self, initial_capacity=64):
+        self.enemy_count = 0
+        self.capacity = max(1, initial_capacity)
+        self.arrays = {
+            field_name: numpy.zeros(self.capacity, dtype=field_type)
+            for field_name, field_type in SWARM_FIELD_TYPES.items()
+        }
+        self.pathfinding_modes = [None] * self.capacity
+        # de honden zelf, als view op hun plek in de arrays
+        self.views = []
+
+    def add_dog(self, start_coordinate_x, start_coordinate_y):
+        """Voegt een hond toe aan de swarm en geeft de view terug."""
+        if self.enemy_count == self.capacity:
+            self._grow()
+
+        swarm_dog = SwarmDog(self, self.enemy_count, start_coordinate_x, start_coordinate_y)
+        self.enemy_count += 1
+        self.views.append(swarm_dog)
+        return swarm_dog
+
+    def _grow(self):
+        """Verdubbelt de capaciteit van alle arrays."""
+        new_capacity = self.capacity * 2
+        for field_name, field_array in self.arrays.items():
+            grown_array = numpy.zeros(new_capacity, dtype=field_array.dtype)
+            grown_array[:self.capacity] = field_array
+            self.arrays[field_name] = grown_array
+        self.pathfinding_modes.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+    def update(self, player_position, walls, tile_size=48, flow_field=None):
+        """
+        Werkt alle honden in een keer bij, met dezelfde regels als Dog.update.
+        """
+        enemy_count = self.enemy_count
+        if enemy_count == 0:
+            return
+
+        arrays = {field_name: field_array[:enemy_count] for field_name, field_array in self.arrays.items()}
+        state_codes = arrays["state_code"]
+        attack_timers = arrays["attack_duration_timer"]
+        recovery_timers = arrays["recovery_timer"]
+
+        # afstand en richting tot de speler voor alle honden tegelijk
+        difference_x = player_position[0] - arrays["position_coordinate_x"]
+        difference_y = player_position[1] - arrays["position_coordinate_y"]
+        distance_to_player = numpy.hypot(difference_x, difference_y)
+
+        arrays["path_recalculation_timer"] -= 1
+
+        # staatlogica (zie Dog._update_state_logic)
+        is_attacking = attack_timers > 0
+        is_recovering = ~is_attacking & (recovery_timers > 0)
+        is_free = ~is_attacking & ~is_recovering
+        starts_attack = is_free & (distance_to_player < arrays["attack_range"])
+        is_chasing = is_free & ~starts_attack & (distance_to_player < arrays["player_detection_range"])
+        is_idle = is_free & ~starts_attack & ~is_chasing
+
+        state_codes[is_attacking | starts_attack] = STATE_ATTACK
+        state_codes[is_recovering] = STATE_RECOVER
+        state_codes[is_chasing] = STATE_CHASE
+        state_codes[is_idle] = STATE_IDLE
+        attack_timers[starts_attack] = arrays["maximum_attack_duration"][starts_attack]
+
+        # alleen honden zonder stromingsveld rekenen nog een eigen A* pad uit
+        if flow_field is not None:
+            follows_flow_field = arrays["uses_flow_field"].copy()
+        else:
+            follows_flow_field = numpy.zeros(enemy_count, dtype=bool)
+        is_pursuing = (state_codes == STATE_CHASE) | (state_codes == STATE_ATTACK)
+        for enemy_index in numpy.flatnonzero(is_pursuing & ~follows_flow_field):
+            self.views[enemy_index]._recalculate_path_if_needed(player_position, walls, tile_size)
+
+        # herstel: tel af
+        recovery_timers[state_codes == STATE_RECOVER] -= 1
+
+        # aanval: lunge richting de speler, daarna herstellen
+        attack_indices = numpy.flatnonzero(state_codes == STATE_ATTACK)
+        if len(attack_indices):
+            self._move_batch(
+                attack_indices,
+                difference_x[attack_indices],
+                difference_y[attack_indices],
+                arrays["movement_speed"][attack_indices] * 3,
+                walls
+            )
+            attack_timers[attack_indices] -= 1
+            finished_attack = attack_indices[attack_timers[attack_indices] <= 0]
+            recovery_timers[finished_attack] = arrays["maximum_recovery_time"][finished_attack]
+
+        # achtervolgen: via het stromingsveld in een keer, anders langs het eigen pad
+        is_chase_state = state_codes == STATE_CHASE
+        field_chase_indices = numpy.flatnonzero(is_chase_state & follows_flow_field)
+        if len(field_chase_indices):
+            self._follow_flow_field_batch(field_chase_indices, flow_field, walls)
+        for enemy_index in numpy.flatnonzero(is_chase_state & ~follows_flow_field):
+            self.views[enemy_index]._follow_calculated_path(walls)
+
+    def _follow_flow_field_batch(self, enemy_indices, flow_field, walls):
+        """Zoekt voor een groep honden de volgende tegel op in het stromingsveld en beweegt ze erheen."""
+        navigation_grid = flow_field.navigation_grid
+        grid_width = navigation_grid.grid_width
+        grid_height = navigation_grid.grid_height
+        tile_size = navigation_grid.tile_size
+
+        center_x = self.arrays["position_coordinate_x"][enemy_indices] + self.arrays["size_width"][enemy_indices] // 2
+        center_y = self.arrays["position_coordinate_y"][enemy_indices] + self.arrays["size_height"][enemy_indices] // 2
+        grid_x = numpy.floor_divide(center_x, tile_size).astype(numpy.int64)
+        grid_y = numpy.floor_divide(center_y, tile_size).astype(numpy.int64)
+
+        inside_grid = (grid_x >= 0) & (grid_x < grid_width) & (grid_y >= 0) & (grid_y < grid_height)
+        tile_indices = numpy.where(inside_grid, grid_y * grid_width + grid_x, 0)
+        next_tile_indices = numpy.frombuffer(flow_field.next_tile_indices, dtype=numpy.intc)[tile_indices]
+        has_waypoint = inside_grid & (next_tile_indices >= 0) & (tile_indices != flow_field.goal_index)
+        if not has_waypoint.any():
+            return
+
+        next_tile_indices = next_tile_indices[has_waypoint]
+        target_x = (next_tile_indices % grid_width) * tile_size + tile_size // 2
+        target_y = (next_tile_indices // grid_width) * tile_size + tile_size // 2
+        moving_indices = enemy_indices[has_waypoint]
+        self._move_batch(
+            moving_indices,
+            target_x - center_x[has_waypoint],
+            target_y - center_y[has_waypoint],
+            self.arrays["movement_speed"][moving_indices],
+            walls
+        )
+
+    def _move_batch(self, enemy_indices, direction_x, direction_y, speeds, walls):
+        """
+        Beweegt een groep honden zoals Enemy.move: eerst over x, dan over y,
+        en een as terugzetten als de hond daardoor in een muur staat.
+        """
+        if not hasattr(walls, "collides_with_rects"):
+            # zonder tilemap kan de muur-check niet gevectoriseerd worden
+            for list_index, enemy_index in enumerate(enemy_indices):
+                self.views[enemy_index].move(direction_x[list_index], direction_y[list_index], speeds[list_index], walls)
+            return
+
+        distance = numpy.hypot(direction_x, direction_y)
+        is_moving = distance > 0
+        enemy_indices = enemy_indices[is_moving]
+        move_x = direction_x[is_moving] / distance[is_moving] * speeds[is_moving]
+        move_y = direction_y[is_moving] / distance[is_moving] * speeds[is_moving]
+
+        position_x = self.arrays["position_coordinate_x"]
+        position_y = self.arrays["position_coordinate_y"]
+        size_width = self.arrays["size_width"]
+        size_height = self.arrays["size_height"]
+
+        for axis_position, axis_move in ((position_x, move_x), (position_y, move_y)):
+            has_axis_move = axis_move != 0
+            axis_indices = enemy_indices[has_axis_move]
+            axis_move = axis_move[has_axis_move]
+            axis_position[axis_indices] += axis_move
+
+            collides = walls.collides_with_rects(
+                position_x[axis_indices], position_y[axis_indices],
+                size_width[axis_indices], size_height[axis_indices]
+            )
+            axis_position[axis_indices[collides]] -= axis_move[collides]
@@ -0,0 +1,26 @@
+# src/fonts.py
+from functools import lru_cache
+
+import pygame
+
+# Gedeelde fonts per (naam, grootte), zodat er niet elke frame een nieuw font wordt gemaakt
+_font_registry = {}
+
+
+def get_font(font_size, font_name=None):
+    """Geeft een gedeeld pygame font terug, elk (naam, grootte) paar wordt maar een keer aangemaakt."""
+    registry_key = (font_name, font_size)
+    font_instance = _font_registry.get(registry_key)
+    if font_instance is None:
+        font_instance = pygame.font.Font(font_name, font_size)
+        _font_registry[registry_key] = font_instance
+    return font_instance
+
+
+@lru_cache(maxsize=512)
+def render_text(text, font_size, text_color, font_name=None):
+    """
+    Rendert een tekst (met anti-aliasing) en bewaart het resultaat per (tekst, grootte, kleur),
+    zodat vaste teksten maar een keer gerenderd worden. Het oppervlak is gedeeld, dus niet op tekenen.
+    """
+    return get_font(font_size, font_name).render(text, True, text_color)
@@ -0,0 +1,15 @@
+# src/game_random.py
+import random
+
+# Random bron voor alles wat de uitkomst van het spel bepaalt (vallende operators, banen, volgorde van de quiz).
+# Met dezelfde seed en dezelfde invoer speelt een opgenomen sessie precies hetzelfde af.
+gameplay_random = random.Random()
+
+# Random bron voor effecten die alleen het beeld veranderen (glitch frames, schuddende telefoon).
+# Deze mag per run verschillen zonder dat een replay uit de pas loopt.
+visual_random = random.Random()
+
+
+def seed_gameplay_random(random_seed):
+    """Zet de seed van de gameplay random bron, voor een opname of replay."""
+    gameplay_random.seed(random_seed)
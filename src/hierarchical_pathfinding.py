@@ -0,0 +1,430 @@
+# src/hierarchical_pathfinding.py
+import heapq
+
+import numpy
+
+from src.pathfinding import NEIGHBOR_DIRECTIONS
+
+# Kosten van een stap recht en diagonaal, gelijk aan die in NEIGHBOR_DIRECTIONS
+STRAIGHT_STEP_COST = 1.0
+DIAGONAL_STEP_COST = 1.4
+
+# Een doorgang langer dan dit aantal tegels krijgt twee knooppunten (aan beide uiteinden)
+LONG_ENTRANCE_LENGTH = 6
+
+
+def index_distance(index_a, index_b, grid_width):
+    """Manhattan afstand tussen twee platte tegel-indexen, dezelfde schatting als a_star gebruikt."""
+    return abs(index_a % grid_width - index_b % grid_width) + abs(index_a // grid_width - index_b // grid_width)
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* (hierarchische A*) op een NavGrid voor grote maps.
+    Het grid wordt verdeeld in clusters van cluster_size x cluster_size tegels. Op de grens tussen
+    twee clusters worden de doorgangen (entrances) een keer per map bepaald; die knooppunten vormen
+    samen een klein abstract graaf. Een lange zoektocht gaat over die graaf en alleen het eerste
+    stuk wordt uitgewerkt tot tegels. De afstanden binnen een cluster worden pas uitgerekend als de
+    zoektocht het cluster nodig heeft, en na een verandering van tegels worden alleen de geraakte
+    clusters opnieuw opgebouwd.
+    """
+
+    def __init__(self, navigation_grid, cluster_size=16):
+        self.navigation_grid = navigation_grid
+        self.cluster_size = cluster_size
+        self.cluster_columns = (navigation_grid.grid_width + cluster_size - 1) // cluster_size
+        self.cluster_rows = (navigation_grid.grid_height + cluster_size - 1) // cluster_size
+
+        # (cluster a, cluster b) -> lijst met (tegel in a, tegel in b, kosten) voor elke doorgang
+        self.border_entrances = {}
+        # cluster -> set met de tegels die als abstract knooppunt dienen
+        self.cluster_nodes = {}
+        # tegel -> {tegel in het buurcluster: kosten}
+        self.inter_edges = {}
+        # cluster -> {tegel: {tegel: kosten}}, wordt pas gevuld als het cluster nodig is
+        self.intra_edges = {}
+
+        self.abstract_search_count = 0
+        self.rebuilt_cluster_count = 0
+
+        for cluster_row in range(self.cluster_rows):
+            for cluster_column in range(self.cluster_columns):
+                self._build_cluster_borders((cluster_column, cluster_row))
+        self._rebuild_node_index()
+
+    def get_cluster(self, tile_index):
+        """Geeft het cluster (kolom, rij) terug waar een tegel in ligt."""
+        grid_width = self.navigation_grid.grid_width
+        return (tile_index % grid_width) // self.cluster_size, (tile_index // grid_width) // self.cluster_size
+
+    def get_cluster_bounds(self, cluster_key):
+        """Geeft (x start, y start, x eind, y eind) van een cluster terug, het eind telt niet mee."""
+        cluster_column, cluster_row = cluster_key
+        start_x = cluster_column * self.cluster_size
+        start_y = cluster_row * self.cluster_size
+        return (
+            start_x,
+            start_y,
+            min(start_x + self.cluster_size, self.navigation_grid.grid_width),
+            min(start_y + self.cluster_size, self.navigation_grid.grid_height),
+        )
+
+    def _build_cluster_borders(self, cluster_key):
+        """Bepaalt de doorgangen van een cluster naar zijn rechter-, onder- en diagonale buren."""
+        cluster_column, cluster_row = cluster_key
+        if cluster_column + 1 < self.cluster_columns:
+            self._build_border(cluster_key, (cluster_column + 1, cluster_row))
+        if cluster_row + 1 < self.cluster_rows:
+            self._build_border(cluster_key, (cluster_column, cluster_row + 1))
+        if cluster_column + 1 < self.cluster_columns and cluster_row + 1 < self.cluster_rows:
+            self._build_corner(cluster_key)
+
+    def _build_border(self, cluster_a, cluster_b):
+        """
+        Zoekt de doorgangen op de grens tussen twee buurclusters (b ligt rechts of onder a).
+        Elke aaneengesloten rij vrije tegelparen is een doorgang met een of twee knooppunten.
+        Een diagonale stap die alleen schuin over de grens kan krijgt een eigen doorgang.
+        """
+        grid_width = self.navigation_grid.grid_width
+        blocked_tiles = self.navigation_grid.blocked_tiles
+        start_x, start_y, end_x, end_y = self.get_cluster_bounds(cluster_a)
+
+        if cluster_b[0] != cluster_a[0]:
+            # verticale grens: tegel (x, y) in a naast (x + 1, y) in b
+            border_pairs = [((end_x - 1) + y * grid_width, end_x + y * grid_width) for y in range(start_y, end_y)]
+            pair_step = grid_width
+        else:
+            # horizontale grens: tegel (x, y) in a boven (x, y + 1) in b
+            border_pairs = [(x + (end_y - 1) * grid_width, x + end_y * grid_width) for x in range(start_x, end_x)]
+            pair_step = 1
+
+        is_open = [not blocked_tiles[tile_a] and not blocked_tiles[tile_b] for tile_a, tile_b in border_pairs]
+        entrances = []
+
+        pair_position = 0
+        while pair_position < len(border_pairs):
+            if not is_open[pair_position]:
+                pair_position += 1
+                continue
+            run_start = pair_position
+            while pair_position < len(border_pairs) and is_open[pair_position]:
+                pair_position += 1
+            run_end = pair_position - 1
+
+            if run_end - run_start + 1 >= LONG_ENTRANCE_LENGTH:
+                chosen_positions = (run_start, run_end)
+            else:
+                chosen_positions = ((run_start + run_end) // 2,)
+            for chosen_position in chosen_positions:
+                tile_a, tile_b = border_pairs[chosen_position]
+                entrances.append((tile_a, tile_b, STRAIGHT_STEP_COST))
+
+        # schuine stappen over de grens waar geen recht paar naast ligt
+        for pair_position in range(len(border_pairs) - 1):
+            if is_open[pair_position] or is_open[pair_position + 1]:
+                continue
+            tile_a, tile_b = border_pairs[pair_position]
+            next_tile_a, next_tile_b = border_pairs[pair_position + 1]
+            for diagonal_a, diagonal_b in ((tile_a, next_tile_b), (next_tile_a, tile_b)):
+                if not blocked_tiles[diagonal_a] and not blocked_tiles[diagonal_b]:
+                    entrances.append((diagonal_a, diagonal_b, DIAGONAL_STEP_COST))
+
+        self.border_entrances[(cluster_a, cluster_b)] = entrances
+
+    def _build_corner(self, cluster_key):
+        """Doorgangen schuin over het hoekpunt van vier clusters (rechtsonder van dit cluster)."""
+        grid_width = self.navigation_grid.grid_width
+        blocked_tiles = self.navigation_grid.blocked_tiles
+        cluster_column, cluster_row = cluster_key
+        _, _, end_x, end_y = self.get_cluster_bounds(cluster_key)
+
+        top_left = (end_x - 1) + (end_y - 1) * grid_width
+        top_right = end_x + (end_y - 1) * grid_width
+        bottom_left = (end_x - 1) + end_y * grid_width
+        bottom_right = end_x + end_y * grid_width
+
+        corner_entrances = []
+        if not blocked_tiles[top_left] and not blocked_tiles[bottom_right]:
+            corner_entrances.append((top_left, bottom_right, DIAGONAL_STEP_COST))
+        if not blocked_tiles[top_right] and not blocked_tiles[bottom_left]:
+            corner_entrances.append((top_right, bottom_left, DIAGONAL_STEP_COST))
+        # de sleutel is het cluster linksboven en het cluster rechtsonder van de hoek
+        self.border_entrances[(cluster_key, (cluster_column + 1, cluster_row + 1))] = corner_entrances
+
+    def _rebuild_node_index(self):
+        """Zet de knooppunten per cluster en de stappen tussen clusters opnieuw uit de doorgangen."""
+        cluster_nodes = {}
+        inter_edges = {}
+        for entrances in self.border_entrances.values():
+            for tile_a, tile_b, step_cost in entrances:
+                cluster_nodes.setdefault(self.get_cluster(tile_a), set()).add(tile_a)
+                cluster_nodes.setdefault(self.get_cluster(tile_b), set()).add(tile_b)
+                inter_edges.setdefault(tile_a, {})[tile_b] = step_cost
+                inter_edges.setdefault(tile_b, {})[tile_a] = step_cost
+        self.cluster_nodes = cluster_nodes
+        self.inter_edges = inter_edges
+
+    def _search_within_cluster(self, start_index, cluster_key, goal_index=None):
+        """
+        Dijkstra vanaf een tegel, zonder het cluster te verlaten.
+        Stopt bij goal_index als die gegeven is. Geeft (kosten per tegel, vorige tegel per tegel) terug.
+        De starttegel zelf mag bezet zijn, net als bij de gewone A*.
+        """
+        grid_width = self.navigation_grid.grid_width
+        blocked_tiles = self.navigation_grid.blocked_tiles
+        start_x, start_y, end_x, end_y = self.get_cluster_bounds(cluster_key)
+
+        cost_so_far = {start_index: 0.0}
+        came_from = {}
+        open_set = [(0.0, start_index)]
+        visited = set()
+
+        while open_set:
+            current_cost, current_index = heapq.heappop(open_set)
+            if current_index in visited:
+                continue
+            visited.add(current_index)
+            if current_index == goal_index:
+                break
+
+            current_x = current_index % grid_width
+            current_y = current_index // grid_width
+            for dx, dy, move_cost in NEIGHBOR_DIRECTIONS:
+                neighbor_x = current_x + dx
+                neighbor_y = current_y + dy
+                if not (start_x <= neighbor_x < end_x and start_y <= neighbor_y < end_y):
+                    continue
+                neighbor_index = neighbor_y * grid_width + neighbor_x
+                if blocked_tiles[neighbor_index] or neighbor_index in visited:
+                    continue
+
+                tentative_cost = current_cost + move_cost
+                if tentative_cost < cost_so_far.get(neighbor_index, float("inf")):
+                    cost_so_far[neighbor_index] = tentative_cost
+                    came_from[neighbor_index] = current_index
+                    heapq.heappush(open_set, (tentative_cost, neighbor_index))
+
+        return cost_so_far, came_from
+
+    def _get_intra_edges(self, cluster_key):
+        """Geeft de afstanden tussen de knooppunten van een cluster terug (en rekent ze uit als dat nog moet)."""
+        cluster_edges = self.intra_edges.get(cluster_key)
+        if cluster_edges is not None:
+            return cluster_edges
+
+        cluster_nodes = self.cluster_nodes.get(cluster_key, set())
+        cluster_edges = {}
+        for node_index in cluster_nodes:
+            cost_so_far, _ = self._search_within_cluster(node_index, cluster_key)
+            cluster_edges[node_index] = {
+                other_index: cost_so_far[other_index]
+                for other_index in cluster_nodes
+                if other_index != node_index and other_index in cost_so_far
+            }
+        self.intra_edges[cluster_key] = cluster_edges
+        return cluster_edges
+
+    def update_navigation_grid(self, navigation_grid):
+        """
+        Neemt een nieuw navigatie-grid (even groot) over en bouwt alleen de clusters opnieuw op
+        waarvan tegels veranderd zijn, plus de doorgangen naar hun buren.
+        """
+        old_tiles = numpy.frombuffer(self.navigation_grid.blocked_tiles, dtype=numpy.uint8)
+        new_tiles = numpy.frombuffer(navigation_grid.blocked_tiles, dtype=numpy.uint8)
+        self.navigation_grid = navigation_grid
+
+        changed_clusters = {self.get_cluster(int(tile_index)) for tile_index in numpy.flatnonzero(old_tiles != new_tiles)}
+        if not changed_clusters:
+            return
+
+        # de grenzen die aan een veranderd cluster liggen, zijn in beheer van het cluster links/boven ervan
+        border_owners = set()
+        for cluster_column, cluster_row in changed_clusters:
+            for owner_column in (cluster_column - 1, cluster_column):
+                for owner_row in (cluster_row - 1, cluster_row):
+                    if 0 <= owner_column < self.cluster_columns and 0 <= owner_row < self.cluster_rows:
+                        border_owners.add((owner_column, owner_row))
+        for owner_key in border_owners:
+            self._build_cluster_borders(owner_key)
+        self._rebuild_node_index()
+
+        # veranderde clusters en hun buren kunnen andere knooppunten hebben gekregen
+        for cluster_column, cluster_row in changed_clusters:
+            for neighbor_column in (cluster_column - 1, cluster_column, cluster_column + 1):
+                for neighbor_row in (cluster_row - 1, cluster_row, cluster_row + 1):
+                    if self.intra_edges.pop((neighbor_column, neighbor_row), None) is not None:
+                        self.rebuilt_cluster_count += 1
+
+    def find_abstract_path(self, start_index, goal_index):
+        """
+        Zoekt over de abstracte graaf van start naar doel. Geeft de lijst met tegels terug
+        (start, knooppunten, doel) waarbij elke stap binnen een cluster of over een grens gaat,
+        of None als het doel niet bereikbaar is.
+        """
+        grid_width = self.navigation_grid.grid_width
+        blocked_tiles = self.navigation_grid.blocked_tiles
+        if blocked_tiles[goal_index]:
+            return None
+        if start_index == goal_index:
+            return [start_index]
+
+        start_cluster = self.get_cluster(start_index)
+        goal_cluster = self.get_cluster(goal_index)
+
+        # binnen hetzelfde cluster eerst direct proberen
+        if start_cluster == goal_cluster:
+            cost_so_far, _ = self._search_within_cluster(start_index, start_cluster, goal_index)
+            if goal_index in cost_so_far:
+                return [start_index, goal_index]
+
+        # start en doel tijdelijk aan de knooppunten van hun cluster koppelen
+        # knooppunt -> (kosten, tussenstap buiten het startcluster of None)
+        start_edges = {}
+        for seed_index, seed_cost in self._get_start_seeds(start_index):
+            seed_cluster = self.get_cluster(seed_index)
+            seed_costs, _ = self._search_within_cluster(seed_index, seed_cluster)
+            target_indices = set(self.cluster_nodes.get(seed_cluster, ()))
+            if seed_cluster == goal_cluster:
+                target_indices.add(goal_index)
+            for target_index in target_indices:
+                if target_index not in seed_costs:
+                    continue
+                target_cost = seed_cost + seed_costs[target_index]
+                if target_cost < start_edges.get(target_index, (float("inf"), None))[0]:
+                    start_edges[target_index] = (target_cost, seed_index if seed_index != start_index else None)
+
+        goal_costs, _ = self._search_within_cluster(goal_index, goal_cluster)
+        goal_edges = {
+            node_index: goal_costs[node_index]
+            for node_index in self.cluster_nodes.get(goal_cluster, ())
+            if node_index in goal_costs
+        }
+        if not start_edges or (not goal_edges and goal_index not in start_edges):
+            return None
+
+        self.abstract_search_count += 1
+        open_set = [(index_distance(start_index, goal_index, grid_width), 0.0, start_index)]
+        g_score = {start_index: 0.0}
+        came_from = {}
+        visited = set()
+
+        while open_set:
+            _, current_g, current_index = heapq.heappop(open_set)
+            if current_index in visited:
+                continue
+            visited.add(current_index)
+
+            if current_index == goal_index:
+                abstract_path = [current_index]
+                while current_index in came_from:
+                    current_index = came_from[current_index]
+                    abstract_path.append(current_index)
+                abstract_path.reverse()
+                # een stap vanaf een bezette start naar een buurcluster komt als eigen tegel in het pad
+                start_detour_index = start_edges.get(abstract_path[1], (0.0, None))[1]
+                if start_detour_index is not None and start_detour_index != abstract_path[1]:
+                    abstract_path.insert(1, start_detour_index)
+                return abstract_path
+
+            if current_index == start_index:
+                neighbor_costs = [(node_index, edge[0]) for node_index, edge in start_edges.items()]
+                # de start kan zelf een knooppunt op de grens zijn
+                neighbor_costs.extend(self.inter_edges.get(start_index, {}).items())
+            else:
+                neighbor_costs = list(self._get_intra_edges(self.get_cluster(current_index)).get(current_index, {}).items())
+                neighbor_costs.extend(self.inter_edges.get(current_index, {}).items())
+                if current_index in goal_edges:
+                    neighbor_costs.append((goal_index, goal_edges[current_index]))
+
+            for neighbor_index, step_cost in neighbor_costs:
+                if neighbor_index in visited:
+                    continue
+                tentative_g = current_g + step_cost
+                if tentative_g < g_score.get(neighbor_index, float("inf")):
+                    g_score[neighbor_index] = tentative_g
+                    came_from[neighbor_index] = current_index
+                    f_score = tentative_g + index_distance(neighbor_index, goal_index, grid_width)
+                    heapq.heappush(open_set, (f_score, tentative_g, neighbor_index))
+
+        return None
+
+    def _get_start_seeds(self, start_index):
+        """
+        Geeft de tegels terug waar de zoektocht vanaf de start begint, met de kosten om er te komen.
+        Net als bij a_star mag een bezette start een stap naar een vrije buurtegel zetten,
+        ook als die in een ander cluster ligt.
+        """
+        start_seeds = [(start_index, 0.0)]
+        if not self.navigation_grid.blocked_tiles[start_index]:
+            return start_seeds
+
+        grid_width = self.navigation_grid.grid_width
+        grid_height = self.navigation_grid.grid_height
+        start_cluster = self.get_cluster(start_index)
+        start_x = start_index % grid_width
+        start_y = start_index // grid_width
+        for dx, dy, move_cost in NEIGHBOR_DIRECTIONS:
+            neighbor_x = start_x + dx
+            neighbor_y = start_y + dy
+            if not (0 <= neighbor_x < grid_width and 0 <= neighbor_y < grid_height):
+                continue
+            neighbor_index = neighbor_y * grid_width + neighbor_x
+            if self.navigation_grid.blocked_tiles[neighbor_index] or self.get_cluster(neighbor_index) == start_cluster:
+                continue
+            start_seeds.append((neighbor_index, move_cost))
+        return start_seeds
+
+    def refine_segment(self, from_index, to_index):
+        """
+        Werkt een stap van het abstracte pad uit tot tegels (van en tot en met).
+        Een stap gaat altijd binnen een cluster of is een enkele stap over een grens.
+        """
+        grid_width = self.navigation_grid.grid_width
+        is_neighbor = max(
+            abs(from_index % grid_width - to_index % grid_width), abs(from_index // grid_width - to_index // grid_width)
+        ) == 1
+        if is_neighbor or to_index in self.inter_edges.get(from_index, {}):
+            return [from_index, to_index]
+
+        cluster_key = self.get_cluster(from_index)
+        _, came_from = self._search_within_cluster(from_index, cluster_key, to_index)
+        if to_index != from_index and to_index not in came_from:
+            return None
+
+        tile_path = [to_index]
+        while tile_path[-1] != from_index:
+            tile_path.append(came_from[tile_path[-1]])
+        tile_path.reverse()
+        return tile_path
+
+    def find_path(self, start_pos, goal_pos, refined_segment_count=1):
+        """
+        Zoekt een pad van start naar doel (in pixels) en geeft, net als a_star, de waypoints
+        zonder het startpunt terug. Alleen de eerste refined_segment_count stappen van het
+        abstracte pad worden uitgewerkt (None = alles); als die op zijn wordt er opnieuw gezocht.
+        """
+        navigation_grid = self.navigation_grid
+        grid_width = navigation_grid.grid_width
+        start_grid_x, start_grid_y = navigation_grid.world_to_grid(start_pos[0], start_pos[1])
+        goal_grid_x, goal_grid_y = navigation_grid.world_to_grid(goal_pos[0], goal_pos[1])
+        if not (0 <= start_grid_x < grid_width and 0 <= start_grid_y < navigation_grid.grid_height):
+            return None
+        if not (0 <= goal_grid_x < grid_width and 0 <= goal_grid_y < navigation_grid.grid_height):
+            return None
+
+        abstract_path = self.find_abstract_path(start_grid_y * grid_width + start_grid_x, goal_grid_y * grid_width + goal_grid_x)
+        if abstract_path is None:
+            return None
+
+        segment_count = len(abstract_path) - 1
+        if refined_segment_count is not None:
+            segment_count = min(segment_count, refined_segment_count)
+
+        tile_path = [abstract_path[0]]
+        for segment_index in range(segment_count):
+            segment_tiles = self.refine_segment(abstract_path[segment_index], abstract_path[segment_index + 1])
+            if segment_tiles is None:
+                return None
+            tile_path.extend(segment_tiles[1:])
+
+        return [navigation_grid.grid_to_world(tile_index % grid_width, tile_index // grid_width) for tile_index in tile_path[1:]]
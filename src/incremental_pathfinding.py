@@ -0,0 +1,404 @@
+# src/incremental_pathfinding.py
+import heapq
+
+import numpy
+
+from src.pathfinding import find_path
+
+# Kosten die groter zijn dan elk pad op een map, als "onbereikbaar"
+UNREACHABLE_COST = 1 << 40
+
+# Stapkosten maal tien als geheel getal (10 recht, 14 diagonaal), net als NEIGHBOR_DIRECTIONS.
+# D* Lite vergelijkt sleutels op gelijkheid; met kommagetallen tellen 1.4 + 1.0 en de schatting net verschillend op.
+STRAIGHT_STEP_COST = 10
+DIAGONAL_STEP_COST = 14
+
+# Vanaf hoe dicht bij het doel (twee tegels, ook schuin) het pad naar de wortel wordt afgebroken
+# om met een kort stukje a_star naar het doel te gaan
+FINAL_SEGMENT_REACH_COST = 2 * DIAGONAL_STEP_COST
+
+
+class DStarLitePlanner:
+    """
+    Incrementele planner (D* Lite) voor een achtervolger op een NavGrid.
+    De zoektocht loopt terug vanaf de wortel (de tegel van de speler) en de kosten blijven tussen
+    twee aanroepen bewaard. Als de achtervolger verder loopt wordt alleen km opgehoogd en als er
+    tegels veranderen worden alleen de buren van die tegels opnieuw bekeken; compute_shortest_path
+    herstelt daarna alleen de kosten die echt veranderd zijn.
+    Net als bij a_star mag een bezette starttegel verlaten worden, maar je kunt geen bezette tegel op.
+    Intern wordt gewerkt met platte indexen in een grid met een rand van bezette tegels eromheen.
+    """
+
+    def __init__(self, navigation_grid, goal_drift_ratio=0.25):
+        # hoe ver het doel van de wortel mag lopen (als deel van de afstand tot de achtervolger)
+        # voordat de wortel verplaatst wordt
+        self.goal_drift_ratio = goal_drift_ratio
+
+        self.navigation_grid = None
+        self.padded_width = 0
+        self.blocked_tiles = b""
+        self.neighbor_steps = ()
+
+        self.start_index = None
+        self.goal_index = None
+        # start bij de vorige aanroep, voor het ophogen van km
+        self.last_start_index = None
+        self.key_modifier = 0
+
+        # per tegel: kosten naar de wortel, en de schatting daarvan op basis van de buren
+        self.g_scores = []
+        self.rhs_scores = []
+        # heap met (sleutel 1, sleutel 2, tegel) en de geldige sleutel per tegel in de heap
+        self.open_heap = []
+        self.open_keys = {}
+
+        self.search_count = 0
+        self.reset_count = 0
+        self.expanded_node_count = 0
+        self.last_expanded_node_count = 0
+
+        self._set_navigation_grid(navigation_grid)
+
+    def _set_navigation_grid(self, navigation_grid):
+        """Zet het grid met rand en de stappen naar de buren klaar."""
+        self.navigation_grid = navigation_grid
+        self.padded_width = navigation_grid.grid_width + 2
+        source_tiles = numpy.frombuffer(navigation_grid.blocked_tiles, dtype=numpy.uint8).reshape(
+            navigation_grid.grid_height, navigation_grid.grid_width
+        )
+        self.blocked_tiles = numpy.pad(source_tiles, 1, constant_values=1).tobytes()
+        padded_width = self.padded_width
+        self.neighbor_steps = (
+            (padded_width, STRAIGHT_STEP_COST), (1, STRAIGHT_STEP_COST),
+            (-padded_width, STRAIGHT_STEP_COST), (-1, STRAIGHT_STEP_COST),
+            (padded_width + 1, DIAGONAL_STEP_COST), (-padded_width + 1, DIAGONAL_STEP_COST),
+            (padded_width - 1, DIAGONAL_STEP_COST), (-padded_width - 1, DIAGONAL_STEP_COST),
+        )
+
+    def _heuristic(self, index_a, index_b):
+        """Afstand met rechte en diagonale stappen, nooit meer dan de echte kosten (nodig voor D* Lite)."""
+        padded_width = self.padded_width
+        difference_x = abs(index_a % padded_width - index_b % padded_width)
+        difference_y = abs(index_a // padded_width - index_b // padded_width)
+        if difference_x > difference_y:
+            return STRAIGHT_STEP_COST * difference_x + (DIAGONAL_STEP_COST - STRAIGHT_STEP_COST) * difference_y
+        return STRAIGHT_STEP_COST * difference_y + (DIAGONAL_STEP_COST - STRAIGHT_STEP_COST) * difference_x
+
+    def _push(self, tile_index):
+        """Zet een tegel met zijn huidige sleutel in de heap."""
+        best_score = min(self.g_scores[tile_index], self.rhs_scores[tile_index])
+        tile_key = (best_score + self._heuristic(self.start_index, tile_index) + self.key_modifier, best_score)
+        self.open_keys[tile_index] = tile_key
+        heapq.heappush(self.open_heap, (tile_key[0], tile_key[1], tile_index))
+
+    def _update_vertex(self, tile_index):
+        """Rekent de schatting van een tegel opnieuw uit en zet hem in of uit de heap."""
+        if tile_index != self.goal_index:
+            blocked_tiles = self.blocked_tiles
+            g_scores = self.g_scores
+            best_score = UNREACHABLE_COST
+            for neighbor_step, move_cost in self.neighbor_steps:
+                neighbor_index = tile_index + neighbor_step
+                # een stap op een bezette tegel kan niet
+                if blocked_tiles[neighbor_index]:
+                    continue
+                neighbor_score = move_cost + g_scores[neighbor_index]
+                if neighbor_score < best_score:
+                    best_score = neighbor_score
+            self.rhs_scores[tile_index] = best_score
+
+        if self.g_scores[tile_index] != self.rhs_scores[tile_index]:
+            self._push(tile_index)
+        else:
+            self.open_keys.pop(tile_index, None)
+
+    def _update_predecessors(self, tile_index):
+        """
+        Bekijkt de buren die een stap op deze tegel kunnen zetten opnieuw.
+        Bezette buren doen niet mee: niemand kan via hen lopen, alleen de start mag er zelf op staan.
+        """
+        blocked_tiles = self.blocked_tiles
+        start_index = self.start_index
+        for neighbor_step, _ in self.neighbor_steps:
+            neighbor_index = tile_index + neighbor_step
+            if not blocked_tiles[neighbor_index] or neighbor_index == start_index:
+                self._update_vertex(neighbor_index)
+
+    def reset(self, start_index, goal_index):
+        """Gooit alle opgeslagen kosten weg en begint opnieuw vanaf het doel."""
+        tile_count = len(self.blocked_tiles)
+        self.start_index = start_index
+        self.last_start_index = start_index
+        self.goal_index = goal_index
+        self.key_modifier = 0
+        self.g_scores = [UNREACHABLE_COST] * tile_count
+        self.rhs_scores = [UNREACHABLE_COST] * tile_count
+        self.rhs_scores[goal_index] = 0
+        self.open_heap = []
+        self.open_keys = {}
+        self._push(goal_index)
+        self.reset_count += 1
+
+    def move_start(self, start_index):
+        """De achtervolger staat op een nieuwe tegel: alleen km wordt opgehoogd."""
+        if start_index == self.start_index:
+            return
+        self.key_modifier += self._heuristic(self.last_start_index, start_index)
+        self.last_start_index = start_index
+        self.start_index = start_index
+        # een bezette start doet nu pas mee, zijn schatting kan nog niet bijgewerkt zijn
+        if self.blocked_tiles[start_index]:
+            self._update_vertex(start_index)
+
+    def move_goal(self, goal_index):
+        """
+        Verplaatst de wortel naar een nieuwe tegel. De nieuwe tegel krijgt kosten 0 en de oude wordt
+        een gewone tegel, daarna herstelt compute_shortest_path de kosten die daardoor veranderen.
+        """
+        if goal_index == self.goal_index:
+            return
+        old_goal_index = self.goal_index
+        self.goal_index = goal_index
+        self.rhs_scores[goal_index] = 0
+        self._update_vertex(goal_index)
+        self._update_vertex(old_goal_index)
+
+    def update_navigation_grid(self, navigation_grid):
+        """
+        Neemt een nieuw navigatie-grid (even groot) over. Voor elke tegel die veranderd is
+        worden alleen de buren opnieuw bekeken, want alleen hun stap naar die tegel is anders.
+        """
+        old_tiles = numpy.frombuffer(self.navigation_grid.blocked_tiles, dtype=numpy.uint8)
+        new_tiles = numpy.frombuffer(navigation_grid.blocked_tiles, dtype=numpy.uint8)
+        changed_indices = numpy.flatnonzero(old_tiles != new_tiles)
+        self._set_navigation_grid(navigation_grid)
+        if self.goal_index is None:
+            return
+
+        grid_width = navigation_grid.grid_width
+        for changed_index in changed_indices:
+            tile_index = (int(changed_index) // grid_width + 1) * self.padded_width + int(changed_index) % grid_width + 1
+            self._update_predecessors(tile_index)
+            # een tegel die vrij is geworden moet zijn eigen kosten weer doorgeven
+            self._update_vertex(tile_index)
+
+    def compute_shortest_path(self):
+        """
+        Herstelt de kosten tot de start weer klopt. Geeft het aantal uitgebreide tegels terug.
+        Dit is de geoptimaliseerde vorm van D* Lite: als de kosten van een tegel dalen krijgen de buren
+        alleen een lagere schatting, en als ze stijgen worden alleen de buren opnieuw uitgerekend
+        die hun schatting aan deze tegel ontleenden. De sleutel en de schatting zijn hier uitgeschreven,
+        dit is de binnenste lus en elke functieaanroep per buur telt mee.
+        """
+        g_scores = self.g_scores
+        rhs_scores = self.rhs_scores
+        blocked_tiles = self.blocked_tiles
+        neighbor_steps = self.neighbor_steps
+        open_heap = self.open_heap
+        open_keys = self.open_keys
+        start_index = self.start_index
+        goal_index = self.goal_index
+        key_modifier = self.key_modifier
+        padded_width = self.padded_width
+        start_y, start_x = divmod(start_index, padded_width)
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        expanded_node_count = 0
+
+        def push_if_inconsistent(tile_index):
+            # zelfde als _update_vertex zonder de schatting opnieuw uit te rekenen
+            tile_g = g_scores[tile_index]
+            tile_rhs = rhs_scores[tile_index]
+            if tile_g == tile_rhs:
+                open_keys.pop(tile_index, None)
+                return
+            best_score = tile_g if tile_g < tile_rhs else tile_rhs
+            tile_y, tile_x = divmod(tile_index, padded_width)
+            difference_x = tile_x - start_x if tile_x > start_x else start_x - tile_x
+            difference_y = tile_y - start_y if tile_y > start_y else start_y - tile_y
+            if difference_x > difference_y:
+                heuristic = STRAIGHT_STEP_COST * difference_x + (DIAGONAL_STEP_COST - STRAIGHT_STEP_COST) * difference_y
+            else:
+                heuristic = STRAIGHT_STEP_COST * difference_y + (DIAGONAL_STEP_COST - STRAIGHT_STEP_COST) * difference_x
+            tile_key = (best_score + heuristic + key_modifier, best_score)
+            open_keys[tile_index] = tile_key
+            heappush(open_heap, (tile_key[0], best_score, tile_index))
+
+        def recompute_rhs(tile_index):
+            best_score = UNREACHABLE_COST
+            for neighbor_step, move_cost in neighbor_steps:
+                neighbor_index = tile_index + neighbor_step
+                if blocked_tiles[neighbor_index]:
+                    continue
+                neighbor_score = move_cost + g_scores[neighbor_index]
+                if neighbor_score < best_score:
+                    best_score = neighbor_score
+            rhs_scores[tile_index] = best_score
+
+        while open_heap:
+            first_key, second_key, tile_index = open_heap[0]
+            if open_keys.get(tile_index) != (first_key, second_key):
+                # verouderd item, deze tegel staat met een andere sleutel in de heap (of niet meer)
+                heappop(open_heap)
+                continue
+
+            start_g = g_scores[start_index]
+            start_rhs = rhs_scores[start_index]
+            start_best = start_g if start_g < start_rhs else start_rhs
+            if not ((first_key, second_key) < (start_best + key_modifier, start_best) or start_rhs != start_g):
+                break
+
+            heappop(open_heap)
+            del open_keys[tile_index]
+            expanded_node_count += 1
+
+            tile_g = g_scores[tile_index]
+            tile_rhs = rhs_scores[tile_index]
+            tile_best = tile_g if tile_g < tile_rhs else tile_rhs
+            if (first_key, second_key) < (tile_best + self._heuristic(start_index, tile_index) + key_modifier, tile_best):
+                # de sleutel is verouderd door km, opnieuw in de heap met de nieuwe sleutel
+                self._push(tile_index)
+                continue
+
+            if tile_g > tile_rhs:
+                g_scores[tile_index] = tile_rhs
+                if blocked_tiles[tile_index]:
+                    continue
+                # de kosten zijn gedaald: buren die hierop kunnen stappen krijgen hooguit een lagere schatting
+                for neighbor_step, move_cost in neighbor_steps:
+                    neighbor_index = tile_index + neighbor_step
+                    if blocked_tiles[neighbor_index] and neighbor_index != start_index:
+                        continue
+                    if neighbor_index != goal_index and move_cost + tile_rhs < rhs_scores[neighbor_index]:
+                        rhs_scores[neighbor_index] = move_cost + tile_rhs
+                        push_if_inconsistent(neighbor_index)
+            else:
+                g_scores[tile_index] = UNREACHABLE_COST
+                if not blocked_tiles[tile_index]:
+                    # de kosten zijn gestegen: alleen buren die hun schatting via deze tegel kregen opnieuw uitrekenen
+                    for neighbor_step, move_cost in neighbor_steps:
+                        neighbor_index = tile_index + neighbor_step
+                        if blocked_tiles[neighbor_index] and neighbor_index != start_index:
+                            continue
+                        if neighbor_index != goal_index and rhs_scores[neighbor_index] == move_cost + tile_g:
+                            recompute_rhs(neighbor_index)
+                            push_if_inconsistent(neighbor_index)
+                push_if_inconsistent(tile_index)
+
+        self.search_count += 1
+        self.expanded_node_count += expanded_node_count
+        self.last_expanded_node_count = expanded_node_count
+        return expanded_node_count
+
+    def extract_path(self):
+        """
+        Volgt vanaf de start steeds de goedkoopste buur naar de wortel.
+        Geeft de tegels na de start tot en met de wortel terug, of None als er geen pad is.
+        """
+        if self.start_index == self.goal_index:
+            return []
+        if self.rhs_scores[self.start_index] >= UNREACHABLE_COST:
+            return None
+
+        blocked_tiles = self.blocked_tiles
+        g_scores = self.g_scores
+        tile_path = []
+        current_index = self.start_index
+        # de kosten worden bij elke stap kleiner, anders klopt er iets niet en stoppen we
+        current_score = self.rhs_scores[current_index]
+        while current_index != self.goal_index:
+            best_index = None
+            best_score = UNREACHABLE_COST
+            for neighbor_step, move_cost in self.neighbor_steps:
+                neighbor_index = current_index + neighbor_step
+                if blocked_tiles[neighbor_index]:
+                    continue
+                neighbor_score = move_cost + g_scores[neighbor_index]
+                if neighbor_score < best_score:
+                    best_index = neighbor_index
+                    best_score = neighbor_score
+            if best_index is None or g_scores[best_index] >= current_score:
+                return None
+            tile_path.append(best_index)
+            current_index = best_index
+            current_score = g_scores[best_index]
+        return tile_path
+
+    def find_path(self, start_pos, goal_pos, navigation_grid=None):
+        """
+        Zoekt (of herstelt) het pad van start naar doel in pixels en geeft, net als a_star,
+        de waypoints zonder het startpunt terug, of None als er geen pad is.
+        Een ander navigatie-grid van dezelfde grootte wordt als verandering van tegels verwerkt.
+
+        Een nieuwe wortel verandert de kosten van bijna alle tegels, daarom blijft de wortel staan
+        zolang het doel er dichtbij blijft (binnen goal_drift_ratio van de afstand tot de achtervolger).
+        Het pad naar de wortel wordt afgebroken op de eerste tegel binnen twee tegels van het doel,
+        zodat het niet eerst voorbij het doel naar de wortel loopt. Vanaf daar is het een stap als het
+        doel ernaast ligt, en anders een kort stukje a_star (of vanaf de wortel als dat niet lukt).
+        """
+        if navigation_grid is not None and navigation_grid is not self.navigation_grid:
+            if (navigation_grid.grid_width, navigation_grid.grid_height) == \
+                    (self.navigation_grid.grid_width, self.navigation_grid.grid_height):
+                self.update_navigation_grid(navigation_grid)
+            else:
+                self._set_navigation_grid(navigation_grid)
+                self.goal_index = None
+
+        grid = self.navigation_grid
+        start_grid_x, start_grid_y = grid.world_to_grid(start_pos[0], start_pos[1])
+        goal_grid_x, goal_grid_y = grid.world_to_grid(goal_pos[0], goal_pos[1])
+        if not (0 <= start_grid_x < grid.grid_width and 0 <= start_grid_y < grid.grid_height):
+            return None
+        if not (0 <= goal_grid_x < grid.grid_width and 0 <= goal_grid_y < grid.grid_height):
+            return None
+        start_index = (start_grid_y + 1) * self.padded_width + start_grid_x + 1
+        goal_index = (goal_grid_y + 1) * self.padded_width + goal_grid_x + 1
+
+        if self.goal_index is None:
+            self.reset(start_index, goal_index)
+        else:
+            self.move_start(start_index)
+            goal_drift = self._heuristic(self.goal_index, goal_index)
+            if goal_drift > max(STRAIGHT_STEP_COST, self.goal_drift_ratio * self._heuristic(start_index, goal_index)):
+                self.move_goal(goal_index)
+
+        self.compute_shortest_path()
+        tile_path = self.extract_path()
+
+        final_segment = []
+        if tile_path is not None and self.goal_index != goal_index:
+            tile_path, final_segment = self._finish_near_goal(tile_path, goal_index, goal_pos)
+        if (tile_path is None or final_segment is None) and self.goal_index != goal_index:
+            # via de oude wortel kan het niet (meer), dan toch de wortel naar het doel verplaatsen
+            self.move_goal(goal_index)
+            self.compute_shortest_path()
+            tile_path = self.extract_path()
+            final_segment = []
+        if tile_path is None:
+            return None
+
+        return [self._to_world(tile_index) for tile_index in tile_path] + final_segment
+
+    def _finish_near_goal(self, tile_path, goal_index, goal_pos):
+        """
+        Breekt het pad naar de wortel af op de eerste tegel (de start meegeteld) binnen
+        FINAL_SEGMENT_REACH_COST van het doel en geeft het ingekorte pad plus het stukje naar het doel terug.
+        Het stukje is None als het doel ook vanaf de wortel niet te bereiken is.
+        """
+        for path_position, tile_index in enumerate([self.start_index] + tile_path):
+            if tile_index == goal_index:
+                return tile_path[:path_position], []
+            if self._heuristic(tile_index, goal_index) > FINAL_SEGMENT_REACH_COST:
+                continue
+            if self._heuristic(tile_index, goal_index) <= DIAGONAL_STEP_COST and not self.blocked_tiles[goal_index]:
+                # het doel ligt ernaast, daar hoeft niet voor gezocht te worden
+                return tile_path[:path_position], [self._to_world(goal_index)]
+            final_segment = find_path(self._to_world(tile_index), goal_pos, self.navigation_grid)
+            if final_segment is not None:
+                return tile_path[:path_position], final_segment
+            break
+        return tile_path, find_path(self._to_world(self.goal_index), goal_pos, self.navigation_grid)
+
+    def _to_world(self, tile_index):
+        """Van een index in het grid met rand naar het midden van de tegel in pixels."""
+        return self.navigation_grid.grid_to_world(tile_index % self.padded_width - 1, tile_index // self.padded_width - 1)
@@ -0,0 +1,152 @@
+# src/input_recording.py
+import struct
+import zlib
+
+import pygame
+
+from src.simulation import SimulationInput
+
+# Opnamebestand van een speelsessie:
+#   header: magic, versie, seed van de gameplay random bron, aantal ticks, lengte van het mappad en van de naam
+#   van de moeilijkheid van de operator shooter, daarna het mappad en de moeilijkheid (beide utf-8)
+#   daarna de ticks, met zlib ingepakt: per tick een byte met de bewegingstoetsen en een bit voor toetsen,
+#   gevolgd door het aantal toetsen en per toets het type (0 ingedrukt, 1 losgelaten) en de toetscode
+INPUT_RECORDING_MAGIC = b"PREC"
+INPUT_RECORDING_VERSION = 2
+INPUT_RECORDING_EXTENSION = ".prec"
+
+RECORDING_HEADER_STRUCT = struct.Struct("<4sHQIHH")
+KEY_EVENT_STRUCT = struct.Struct("<BI")
+
+# Bits in de byte van een tick
+MOVE_LEFT_BIT = 1
+MOVE_RIGHT_BIT = 2
+MOVE_UP_BIT = 4
+MOVE_DOWN_BIT = 8
+KEY_EVENTS_BIT = 16
+
+# Codes voor het type van een toets in het bestand
+KEY_EVENT_TYPE_CODES = {pygame.KEYDOWN: 0, pygame.KEYUP: 1}
+KEY_EVENT_TYPES = {type_code: event_type for event_type, type_code in KEY_EVENT_TYPE_CODES.items()}
+
+
+class InputRecorder:
+    """
+    Neemt de invoer van elke tick op (bewegingstoetsen en ingedrukte of losgelaten toetsen),
+    samen met de seed van de gameplay random bron, de map en de moeilijkheid van de operator shooter
+    (die verandert het spel, dus een replay moet dezelfde gebruiken). Met close wordt alles weggeschreven.
+    """
+
+    def __init__(self, file_path, random_seed, map_file_path, operator_difficulty="normal"):
+        self.file_path = file_path
+        self.random_seed = random_seed
+        self.map_file_path = map_file_path
+        self.operator_difficulty = operator_difficulty
+        self.tick_data = bytearray()
+        self.tick_count = 0
+
+    def record_tick(self, simulation_input):
+        """Voegt de invoer van een tick toe aan de opname."""
+        tick_flags = 0
+        if simulation_input.move_left:
+            tick_flags |= MOVE_LEFT_BIT
+        if simulation_input.move_right:
+            tick_flags |= MOVE_RIGHT_BIT
+        if simulation_input.move_up:
+            tick_flags |= MOVE_UP_BIT
+        if simulation_input.move_down:
+            tick_flags |= MOVE_DOWN_BIT
+
+        # alleen toetsen die de simulatie kent, de rest (zoals de muis) speelt geen rol
+        key_events = [(event_type, key) for event_type, key in simulation_input.key_events if event_type in KEY_EVENT_TYPE_CODES]
+        if key_events:
+            tick_flags |= KEY_EVENTS_BIT
+            self.tick_data.append(tick_flags)
+            # meer dan 255 toetsen in een tick past niet in het bestand, de rest valt weg
+            key_events = key_events[:255]
+            self.tick_data.append(len(key_events))
+            for event_type, key in key_events:
+                self.tick_data += KEY_EVENT_STRUCT.pack(KEY_EVENT_TYPE_CODES[event_type], key)
+        else:
+            self.tick_data.append(tick_flags)
+        self.tick_count += 1
+
+    def close(self):
+        """Schrijft de opname naar het bestand."""
+        encoded_map_path = self.map_file_path.encode("utf-8")
+        encoded_difficulty = self.operator_difficulty.encode("utf-8")
+        with open(self.file_path, "wb") as file_handle:
+            file_handle.write(RECORDING_HEADER_STRUCT.pack(
+                INPUT_RECORDING_MAGIC, INPUT_RECORDING_VERSION, self.random_seed, self.tick_count,
+                len(encoded_map_path), len(encoded_difficulty)
+            ))
+            file_handle.write(encoded_map_path)
+            file_handle.write(encoded_difficulty)
+            file_handle.write(zlib.compress(bytes(self.tick_data)))
+        print(f"Opname van {self.tick_count} ticks weggeschreven naar: {self.file_path}")
+
+
+class InputRecording:
+    """Een ingelezen opname: de seed, de map, de moeilijkheid en de invoer per tick, af te spelen met next_input."""
+
+    def __init__(self, random_seed, map_file_path, tick_inputs, operator_difficulty="normal"):
+        self.random_seed = random_seed
+        self.map_file_path = map_file_path
+        self.operator_difficulty = operator_difficulty
+        self.tick_inputs = tick_inputs
+        self.next_tick_index = 0
+
+    def is_finished(self):
+        """Geeft aan of alle ticks afgespeeld zijn."""
+        return self.next_tick_index >= len(self.tick_inputs)
+
+    def next_input(self):
+        """De invoer van de volgende tick, of None als de opname afgelopen is."""
+        if self.is_finished():
+            return None
+        simulation_input = self.tick_inputs[self.next_tick_index]
+        self.next_tick_index += 1
+        return simulation_input
+
+
+def load_input_recording(file_path):
+    """Leest een opnamebestand in."""
+    with open(file_path, "rb") as file_handle:
+        file_data = file_handle.read()
+
+    if len(file_data) < RECORDING_HEADER_STRUCT.size:
+        raise ValueError(f"Geen geldig opnamebestand: {file_path}")
+    magic, version, random_seed, tick_count, map_path_length, difficulty_length = RECORDING_HEADER_STRUCT.unpack_from(file_data, 0)
+    if magic != INPUT_RECORDING_MAGIC:
+        raise ValueError(f"Geen geldig opnamebestand: {file_path}")
+    if version != INPUT_RECORDING_VERSION:
+        raise ValueError(f"Onbekende versie van het opnamebestand: {version}")
+
+    data_offset = RECORDING_HEADER_STRUCT.size
+    map_file_path = file_data[data_offset:data_offset + map_path_length].decode("utf-8")
+    data_offset += map_path_length
+    operator_difficulty = file_data[data_offset:data_offset + difficulty_length].decode("utf-8")
+    tick_data = zlib.decompress(file_data[data_offset + difficulty_length:])
+
+    tick_inputs = []
+    read_offset = 0
+    for _ in range(tick_count):
+        tick_flags = tick_data[read_offset]
+        read_offset += 1
+        key_events = []
+        if tick_flags & KEY_EVENTS_BIT:
+            key_event_count = tick_data[read_offset]
+            read_offset += 1
+            for _ in range(key_event_count):
+                type_code, key = KEY_EVENT_STRUCT.unpack_from(tick_data, read_offset)
+                read_offset += KEY_EVENT_STRUCT.size
+                key_events.append((KEY_EVENT_TYPES[type_code], key))
+        tick_inputs.append(SimulationInput(
+            move_left=bool(tick_flags & MOVE_LEFT_BIT),
+            move_right=bool(tick_flags & MOVE_RIGHT_BIT),
+            move_up=bool(tick_flags & MOVE_UP_BIT),
+            move_down=bool(tick_flags & MOVE_DOWN_BIT),
+            key_events=key_events
+        ))
+
+    return InputRecording(random_seed, map_file_path, tick_inputs, operator_difficulty)
@@ -0,0 +1,161 @@
+"""src/interactable_index.py"""
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy
+
+# Tegeltypes waar de speler met de spatiebalk iets mee kan doen
+# Tegel 2: Minigame Operators, 3: Informatiebord, 4: Minigame Jumper, 5: Minigame Quiz, 9: deur voor de kerk
+INTERACTABLE_TILE_TYPES = (2, 3, 4, 5, 9)
+
+# Grootte van een vak van de index in tegels
+INTERACTABLE_BUCKET_SIZE = 8
+
+
+class InteractableObject:
+    """
+    Een interactief object op de map: aaneengesloten tegels van hetzelfde type (zoals de dubbele deur).
+    row_index en column_index zijn de eerste tegel van het object (bovenste rij, meest linkse kolom daarvan),
+    zodat een object altijd dezelfde locatie heeft, van welke kant de speler er ook naast staat.
+    """
+
+    __slots__ = ("tile_type", "row_index", "column_index", "tile_positions")
+
+    def __init__(self, tile_type: int, tile_positions: List[Tuple[int, int]]) -> None:
+        self.tile_type = tile_type
+        self.tile_positions = sorted(tile_positions)
+        self.row_index, self.column_index = self.tile_positions[0]
+
+    def get_distance_squared(self, world_coordinate_x: float, world_coordinate_y: float, tile_size: int) -> float:
+        """Kwadraat van de afstand van een punt tot de dichtstbijzijnde tegel van het object (0 erin)."""
+        best_distance_squared = None
+        for row_index, column_index in self.tile_positions:
+            tile_left = column_index * tile_size
+            tile_top = row_index * tile_size
+            difference_x = max(tile_left - world_coordinate_x, 0, world_coordinate_x - (tile_left + tile_size))
+            difference_y = max(tile_top - world_coordinate_y, 0, world_coordinate_y - (tile_top + tile_size))
+            distance_squared = difference_x * difference_x + difference_y * difference_y
+            if best_distance_squared is None or distance_squared < best_distance_squared:
+                best_distance_squared = distance_squared
+        return best_distance_squared
+
+    def overlaps_tile_range(self, column_start: int, column_end: int, row_start: int, row_end: int) -> bool:
+        """Geeft aan of een van de tegels binnen het bereik van kolommen en rijen (inclusief) ligt."""
+        for row_index, column_index in self.tile_positions:
+            if row_start <= row_index <= row_end and column_start <= column_index <= column_end:
+                return True
+        return False
+
+
+def group_interactable_tiles(get_tile_type: Callable[[int, int], Optional[int]], row_index: int, column_index: int,
+                             visited_positions: Optional[set] = None) -> InteractableObject:
+    """
+    Verzamelt vanaf een interactieve tegel alle tegels van hetzelfde type die er (recht) aan vast zitten.
+    get_tile_type geeft het type op (rij, kolom), of None buiten de map.
+    """
+    if visited_positions is None:
+        visited_positions = set()
+    tile_type = get_tile_type(row_index, column_index)
+    tile_positions = []
+    open_positions = [(row_index, column_index)]
+    visited_positions.add((row_index, column_index))
+    while open_positions:
+        current_row, current_column = open_positions.pop()
+        tile_positions.append((current_row, current_column))
+        for neighbor_row, neighbor_column in (
+            (current_row - 1, current_column), (current_row + 1, current_column),
+            (current_row, current_column - 1), (current_row, current_column + 1),
+        ):
+            if (neighbor_row, neighbor_column) in visited_positions:
+                continue
+            if get_tile_type(neighbor_row, neighbor_column) == tile_type:
+                visited_positions.add((neighbor_row, neighbor_column))
+                open_positions.append((neighbor_row, neighbor_column))
+    return InteractableObject(tile_type, tile_positions)
+
+
+def find_nearest_interactable(candidate_objects, world_coordinate_x, world_coordinate_y, search_radius, tile_size):
+    """
+    Kiest uit de kandidaten het dichtstbijzijnde object met een tegel in het vierkant rond het punt
+    (dezelfde tegels die de oude zoektocht bekeek). Bij gelijke afstand wint het object dat het eerst in de map staat.
+    """
+    column_start = int((world_coordinate_x - search_radius) // tile_size)
+    column_end = int((world_coordinate_x + search_radius) // tile_size)
+    row_start = int((world_coordinate_y - search_radius) // tile_size)
+    row_end = int((world_coordinate_y + search_radius) // tile_size)
+
+    nearest_object = None
+    nearest_key = None
+    for candidate_object in candidate_objects:
+        if not candidate_object.overlaps_tile_range(column_start, column_end, row_start, row_end):
+            continue
+        candidate_key = (
+            candidate_object.get_distance_squared(world_coordinate_x, world_coordinate_y, tile_size),
+            candidate_object.row_index,
+            candidate_object.column_index,
+        )
+        if nearest_key is None or candidate_key < nearest_key:
+            nearest_object = candidate_object
+            nearest_key = candidate_key
+    return nearest_object
+
+
+class InteractableIndex:
+    """
+    Alle interactieve objecten van een map, een keer verzameld bij het laden.
+    De objecten staan in vakken van INTERACTABLE_BUCKET_SIZE tegels, zodat het dichtstbijzijnde object
+    elk frame opgezocht kan worden zonder de tegels rond de speler af te lopen.
+    """
+
+    def __init__(self, tile_size: int, bucket_size: int = INTERACTABLE_BUCKET_SIZE) -> None:
+        self.tile_size = tile_size
+        self.bucket_size = bucket_size
+        self.interactable_objects: List[InteractableObject] = []
+        # (vak kolom, vak rij) -> objecten met een tegel in dat vak
+        self.object_buckets: Dict[Tuple[int, int], List[InteractableObject]] = {}
+
+    def build(self, collision_grid) -> None:
+        """Verzamelt de objecten uit een collision-laag (lijst met rijen of een numpy array)."""
+        self.interactable_objects = []
+        self.object_buckets = {}
+        collision_array = numpy.asarray(collision_grid)
+        if collision_array.ndim != 2 or collision_array.size == 0:
+            return
+        map_height, map_width = collision_array.shape
+
+        def get_tile_type(row_index, column_index):
+            if 0 <= row_index < map_height and 0 <= column_index < map_width:
+                return int(collision_array[row_index, column_index])
+            return None
+
+        visited_positions = set()
+        row_indices, column_indices = numpy.nonzero(numpy.isin(collision_array, INTERACTABLE_TILE_TYPES))
+        for row_index, column_index in zip(row_indices.tolist(), column_indices.tolist()):
+            if (row_index, column_index) in visited_positions:
+                continue
+            self.add_object(group_interactable_tiles(get_tile_type, row_index, column_index, visited_positions))
+
+    def add_object(self, interactable_object: InteractableObject) -> None:
+        """Zet een object in de index, in elk vak waar een van zijn tegels ligt."""
+        self.interactable_objects.append(interactable_object)
+        bucket_keys = {
+            (column_index // self.bucket_size, row_index // self.bucket_size)
+            for row_index, column_index in interactable_object.tile_positions
+        }
+        for bucket_key in bucket_keys:
+            self.object_buckets.setdefault(bucket_key, []).append(interactable_object)
+
+    def query_nearest(self, world_coordinate_x: float, world_coordinate_y: float, search_radius: float) -> Optional[InteractableObject]:
+        """Het dichtstbijzijnde object binnen de straal rond een punt, of None."""
+        bucket_pixel_size = self.bucket_size * self.tile_size
+        bucket_column_start = int((world_coordinate_x - search_radius) // bucket_pixel_size)
+        bucket_column_end = int((world_coordinate_x + search_radius) // bucket_pixel_size)
+        bucket_row_start = int((world_coordinate_y - search_radius) // bucket_pixel_size)
+        bucket_row_end = int((world_coordinate_y + search_radius) // bucket_pixel_size)
+
+        candidate_objects = []
+        for bucket_row in range(bucket_row_start, bucket_row_end + 1):
+            for bucket_column in range(bucket_column_start, bucket_column_end + 1):
+                for interactable_object in self.object_buckets.get((bucket_column, bucket_row), ()):
+                    if interactable_object not in candidate_objects:
+                        candidate_objects.append(interactable_object)
+        return find_nearest_interactable(candidate_objects, world_coordinate_x, world_coordinate_y, search_radius, self.tile_size)
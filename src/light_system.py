@@ -1,67 +1,106 @@
+import numpy
 import pygame
-import math
+from src.colors import BLACK
+
+# Gedeelde cache met lichtmaskers per (straal, falloff), elk masker wordt maar een keer berekend
+_radial_light_mask_cache = {}
+
+
+def generate_radial_light_mask(light_radius, falloff_exponent=2.0):
+    """
+    Genereer (of pak uit de cache) een cirkel gradient mask voor zacht licht.
+    De alpha wordt in een keer met numpy berekend in plaats van per pixel.
+    """
+    cache_key = (light_radius, falloff_exponent)
+    cached_mask = _radial_light_mask_cache.get(cache_key)
+    if cached_mask is not None:
+        return cached_mask
+
+    mask_size = light_radius * 2
+    light_mask = pygame.Surface((mask_size, mask_size), pygame.SRCALPHA)
+
+    # afstand van elke pixel tot het center (surfarray is geindexeerd als [x, y])
+    pixel_offsets = numpy.arange(mask_size, dtype=numpy.float64) - light_radius
+    distance_from_center = numpy.hypot(pixel_offsets[:, None], pixel_offsets[None, :])
+
+    # fade out binnen de cirkel, alles wat er buiten valt moet donker zijn
+    fade_factor = distance_from_center / light_radius
+    darkness_alpha = numpy.where(
+        distance_from_center < light_radius,
+        255 * fade_factor ** falloff_exponent,
+        255,
+    ).astype(numpy.uint8)
+
+    # de kleur blijft zwart, alleen het alpha kanaal wordt gevuld
+    alpha_pixels = pygame.surfarray.pixels_alpha(light_mask)
+    alpha_pixels[:] = darkness_alpha
+    del alpha_pixels
+
+    _radial_light_mask_cache[cache_key] = light_mask
+    return light_mask
+
 
 class LightSystem:
     """Fog-of-war lighting: alleen binnen lichtcirkel zichtbaar, rest zwart"""
     
-    def __init__(self, screen_width, screen_height, light_radius=2040):
+    def __init__(self, screen_width, screen_height, light_radius=2040, light_falloff_exponent=2.0):
         self.screen_width_pixels = screen_width
         self.screen_height_pixels = screen_height
         self.light_radius_pixels = light_radius
+        self.light_falloff_exponent = light_falloff_exponent
         
         # rond masker voor player
         self.radial_light_mask = self._generate_radial_light_mask()
     
     def _generate_radial_light_mask(self):
         """Genereer perfect cirkel gradient mask voor zacht licht"""
-        mask_size = self.light_radius_pixels * 2
-        light_mask = pygame.Surface((mask_size, mask_size), pygame.SRCALPHA)
-        
-        mask_center_x = self.light_radius_pixels
-        mask_center_y = self.light_radius_pixels
-        
-        # bouw zachte gradient op elke pixel
-        for pixel_y in range(mask_size):
-            for pixel_x in range(mask_size):
-                # afstand van center
-                delta_x = pixel_x - mask_center_x
-                delta_y = pixel_y - mask_center_y
-                distance_from_center = math.hypot(delta_x, delta_y)
-                
-                if distance_from_center < self.light_radius_pixels:
-                    # fade out
-                    fade_factor = distance_from_center / self.light_radius_pixels
-                    darkness_alpha = int(255 * fade_factor * fade_factor)
-                else:
-                    # alles wat er buiten valt moet donker zijn
-                    darkness_alpha = 255
-                
-                light_mask.set_at((pixel_x, pixel_y), (0, 0, 0, darkness_alpha))
-        
-        return light_mask
-    
-    def apply_lighting(self, screen, player_position, player_size=(48, 92)):
-        """Pas fog-of-war toe: zwarte overlay met lichtcirkel bij speler"""
+        return generate_radial_light_mask(self.light_radius_pixels, self.light_falloff_exponent)
 
-        # zwarte overlay
-        darkness_overlay = pygame.Surface(
-            (self.screen_width_pixels, self.screen_height_pixels),
-            pygame.SRCALPHA
-        )
-        darkness_overlay.fill((0, 0, 0, 255))
+    def prepare_light_radii(self, light_radii):
+        """Bereken maskers voor meerdere stralen vooraf, zodat wisselen later geen hapering geeft"""
+        for light_radius in light_radii:
+            generate_radial_light_mask(light_radius, self.light_falloff_exponent)
 
+    def set_light_radius(self, light_radius, light_falloff_exponent=None):
+        """Wissel van lichtstraal (bijv. door een power-up), het masker komt uit de cache"""
+        if light_falloff_exponent is not None:
+            self.light_falloff_exponent = light_falloff_exponent
+        self.light_radius_pixels = light_radius
+        self.radial_light_mask = self._generate_radial_light_mask()
+    
+    def apply_lighting(self, screen, player_position, player_size=(48, 92)):
+        """
+        Pas fog-of-war toe: alles buiten de lichtcirkel zwart, zachte rand bij de speler.
+        Er wordt geen scherm-grote overlay meer gemaakt: het donkere gebied wordt met
+        snelle fills zwart gemaakt en alleen het vierkant van het masker wordt met alpha geblit.
+        """
         # waar het licht is
         player_center_x = int(player_position[0] + player_size[0] // 2)
         player_center_y = int(player_position[1] + player_size[1] // 2)
         light_mask_offset_x = player_center_x - self.light_radius_pixels
         light_mask_offset_y = player_center_y - self.light_radius_pixels
+        mask_size = self.light_radius_pixels * 2
+
+        # het deel van het scherm waar het masker op valt
+        light_rectangle = pygame.Rect(light_mask_offset_x, light_mask_offset_y, mask_size, mask_size)
+        visible_light_rectangle = light_rectangle.clip(screen.get_rect())
+
+        if visible_light_rectangle.width == 0 or visible_light_rectangle.height == 0:
+            # het licht valt helemaal buiten beeld, dus alles is donker
+            screen.fill(BLACK)
+            return
 
-        # blit er het licht overheen
-        darkness_overlay.blit(
-            self.radial_light_mask,
-            (light_mask_offset_x, light_mask_offset_y),
-            special_flags=pygame.BLEND_RGBA_MULT
-        )
+        # maak de stroken rondom het lichtvierkant helemaal zwart
+        screen_width = screen.get_width()
+        screen_height = screen.get_height()
+        if visible_light_rectangle.top > 0:
+            screen.fill(BLACK, (0, 0, screen_width, visible_light_rectangle.top))
+        if visible_light_rectangle.bottom < screen_height:
+            screen.fill(BLACK, (0, visible_light_rectangle.bottom, screen_width, screen_height - visible_light_rectangle.bottom))
+        if visible_light_rectangle.left > 0:
+            screen.fill(BLACK, (0, visible_light_rectangle.top, visible_light_rectangle.left, visible_light_rectangle.height))
+        if visible_light_rectangle.right < screen_width:
+            screen.fill(BLACK, (visible_light_rectangle.right, visible_light_rectangle.top, screen_width - visible_light_rectangle.right, visible_light_rectangle.height))
 
-        # laatste stap is helemaal donker maken van de rest
-        screen.blit(darkness_overlay, (0, 0))
\ No newline at end of file
+        # blit het masker zelf, alleen hier is alpha blending nodig
+        screen.blit(self.radial_light_mask, (light_mask_offset_x, light_mask_offset_y))
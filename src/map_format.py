@@ -0,0 +1,129 @@
+"""src/map_format.py"""
+import argparse
+import json
+import struct
+from typing import Dict, Tuple
+
+import numpy
+
+# Binair mapformaat:
+#   header: magic, versie, aantal lagen, breedte en hoogte van de map (in tegels)
+#   per laag: naam, type van de tegels (uint8 of uint16), breedte, hoogte en de offset van de data
+#   daarna de tegels van elke laag als een aaneengesloten array (rij na rij)
+BINARY_MAP_MAGIC = b"PMAP"
+BINARY_MAP_VERSION = 1
+BINARY_MAP_EXTENSION = ".pmap"
+
+MAP_HEADER_STRUCT = struct.Struct("<4sHHII")
+LAYER_HEADER_STRUCT = struct.Struct("<16sBIIQ")
+
+# Codes voor het type van de tegels in een laag
+TILE_DTYPE_CODES = {1: numpy.uint8, 2: numpy.uint16}
+
+# Data van een laag begint altijd op een veelvoud van dit aantal bytes
+DATA_ALIGNMENT = 8
+
+
+def _dtype_code_for_layer(layer_array: numpy.ndarray) -> int:
+    """Kiest het kleinste type waar alle tegels van een laag in passen."""
+    if layer_array.size == 0 or int(layer_array.max()) <= 0xFF:
+        return 1
+    return 2
+
+
+def write_binary_map(file_path: str, layers: Dict[str, list]) -> None:
+    """
+    Schrijft de lagen van een map (lijsten met rijen, of 2D arrays) naar een binair mapbestand.
+    De afmetingen van de map komen van de collision-laag.
+    """
+    layer_arrays = {}
+    for layer_name, layer_rows in layers.items():
+        layer_array = numpy.asarray(layer_rows, dtype=numpy.int64)
+        if layer_array.size == 0:
+            layer_array = layer_array.reshape(0, 0)
+        if layer_array.min(initial=0) < 0 or layer_array.max(initial=0) > 0xFFFF:
+            raise ValueError(f"Laag {layer_name} bevat tegels die niet in uint16 passen")
+        layer_arrays[layer_name] = layer_array
+
+    collision_array = layer_arrays.get("collision", numpy.zeros((0, 0), dtype=numpy.int64))
+    map_height, map_width = collision_array.shape
+
+    data_offset = MAP_HEADER_STRUCT.size + LAYER_HEADER_STRUCT.size * len(layer_arrays)
+    layer_headers = []
+    layer_data = []
+    for layer_name, layer_array in layer_arrays.items():
+        encoded_name = layer_name.encode("utf-8")
+        if len(encoded_name) > 16:
+            raise ValueError(f"Laagnaam te lang voor het binaire formaat: {layer_name}")
+
+        data_offset += -data_offset % DATA_ALIGNMENT
+        dtype_code = _dtype_code_for_layer(layer_array)
+        layer_height, layer_width = layer_array.shape
+        layer_headers.append(LAYER_HEADER_STRUCT.pack(encoded_name, dtype_code, layer_width, layer_height, data_offset))
+        layer_data.append((data_offset, layer_array.astype(TILE_DTYPE_CODES[dtype_code]).tobytes()))
+        data_offset += layer_array.size * numpy.dtype(TILE_DTYPE_CODES[dtype_code]).itemsize
+
+    with open(file_path, "wb") as file_handle:
+        file_handle.write(MAP_HEADER_STRUCT.pack(BINARY_MAP_MAGIC, BINARY_MAP_VERSION, len(layer_arrays), map_width, map_height))
+        for layer_header in layer_headers:
+            file_handle.write(layer_header)
+        for layer_offset, layer_bytes in layer_data:
+            file_handle.write(b"\0" * (layer_offset - file_handle.tell()))
+            file_handle.write(layer_bytes)
+
+
+def read_binary_map(file_path: str) -> Tuple[int, int, Dict[str, numpy.ndarray]]:
+    """
+    Opent een binair mapbestand en geeft (breedte, hoogte, lagen) terug.
+    Elke laag is een 2D numpy.memmap die direct naar het bestand wijst (copy-on-write,
+    dus veranderen kan wel, maar het bestand zelf blijft hetzelfde).
+    """
+    with open(file_path, "rb") as file_handle:
+        magic, version, layer_count, map_width, map_height = MAP_HEADER_STRUCT.unpack(file_handle.read(MAP_HEADER_STRUCT.size))
+        if magic != BINARY_MAP_MAGIC:
+            raise ValueError(f"Geen binair mapbestand: {file_path}")
+        if version != BINARY_MAP_VERSION:
+            raise ValueError(f"Onbekende versie van het mapformaat: {version}")
+
+        layer_headers = [
+            LAYER_HEADER_STRUCT.unpack(file_handle.read(LAYER_HEADER_STRUCT.size))
+            for _ in range(layer_count)
+        ]
+
+    layers = {}
+    for encoded_name, dtype_code, layer_width, layer_height, data_offset in layer_headers:
+        layer_name = encoded_name.rstrip(b"\0").decode("utf-8")
+        tile_dtype = TILE_DTYPE_CODES[dtype_code]
+        if layer_width == 0 or layer_height == 0:
+            # een lege laag (zoals de achtergrond bij oude maps), een memmap kan niet leeg zijn
+            layers[layer_name] = numpy.zeros((0, 0), dtype=tile_dtype)
+        else:
+            layers[layer_name] = numpy.memmap(
+                file_path, dtype=tile_dtype, mode="c", offset=data_offset, shape=(layer_height, layer_width)
+            )
+
+    return map_width, map_height, layers
+
+
+def convert_json_map(json_file_path: str, binary_file_path: str) -> None:
+    """Zet een JSON-map (met "grid" of met lagen) om naar het binaire formaat."""
+    with open(json_file_path, "r", encoding="utf-8") as file_handle:
+        data = json.load(file_handle)
+
+    layers = {"collision": data["grid"], "background": []} if "grid" in data else data
+    write_binary_map(binary_file_path, layers)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Zet JSON-maps om naar het binaire mapformaat.")
+    argument_parser.add_argument("map_files", nargs="+", help="de JSON-maps die omgezet moeten worden")
+    arguments = argument_parser.parse_args()
+
+    for json_file_path in arguments.map_files:
+        binary_file_path = json_file_path.rsplit(".", 1)[0] + BINARY_MAP_EXTENSION
+        convert_json_map(json_file_path, binary_file_path)
+        print(f"Map omgezet: {json_file_path} -> {binary_file_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,110 @@
 import pygame
-import random
+from src.game_random import gameplay_random, visual_random
 from src.colors import *
+from src.fonts import render_text
+
+# lijsten met goede en foute antwoorden voor de operator shooter
+PYTHON_OPERATORS = [
+    "+", "-", "*", "/", "**", "//", "%", 
+    "==", "!=", ">", "<", ">=", "<=", 
+    "and", "or", "not", "is", "in", 
+    "+=", "-="
+]
+
+FAKE_OPERATORS = [
+    "&&", "||", "!", "===", "!==", "++", "--", 
+    "->", "=>", "::", "?.", "??", "<<<", 
+    "instanceof", "typeof", "var", "let", 
+    "begin", "end", "nil"
+]
+
+# paren van (goede, foute) commando s voor het racespel
+TRACK_COMMANDS = [
+    ("print('ok')", "echo 'no'"),
+    ("len(a)", "a.size()"),
+    ("if a == 1:", "if a = 1:"),
+    ("def func():", "function func()"),
+    ("import math", "include math"),
+    ("elif x == 2:", "else if x == 2:"),
+    ("True", "true"),
+    ("None", "null"),
+    ("list.append(1)", "list.push(1)"),
+    ("for i in range(5):", "for(i=0;i<5;i++)"),
+    ("while x < 5:", "while(x < 5) {"),
+    ("int('5')", "(int)'5'"),
+    ("x in list", "list.contains(x)"),
+    ("type(x)", "typeof(x)"),
+    ("bool(1)", "boolean(1)"),
+    ("[1, 2, 3]", "{1, 2, 3}"),
+    ("math.pi", "math->pi"),
+    ("input('name')", "get('name')"),
+    ("isinstance(x, int)", "x instanceof int")
+]
+
+# vragen en antwoord opties voor de quiz
+QUIZ_QUESTIONS = [
+    {"q": "what is 10 // 3 in python", "o": ["1. 3.33", "2. 3", "3. 1"], "c": 1},
+    {"q": "how do you add an item to a list", "o": ["1. .append()", "2. .add()", "3. .push()"], "c": 0},
+    {"q": "what is the symbol for a dictionary", "o": ["1. []", "2. ()", "3. {}"], "c": 2},
+    {"q": "what is the output of 2 ** 3", "o": ["1. 6", "2. 8", "3. 9"], "c": 1},
+    {"q": "which keyword starts a function", "o": ["1. function", "2. def", "3. define"], "c": 1},
+    {"q": "how to check the length of a string", "o": ["1. len()", "2. count()", "3. size()"], "c": 0},
+    {"q": "what does bool(0) return", "o": ["1. True", "2. False", "3. None"], "c": 1},
+    {"q": "which one is a tuple", "o": ["1. (1, 2)", "2. [1, 2]", "3. {1, 2}"], "c": 0},
+    {"q": "how to run a loop five times", "o": ["1. range(4)", "2. range(5)", "3. range(6)"], "c": 1},
+    {"q": "how to import a library", "o": ["1. use math", "2. include math", "3. import math"], "c": 2},
+    {"q": "what symbol is used for comments", "o": ["1. //", "2. #", "3. --"], "c": 1},
+    {"q": "how to change a string to an integer", "o": ["1. int()", "2. str()", "3. float()"], "c": 0},
+    {"q": "what is the type of 5.5", "o": ["1. int", "2. string", "3. float"], "c": 2},
+    {"q": "how to remove the last item of a list", "o": ["1. .delete()", "2. .pop()", "3. .remove()"], "c": 1},
+    {"q": "how to write a multiline string", "o": ["1. '''text'''", "2. //text//", "3. --text--"], "c": 0},
+    {"q": "which operator checks for equality", "o": ["1. =", "2. is", "3. =="], "c": 2},
+    {"q": "which is a valid variable name", "o": ["1. 1_var", "2. my_var", "3. my-var"], "c": 1},
+    {"q": "what does strip() do", "o": ["1. remove spaces", "2. cut text", "3. delete text"], "c": 0},
+    {"q": "how to make an empty set", "o": ["1. set()", "2. {}", "3. []"], "c": 0},
+    {"q": "what is the result of 10 % 3", "o": ["1. 3", "2. 1", "3. 0"], "c": 1}
+]
+
+# Gedeelde schermpjes per grootte, zodat het openen van de telefoon niets nieuws aanmaakt
+_display_surface_cache = {}
+
+
+def prepare_minigame_text():
+    """
+    Rendert alle vaste teksten van de minigames vooraf, zodat het openen van de telefoon
+    en het spawnen van operators alleen nog gecachte oppervlakken gebruikt.
+    """
+    for operator_text in PYTHON_OPERATORS:
+        render_text(operator_text, 28, LIGHT_BLUE)
+    for operator_text in FAKE_OPERATORS:
+        render_text(operator_text, 28, WHITE)
+    for correct_text, wrong_text in TRACK_COMMANDS:
+        render_text(correct_text, 22, WHITE)
+        render_text(wrong_text, 22, WHITE)
+    for question_data in QUIZ_QUESTIONS:
+        render_text(question_data["q"], 28, WHITE)
+        for option_text in question_data["o"]:
+            render_text(option_text, 24, LIGHT_BLUE)
+    for score_points in range(0, 101, 5):
+        render_text(f"score {score_points} of 100", 22, GREEN)
+        render_text(f"score {score_points} van 100", 24, WHITE)
+    # de score van de operator shooter voor elke moeilijkheid, tot de laatste treffer voorbij het doel (+20)
+    for target_score_points in sorted({settings["target_score_points"] for settings in OPERATOR_DIFFICULTIES.values()}):
+        for score_points in range(0, target_score_points + 20, 5):
+            render_text(f"score {score_points} van {target_score_points}", 24, GREEN)
+    render_text("Well done", 28, GREEN)
+    render_text("WRONG", 28, RED)
+
+
+def _get_display_surface(width_pixels, height_pixels):
+    """Geeft het gedeelde schermpje voor deze grootte terug."""
+    size_key = (width_pixels, height_pixels)
+    display_surface = _display_surface_cache.get(size_key)
+    if display_surface is None:
+        display_surface = pygame.Surface(size_key)
+        _display_surface_cache[size_key] = display_surface
+    return display_surface
+
 
 class CellphoneInterface:
     def __init__(self, screen_width_pixels, screen_height_pixels, active_logic_module):
@@ -21,7 +125,8 @@ class CellphoneInterface:
         
         # variabelen voor het schudden van de telefoon bij fouten
         self.shake_timer_frames = 0
-        self.display_surface = pygame.Surface((self.display_width_pixels, self.display_height_pixels))
+        self.shake_amplitude_pixels = 7
+        self.display_surface = _get_display_surface(self.display_width_pixels, self.display_height_pixels)
 
     def handle_input(self, event):
         # geef de toetsenbordinvoer door aan de actieve minigame
@@ -52,8 +157,8 @@ class CellphoneInterface:
         render_y = self.base_position_coordinate_y
         
         if self.shake_timer_frames > 0:
-            render_x += random.randint(-7, 7)
-            render_y += random.randint(-7, 7)
+            render_x += visual_random.randint(-self.shake_amplitude_pixels, self.shake_amplitude_pixels)
+            render_y += visual_random.randint(-self.shake_amplitude_pixels, self.shake_amplitude_pixels)
             
         # teken de buitenkant van de telefoon met afgeronde hoeken
         phone_rect = pygame.Rect(render_x, render_y, self.phone_width_pixels, self.phone_height_pixels)
@@ -68,19 +173,100 @@ class CellphoneInterface:
         # blit het schermpje op de juiste plek binnen de behuizing
         main_surface.blit(self.display_surface, (render_x + self.phone_padding_pixels, render_y + 50))
 
+    def get_maximum_screen_rect(self):
+        """Het gebied waarin de telefoon getekend kan worden, inclusief het schudden."""
+        return pygame.Rect(
+            self.base_position_coordinate_x - self.shake_amplitude_pixels,
+            self.base_position_coordinate_y - self.shake_amplitude_pixels,
+            self.phone_width_pixels + self.shake_amplitude_pixels * 2,
+            self.phone_height_pixels + self.shake_amplitude_pixels * 2
+        )
+
+# Instellingen van de operator shooter per moeilijkheid.
+# Bij "bullet_hell" schiet de speler zolang de spatiebalk vastgehouden wordt een waaier van kogels,
+# zodat er honderden kogels tegelijk op het schermpje staan.
+OPERATOR_DIFFICULTIES = {
+    "normal": {"spawn_interval_frames": 45, "fire_interval_frames": None, "bullet_offsets": (0,), "target_score_points": 100},
+    "bullet_hell": {"spawn_interval_frames": 8, "fire_interval_frames": 1, "bullet_offsets": (-36, -24, -12, 0, 12, 24, 36), "target_score_points": 300},
+}
+
+# Grootte van een vallende operator voor de botsingen, en de breedte van een kolom van de broadphase
+OPERATOR_WIDTH_PIXELS = 40
+OPERATOR_HEIGHT_PIXELS = 30
+COLLISION_COLUMN_WIDTH_PIXELS = 40
+
+
+class ObjectPool:
+    """
+    Lijst met actieve objecten plus een voorraad weggehaalde objecten die opnieuw gebruikt worden.
+    Weghalen verplaatst het laatste object naar het gat (geen list.remove), de volgorde verandert dus.
+    """
+
+    def __init__(self, object_class):
+        self.object_class = object_class
+        self.active_objects = []
+        self.free_objects = []
+
+    def acquire(self, *reset_arguments):
+        """
+        Zet een object bij de actieve objecten: een uit de voorraad via reset, of anders een nieuw
+        (de klasse krijgt dezelfde argumenten als reset).
+        """
+        if self.free_objects:
+            pooled_object = self.free_objects.pop()
+            pooled_object.reset(*reset_arguments)
+        else:
+            pooled_object = self.object_class(*reset_arguments)
+        self.active_objects.append(pooled_object)
+        return pooled_object
+
+    def release_at(self, object_index):
+        """Haalt het actieve object op deze index weg, het laatste object komt op zijn plek."""
+        active_objects = self.active_objects
+        released_object = active_objects[object_index]
+        last_object = active_objects.pop()
+        if object_index < len(active_objects):
+            active_objects[object_index] = last_object
+        self.free_objects.append(released_object)
+
+    def __len__(self):
+        return len(self.active_objects)
+
+    def __iter__(self):
+        return iter(self.active_objects)
+
+
+class Projectile:
+    __slots__ = ("position_coordinate_x", "position_coordinate_y", "movement_speed")
+
+    def __init__(self, position_coordinate_x, position_coordinate_y, movement_speed=12):
+        # een kogel van de operator shooter, schiet recht omhoog
+        self.reset(position_coordinate_x, position_coordinate_y, movement_speed)
+
+    def reset(self, position_coordinate_x, position_coordinate_y, movement_speed=12):
+        self.position_coordinate_x = position_coordinate_x
+        self.position_coordinate_y = position_coordinate_y
+        self.movement_speed = movement_speed
+
+
 class FallingOperator:
+    __slots__ = ("is_python_operator", "text_content", "position_coordinate_x", "position_coordinate_y", "movement_speed")
+
     def __init__(self, width_pixels, python_operators_list, fake_operators_list):
         # deze klasse maakt een vallend tekstobject aan
-        self.is_python_operator = random.choice([True, False])
+        self.reset(width_pixels, python_operators_list, fake_operators_list)
+
+    def reset(self, width_pixels, python_operators_list, fake_operators_list):
+        # kies een nieuwe operator en begin weer boven het schermpje (ook voor een hergebruikt object)
+        self.is_python_operator = gameplay_random.choice([True, False])
         if self.is_python_operator:
-            self.text_content = random.choice(python_operators_list)
+            self.text_content = gameplay_random.choice(python_operators_list)
         else:
-            self.text_content = random.choice(fake_operators_list)
+            self.text_content = gameplay_random.choice(fake_operators_list)
             
-        self.position_coordinate_x = random.randint(30, width_pixels - 60)
+        self.position_coordinate_x = gameplay_random.randint(30, width_pixels - 60)
         self.position_coordinate_y = -50
-        self.movement_speed = random.uniform(2.0, 4.0)
-        self.font_style = pygame.font.Font(None, 28)
+        self.movement_speed = gameplay_random.uniform(2.0, 4.0)
 
     def update(self):
         # laat het object zakken
@@ -89,11 +275,11 @@ class FallingOperator:
     def draw(self, surface):
         # kies de kleur op basis van of het een echte python operator is
         text_color = LIGHT_BLUE if self.is_python_operator else WHITE
-        rendered_text = self.font_style.render(self.text_content, True, text_color)
+        rendered_text = render_text(self.text_content, 28, text_color)
         surface.blit(rendered_text, (self.position_coordinate_x, self.position_coordinate_y))
 
 class OperatorMinigame:
-    def __init__(self, width_pixels, height_pixels):
+    def __init__(self, width_pixels, height_pixels, difficulty="normal"):
         # instellingen voor het schietspelletje
         self.display_width_pixels = width_pixels
         self.display_height_pixels = height_pixels
@@ -101,75 +287,148 @@ class OperatorMinigame:
         self.total_score_points = 0
         self.shake_requested = False
         self.player_position_x = width_pixels // 2
-        self.projectiles_list = []
-        self.enemies_list = []
         self.spawn_timer_frames = 0
-        
+
+        # kogels en operators in pools, weggehaalde objecten worden hergebruikt
+        self.projectile_pool = ObjectPool(Projectile)
+        self.operator_pool = ObjectPool(FallingOperator)
+        # de kogels per kolom van het schermpje, elke frame opnieuw gevuld
+        self.projectile_columns = [[] for _ in range(width_pixels // COLLISION_COLUMN_WIDTH_PIXELS + 1)]
+
+        # instellingen van de gekozen moeilijkheid
+        difficulty_settings = OPERATOR_DIFFICULTIES[difficulty]
+        self.difficulty = difficulty
+        self.operator_spawn_interval_frames = difficulty_settings["spawn_interval_frames"]
+        self.fire_interval_frames = difficulty_settings["fire_interval_frames"]
+        self.bullet_offsets = difficulty_settings["bullet_offsets"]
+        self.target_score_points = difficulty_settings["target_score_points"]
+        self.fire_timer_frames = 0
+
+        # welke pijltjestoetsen (en bij bullet hell de spatiebalk) ingedrukt zijn, bijgehouden via de toets events
+        self.is_moving_left = False
+        self.is_moving_right = False
+        self.is_firing = False
+
         # lijsten met goede en foute antwoorden
-        self.python_operators = [
-            "+", "-", "*", "/", "**", "//", "%", 
-            "==", "!=", ">", "<", ">=", "<=", 
-            "and", "or", "not", "is", "in", 
-            "+=", "-="
-        ]
-        
-        self.fake_operators = [
-            "&&", "||", "!", "===", "!==", "++", "--", 
-            "->", "=>", "::", "?.", "??", "<<<", 
-            "instanceof", "typeof", "var", "let", 
-            "begin", "end", "nil"
-        ]
+        self.python_operators = PYTHON_OPERATORS
+        self.fake_operators = FAKE_OPERATORS
 
     def handle_input(self, event):
         # schiet met de spatiebalk
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            self.projectiles_list.append({"x": self.player_position_x, "y": self.display_height_pixels - 60, "speed": 12})
+            if self.fire_interval_frames is None:
+                self.fire_projectiles()
+            else:
+                # vasthouden schiet elke fire_interval_frames, beginnend bij deze frame
+                self.fire_timer_frames = 0
+
+        # onthoud of de pijltjestoetsen vast worden gehouden
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            is_key_down = event.type == pygame.KEYDOWN
+            if event.key == pygame.K_LEFT: self.is_moving_left = is_key_down
+            if event.key == pygame.K_RIGHT: self.is_moving_right = is_key_down
+            if event.key == pygame.K_SPACE: self.is_firing = is_key_down
+
+    def fire_projectiles(self):
+        """Schiet een kogel per offset vanaf de speler."""
+        for bullet_offset in self.bullet_offsets:
+            projectile_position_x = self.player_position_x + bullet_offset
+            if 0 <= projectile_position_x < self.display_width_pixels:
+                self.projectile_pool.acquire(projectile_position_x, self.display_height_pixels - 60)
 
     def update(self):
         # beweging van de speler met de pijltjestoetsen
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]: self.player_position_x = max(20, self.player_position_x - 6)
-        if keys[pygame.K_RIGHT]: self.player_position_x = min(self.display_width_pixels - 20, self.player_position_x + 6)
+        if self.is_moving_left: self.player_position_x = max(20, self.player_position_x - 6)
+        if self.is_moving_right: self.player_position_x = min(self.display_width_pixels - 20, self.player_position_x + 6)
+
+        # bij bullet hell schiet de speler zolang de spatiebalk vast wordt gehouden
+        if self.is_firing and self.fire_interval_frames is not None:
+            if self.fire_timer_frames <= 0:
+                self.fire_projectiles()
+                self.fire_timer_frames = self.fire_interval_frames
+            self.fire_timer_frames -= 1
         
         # beheer het spawnen van nieuwe vijanden
         self.spawn_timer_frames += 1
-        if self.spawn_timer_frames >= 45:
-            self.enemies_list.append(FallingOperator(self.display_width_pixels, self.python_operators, self.fake_operators))
+        if self.spawn_timer_frames >= self.operator_spawn_interval_frames:
+            self.operator_pool.acquire(self.display_width_pixels, self.python_operators, self.fake_operators)
             self.spawn_timer_frames = 0
             
-        # werk projectielen bij en verwijder ze als ze buiten beeld zijn
-        for projectile in self.projectiles_list[:]:
-            projectile["y"] -= projectile["speed"]
-            if projectile["y"] < 0: self.projectiles_list.remove(projectile)
-            
-        # controleer op botsingen tussen kogels en tekst
-        for enemy in self.enemies_list[:]:
+        # werk projectielen bij en verwijder ze als ze buiten beeld zijn,
+        # de kogels die overblijven gaan in de kolom van hun x (kogels bewegen alleen verticaal)
+        projectile_pool = self.projectile_pool
+        active_projectiles = projectile_pool.active_objects
+        projectile_columns = self.projectile_columns
+        for projectile_column in projectile_columns:
+            projectile_column.clear()
+        projectile_index = len(active_projectiles) - 1
+        while projectile_index >= 0:
+            projectile = active_projectiles[projectile_index]
+            projectile.position_coordinate_y -= projectile.movement_speed
+            if projectile.position_coordinate_y < 0:
+                projectile_pool.release_at(projectile_index)
+            projectile_index -= 1
+        for projectile in active_projectiles:
+            projectile_columns[int(projectile.position_coordinate_x) // COLLISION_COLUMN_WIDTH_PIXELS].append(projectile)
+
+        # controleer op botsingen tussen kogels en tekst, alleen met de kogels in de kolommen onder de operator
+        operator_pool = self.operator_pool
+        active_operators = operator_pool.active_objects
+        hit_projectiles = set()
+        last_column_index = len(projectile_columns) - 1
+        operator_index = len(active_operators) - 1
+        while operator_index >= 0:
+            enemy = active_operators[operator_index]
             enemy.update()
-            enemy_rect = pygame.Rect(enemy.position_coordinate_x, enemy.position_coordinate_y, 40, 30)
-            for projectile in self.projectiles_list[:]:
-                if enemy_rect.collidepoint(projectile["x"], projectile["y"]):
-                    if not enemy.is_python_operator:
-                        self.total_score_points += 20
-                    else:
-                        self.total_score_points = max(0, self.total_score_points - 15)
-                        self.shake_requested = True
-                    if enemy in self.enemies_list: self.enemies_list.remove(enemy)
-                    if projectile in self.projectiles_list: self.projectiles_list.remove(projectile)
-            if enemy.position_coordinate_y > self.display_height_pixels: self.enemies_list.remove(enemy)
+            # dezelfde afronding als een pygame.Rect
+            enemy_left = int(enemy.position_coordinate_x)
+            enemy_top = int(enemy.position_coordinate_y)
+            first_column_index = max(0, enemy_left // COLLISION_COLUMN_WIDTH_PIXELS)
+            final_column_index = min(last_column_index, (enemy_left + OPERATOR_WIDTH_PIXELS - 1) // COLLISION_COLUMN_WIDTH_PIXELS)
+
+            hit_projectile = None
+            for column_index in range(first_column_index, final_column_index + 1):
+                for projectile in projectile_columns[column_index]:
+                    if (enemy_left <= projectile.position_coordinate_x < enemy_left + OPERATOR_WIDTH_PIXELS and
+                            enemy_top <= projectile.position_coordinate_y < enemy_top + OPERATOR_HEIGHT_PIXELS and
+                            projectile not in hit_projectiles):
+                        hit_projectile = projectile
+                        break
+                if hit_projectile is not None:
+                    break
+
+            if hit_projectile is not None:
+                if not enemy.is_python_operator:
+                    self.total_score_points += 20
+                else:
+                    self.total_score_points = max(0, self.total_score_points - 15)
+                    self.shake_requested = True
+                hit_projectiles.add(hit_projectile)
+                operator_pool.release_at(operator_index)
+            elif enemy.position_coordinate_y > self.display_height_pixels:
+                operator_pool.release_at(operator_index)
+            operator_index -= 1
+
+        # haal de kogels weg die iets geraakt hebben
+        if hit_projectiles:
+            projectile_index = len(active_projectiles) - 1
+            while projectile_index >= 0:
+                if active_projectiles[projectile_index] in hit_projectiles:
+                    projectile_pool.release_at(projectile_index)
+                projectile_index -= 1
         
-        # eindig het spel bij honderd punten
-        if self.total_score_points >= 100: self.is_active = False
+        # eindig het spel bij genoeg punten
+        if self.total_score_points >= self.target_score_points: self.is_active = False
 
     def draw(self, surface):
         # teken de speler en de kogels
         pygame.draw.rect(surface, GREEN, (self.player_position_x - 15, self.display_height_pixels - 60, 30, 20))
-        for projectile in self.projectiles_list:
-            pygame.draw.circle(surface, WHITE, (int(projectile["x"]), int(projectile["y"])), 4)
-        for enemy in self.enemies_list: enemy.draw(surface)
+        for projectile in self.projectile_pool:
+            pygame.draw.circle(surface, WHITE, (int(projectile.position_coordinate_x), int(projectile.position_coordinate_y)), 4)
+        for enemy in self.operator_pool: enemy.draw(surface)
         
         # toon de huidige score onderaan
-        score_font = pygame.font.Font(None, 24)
-        score_text = score_font.render(f"score {self.total_score_points} van 100", True, GREEN)
+        score_text = render_text(f"score {self.total_score_points} van {self.target_score_points}", 24, GREEN)
         surface.blit(score_text, (10, self.display_height_pixels - 30))
 
 class PythonTrackMinigame:
@@ -183,28 +442,7 @@ class PythonTrackMinigame:
         self.current_lane_index = 0
         self.spawn_timer_frames = 0
         self.falling_objects_list = []
-        self.commands_list = [
-            ("print('ok')", "echo 'no'"),
-            ("len(a)", "a.size()"),
-            ("if a == 1:", "if a = 1:"),
-            ("def func():", "function func()"),
-            ("import math", "include math"),
-            ("elif x == 2:", "else if x == 2:"),
-            ("True", "true"),
-            ("None", "null"),
-            ("list.append(1)", "list.push(1)"),
-            ("for i in range(5):", "for(i=0;i<5;i++)"),
-            ("while x < 5:", "while(x < 5) {"),
-            ("int('5')", "(int)'5'"),
-            ("x in list", "list.contains(x)"),
-            ("type(x)", "typeof(x)"),
-            ("bool(1)", "boolean(1)"),
-            ("[1, 2, 3]", "{1, 2, 3}"),
-            ("math.pi", "math->pi"),
-            ("input('name')", "get('name')"),
-            ("isinstance(x, int)", "x instanceof int")
-        ]
-
+        self.commands_list = TRACK_COMMANDS
     def handle_input(self, event):
         # wissel van baan met de pijltjes of a en d
         if event.type == pygame.KEYDOWN:
@@ -215,8 +453,8 @@ class PythonTrackMinigame:
         # maak elke 120 frames / 2 seconden een nieuw paar commando s aan
         self.spawn_timer_frames += 1
         if self.spawn_timer_frames >= 120:
-            correct_text, wrong_text = random.choice(self.commands_list)
-            lane_position = random.randint(0, 1)
+            correct_text, wrong_text = gameplay_random.choice(self.commands_list)
+            lane_position = gameplay_random.randint(0, 1)
             self.falling_objects_list.append({'text': correct_text, 'is_correct': True, 'lane': lane_position, 'y': -30})
             self.falling_objects_list.append({'text': wrong_text, 'is_correct': False, 'lane': 1 - lane_position, 'y': -30})
             self.spawn_timer_frames = 0
@@ -246,14 +484,13 @@ class PythonTrackMinigame:
         pygame.draw.rect(surface, LIGHT_BLUE, (lane_center_x - 20, self.display_height_pixels - 80, 40, 20))
         
         # teken alle vallende commando s
-        font_style = pygame.font.Font(None, 22)
         for obj in self.falling_objects_list:
-            text_surface = font_style.render(obj['text'], True, WHITE)
+            text_surface = render_text(obj['text'], 22, WHITE)
             text_x = (obj['lane'] * (self.display_width_pixels // 2)) + (self.display_width_pixels // 4)
             surface.blit(text_surface, text_surface.get_rect(center=(text_x, obj['y'])))
             
         # toon de score onderaan
-        score_text = font_style.render(f"score {self.total_score_points} of 100", True, GREEN)
+        score_text = render_text(f"score {self.total_score_points} of 100", 22, GREEN)
         surface.blit(score_text, (10, self.display_height_pixels - 30))
 
 class PythonQuizMinigame:
@@ -268,31 +505,9 @@ class PythonQuizMinigame:
         self.feedback_timer_frames = 0
         self.feedback_message = ""
         
-        # lijst met vragen en antwoord opties
-        self.questions_data = [
-            {"q": "what is 10 // 3 in python", "o": ["1. 3.33", "2. 3", "3. 1"], "c": 1},
-            {"q": "how do you add an item to a list", "o": ["1. .append()", "2. .add()", "3. .push()"], "c": 0},
-            {"q": "what is the symbol for a dictionary", "o": ["1. []", "2. ()", "3. {}"], "c": 2},
-            {"q": "what is the output of 2 ** 3", "o": ["1. 6", "2. 8", "3. 9"], "c": 1},
-            {"q": "which keyword starts a function", "o": ["1. function", "2. def", "3. define"], "c": 1},
-            {"q": "how to check the length of a string", "o": ["1. len()", "2. count()", "3. size()"], "c": 0},
-            {"q": "what does bool(0) return", "o": ["1. True", "2. False", "3. None"], "c": 1},
-            {"q": "which one is a tuple", "o": ["1. (1, 2)", "2. [1, 2]", "3. {1, 2}"], "c": 0},
-            {"q": "how to run a loop five times", "o": ["1. range(4)", "2. range(5)", "3. range(6)"], "c": 1},
-            {"q": "how to import a library", "o": ["1. use math", "2. include math", "3. import math"], "c": 2},
-            {"q": "what symbol is used for comments", "o": ["1. //", "2. #", "3. --"], "c": 1},
-            {"q": "how to change a string to an integer", "o": ["1. int()", "2. str()", "3. float()"], "c": 0},
-            {"q": "what is the type of 5.5", "o": ["1. int", "2. string", "3. float"], "c": 2},
-            {"q": "how to remove the last item of a list", "o": ["1. .delete()", "2. .pop()", "3. .remove()"], "c": 1},
-            {"q": "how to write a multiline string", "o": ["1. '''text'''", "2. //text//", "3. --text--"], "c": 0},
-            {"q": "which operator checks for equality", "o": ["1. =", "2. is", "3. =="], "c": 2},
-            {"q": "which is a valid variable name", "o": ["1. 1_var", "2. my_var", "3. my-var"], "c": 1},
-            {"q": "what does strip() do", "o": ["1. remove spaces", "2. cut text", "3. delete text"], "c": 0},
-            {"q": "how to make an empty set", "o": ["1. set()", "2. {}", "3. []"], "c": 0},
-            {"q": "what is the result of 10 % 3", "o": ["1. 3", "2. 1", "3. 0"], "c": 1}
-        ]
-
-        random.shuffle(self.questions_data)
+        # eigen kopie van de vragen, want de volgorde wordt geschud
+        self.questions_data = list(QUIZ_QUESTIONS)
+        gameplay_random.shuffle(self.questions_data)
 
     def handle_input(self, event):
         # verwerk de antwoord keuze van de speler
@@ -324,16 +539,12 @@ class PythonQuizMinigame:
                     self.is_active = False
 
     def draw(self, surface):
-        # fonts voor de tekst
-        question_font = pygame.font.Font(None, 28)
-        option_font = pygame.font.Font(None, 24)
-        
         # teken de huidige vraag en opties
         if self.current_question_index < len(self.questions_data):
             current_question_data = self.questions_data[self.current_question_index]
-            surface.blit(question_font.render(current_question_data["q"], True, WHITE), (20, 50))
+            surface.blit(render_text(current_question_data["q"], 28, WHITE), (20, 50))
             for index, option in enumerate(current_question_data["o"]):
-                surface.blit(option_font.render(option, True, LIGHT_BLUE), (30, 120 + index * 70))
+                surface.blit(render_text(option, 24, LIGHT_BLUE), (30, 120 + index * 70))
                 
         if self.feedback_message:
             if "well done" in self.feedback_message.lower(): 
@@ -341,7 +552,7 @@ class PythonQuizMinigame:
             else: 
                 feedback_color = RED
                 
-            feedback_surface = question_font.render(self.feedback_message, True, feedback_color)
+            feedback_surface = render_text(self.feedback_message, 28, feedback_color)
             
             # bereken de positie voor het midden van het scherm
             render_coordinate_x = self.display_width_pixels // 2 - 40
@@ -350,5 +561,5 @@ class PythonQuizMinigame:
             
         # toon de voortgang van de score onderaan het scherm
         score_status_text = f"score {self.total_score_points} van 100"
-        progress_text = option_font.render(score_status_text, True, WHITE)
+        progress_text = render_text(score_status_text, 24, WHITE)
         surface.blit(progress_text, (10, self.display_height_pixels - 30))
\ No newline at end of file
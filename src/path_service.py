@@ -0,0 +1,98 @@
+# src/path_service.py
+from concurrent.futures import ThreadPoolExecutor
+
+from src.pathfinding import find_path
+
+
+class PathRequestService:
+    """
+    Rekent A* (of Jump Point Search) paden uit op een pool van worker threads, zodat een lange zoektocht
+    (doel onbereikbaar, grote map) het frame niet blokkeert.
+    Vijanden vragen een pad aan en krijgen het resultaat op een later frame via take_result;
+    tot die tijd lopen ze door over hun oude pad. Een nieuwe aanvraag van dezelfde vijand
+    vervangt de oude, waarvan het resultaat dan wordt weggegooid.
+    Elke zoektocht gebruikt een onveranderlijke snapshot van het navigatie-grid.
+    """
+
+    def __init__(self, worker_count=2, executor=None):
+        self.executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=worker_count, thread_name_prefix="pathfinding"
+        )
+        # aanvrager -> future van de nieuwste aanvraag
+        self.pending_requests = {}
+        # aanvrager -> pad (lijst met waypoints, of None als er geen pad is)
+        self.completed_results = {}
+
+        # snapshot van het laatst gebruikte navigatie-grid, wordt pas opnieuw gemaakt als het grid verandert
+        self.snapshot_source_grid = None
+        self.navigation_snapshot = None
+
+        self.submitted_request_count = 0
+        self.superseded_request_count = 0
+
+    def request_path(self, requester, start_position, goal_position, navigation_grid, algorithm="a_star"):
+        """
+        Zet een zoektocht in de wachtrij. Een nog lopende aanvraag van dezelfde aanvrager
+        wordt geannuleerd (of genegeerd als hij al bezig is).
+        algorithm is een van de SEARCH_ALGORITHMS van find_path.
+        """
+        if navigation_grid is not self.snapshot_source_grid:
+            self.snapshot_source_grid = navigation_grid
+            self.navigation_snapshot = navigation_grid.snapshot()
+
+        previous_future = self.pending_requests.get(requester)
+        if previous_future is not None:
+            previous_future.cancel()
+            self.superseded_request_count += 1
+
+        self.pending_requests[requester] = self.executor.submit(
+            find_path,
+            start_pos=start_position,
+            goal_pos=goal_position,
+            walls=self.navigation_snapshot,
+            tile_size=self.navigation_snapshot.tile_size,
+            algorithm=algorithm
+        )
+        self.submitted_request_count += 1
+
+    def poll_results(self):
+        """
+        Haalt de klaar zijnde zoektochten op (een keer per tick aanroepen).
+        Geeft het aantal nieuw afgeleverde paden terug.
+        """
+        delivered_count = 0
+        for requester, future in list(self.pending_requests.items()):
+            if not future.done():
+                continue
+            del self.pending_requests[requester]
+            if future.cancelled():
+                continue
+
+            try:
+                self.completed_results[requester] = future.result()
+            except Exception as error_message:
+                # de vijand houdt dan gewoon zijn oude pad
+                print(f"Fout opgetreden bij het zoeken van een pad: {error_message}")
+                continue
+            delivered_count += 1
+        return delivered_count
+
+    def has_pending_request(self, requester):
+        """Geeft aan of er voor deze aanvrager nog een zoektocht loopt."""
+        return requester in self.pending_requests
+
+    def has_result(self, requester):
+        """Geeft aan of er een afgeleverd pad klaarstaat voor deze aanvrager."""
+        return requester in self.completed_results
+
+    def take_result(self, requester):
+        """Geeft het afgeleverde pad terug en haalt het weg (None als er geen pad gevonden is)."""
+        return self.completed_results.pop(requester, None)
+
+    def shutdown(self):
+        """Annuleert alle wachtende zoektochten en stopt de workers."""
+        for future in self.pending_requests.values():
+            future.cancel()
+        self.pending_requests.clear()
+        self.completed_results.clear()
+        self.executor.shutdown(wait=False)
@@ -1,124 +1,595 @@
 # src/pathfinding.py
 import heapq
+from array import array
 
-def a_star(start_pos, goal_pos, walls, tile_size=48, grid_width=100, grid_height=100):
+import numpy
+
+# Recht en diagonaal, met de kosten per stap: 1.4 voor diagonaal (wortel 2), 1.0 voor recht
+NEIGHBOR_DIRECTIONS = [
+    # Recht
+    (0, 1, 1.0), (1, 0, 1.0), (0, -1, 1.0), (-1, 0, 1.0),
+    # Diagonaal
+    (1, 1, 1.4), (1, -1, 1.4), (-1, 1, 1.4), (-1, -1, 1.4),
+]
+
+# De zoekalgoritmes die find_path kent: gewone A* en Jump Point Search
+SEARCH_ALGORITHMS = ("a_star", "jump_point")
+
+
+class NavGrid:
     """
-    A* pathfinding op een grid met duidelijke variabelenamen.
+    Navigatie-grid voor pathfinding: een plat bytearray met een byte per tegel
+    (1 = bezet) en de echte afmetingen van de map.
+    Wordt een keer opgebouwd uit de collision-laag en alleen opnieuw
+    gemaakt als de map verandert, zodat een zoekopdracht alleen nog zoekt.
     """
-    
-    # hulp methods
-    def world_to_grid(world_x, world_y):
+
+    def __init__(self, grid_width, grid_height, tile_size=48, blocked_tiles=None):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.tile_size = tile_size
+        self.blocked_tiles = blocked_tiles if blocked_tiles is not None else bytearray(grid_width * grid_height)
+        # opzoektabellen voor Jump Point Search, worden pas gemaakt als het nodig is
+        self.jump_point_tables = None
+
+    @classmethod
+    def from_walls(cls, walls, tile_size=48, grid_width=100, grid_height=100):
+        """Bouwt het grid uit een lijst met muur-rects (de oude a_star invoer)."""
+        navigation_grid = cls(grid_width, grid_height, tile_size)
+
+        for wall in walls:
+            # De rect van de muur in pixels
+            wall_x, wall_y, wall_width, wall_height = wall
+
+            # Bereken welke grid-vakjes deze muur bedekt
+            start_tile_x = int(wall_x // tile_size)
+            start_tile_y = int(wall_y // tile_size)
+
+            # Hoeveel tegels breed en hoog is deze muur? (een extra rand rechts en onder
+            # geeft de brede honden wat ruimte, zodat ze niet in smalle gaten vastlopen)
+            tiles_wide = int(wall_width / tile_size) + 1
+            tiles_high = int(wall_height / tile_size) + 1
+
+            for offset_y in range(tiles_high):
+                for offset_x in range(tiles_wide):
+                    navigation_grid.mark_blocked(start_tile_x + offset_x, start_tile_y + offset_y)
+
+        return navigation_grid
+
+    @classmethod
+    def from_tilemap(cls, tilemap):
+        """
+        Bouwt het grid direct uit de blokkerende tegels van een Tilemap.
+        Geeft hetzelfde resultaat als from_walls(tilemap.walls), inclusief de extra rand.
+        """
+        grid_width = tilemap.map_width
+        grid_height = tilemap.map_height
+        navigation_grid = cls(grid_width, grid_height, tilemap.tile_size)
+        if grid_width == 0 or grid_height == 0:
+            return navigation_grid
+
+        # elke blokkerende tegel bezet ook de tegel rechts, onder en rechtsonder
+        source_tiles = numpy.frombuffer(tilemap.blocking_tiles, dtype=numpy.uint8).reshape(grid_height, grid_width)
+        blocked_tiles = source_tiles.copy()
+        blocked_tiles[:, 1:] |= source_tiles[:, :-1]
+        blocked_tiles[1:, :] |= source_tiles[:-1, :]
+        blocked_tiles[1:, 1:] |= source_tiles[:-1, :-1]
+        navigation_grid.blocked_tiles[:] = blocked_tiles.tobytes()
+
+        return navigation_grid
+
+    def snapshot(self):
+        """
+        Geeft een onveranderlijke kopie van het grid terug (de tegels als bytes),
+        die veilig in een andere thread doorzocht kan worden.
+        """
+        return NavGrid(self.grid_width, self.grid_height, self.tile_size, bytes(self.blocked_tiles))
+
+    def mark_blocked(self, grid_x, grid_y):
+        """Markeert een tegel als bezet (tegels buiten het grid worden genegeerd)."""
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            self.blocked_tiles[grid_y * self.grid_width + grid_x] = 1
+            self.jump_point_tables = None
+
+    def get_jump_point_tables(self):
+        """Geeft de opzoektabellen voor Jump Point Search terug (een keer gemaakt per grid)."""
+        if self.jump_point_tables is None:
+            self.jump_point_tables = JumpPointTables(self)
+        return self.jump_point_tables
+
+    def is_blocked(self, grid_x, grid_y):
+        """Geeft True terug als de tegel bezet is of buiten het grid valt."""
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            return self.blocked_tiles[grid_y * self.grid_width + grid_x] == 1
+        return True
+
+    def world_to_grid(self, world_x, world_y):
         """Van pixel-coördinaten naar grid-index (rij/kolom)."""
-        return int(world_x // tile_size), int(world_y // tile_size)
-    
-    def grid_to_world(grid_x, grid_y):
+        return int(world_x // self.tile_size), int(world_y // self.tile_size)
+
+    def grid_to_world(self, grid_x, grid_y):
         """Van grid-index naar het midden van de tegel in pixels."""
-        center_offset = tile_size // 2
-        return grid_x * tile_size + center_offset, grid_y * tile_size + center_offset
+        center_offset = self.tile_size // 2
+        return grid_x * self.tile_size + center_offset, grid_y * self.tile_size + center_offset
+
+
+class JumpPointTables:
+    """
+    Opzoektabellen voor Jump Point Search, gemaakt uit een NavGrid.
+    Het grid krijgt een rand van bezette tegels (breedte + 2 en hoogte + 2), zodat een zoektocht
+    nooit hoeft te controleren of hij buiten het grid komt. Er is een versie per rij en een
+    gekantelde versie per kolom, plus per tegel of hij bezet is terwijl de volgende (of vorige)
+    tegel vrij is: zo kan een rechte sprong met bytes.find in een keer naar de eerste muur
+    of gedwongen buur zoeken in plaats van tegel voor tegel.
+    """
+
+    def __init__(self, navigation_grid):
+        self.padded_width = navigation_grid.grid_width + 2
+        self.padded_height = navigation_grid.grid_height + 2
+
+        source_tiles = numpy.frombuffer(navigation_grid.blocked_tiles, dtype=numpy.uint8).reshape(
+            navigation_grid.grid_height, navigation_grid.grid_width
+        )
+        padded_tiles = numpy.pad(source_tiles, 1, constant_values=1)
+        column_tiles = padded_tiles.T.copy()
+
+        self.row_blocked_tiles = padded_tiles.tobytes()
+        self.row_forward_edges, self.row_backward_edges = self._find_edges(padded_tiles)
+        self.column_blocked_tiles = column_tiles.tobytes()
+        self.column_forward_edges, self.column_backward_edges = self._find_edges(column_tiles)
+
+    @staticmethod
+    def _find_edges(line_tiles):
+        """Per lijn: bezet met de volgende tegel vrij (vooruit) en bezet met de vorige tegel vrij (achteruit)."""
+        forward_edges = numpy.zeros_like(line_tiles)
+        backward_edges = numpy.zeros_like(line_tiles)
+        forward_edges[:, :-1] = line_tiles[:, :-1] & (line_tiles[:, 1:] ^ 1)
+        backward_edges[:, 1:] = line_tiles[:, 1:] & (line_tiles[:, :-1] ^ 1)
+        return forward_edges.tobytes(), backward_edges.tobytes()
+
+
+class FlowField:
+    """
+    Gedeeld stromingsveld naar een doel (de speler) voor alle achtervolgende vijanden.
+    Een Dijkstra zoektocht vanaf het doel geeft elke tegel de volgende tegel richting het doel,
+    zodat elke vijand zijn richting in O(1) kan opzoeken. Er wordt alleen opnieuw
+    gezocht als het doel naar een andere tegel gaat.
+    """
+
+    def __init__(self, navigation_grid, maximum_cost=None):
+        self.navigation_grid = navigation_grid
+        # zoek niet verder dan deze afstand in tegels (None = de hele map)
+        self.maximum_cost = maximum_cost
+        self.goal_index = None
+
+        tile_count = navigation_grid.grid_width * navigation_grid.grid_height
+        # per tegel de index van de volgende tegel richting het doel, -1 = onbereikbaar
+        self.next_tile_indices = array("i", [-1]) * tile_count
+        self.recalculation_count = 0
+
+    def update(self, goal_pos):
+        """
+        Zet het doel (in pixels). Rekent het veld alleen opnieuw uit als het doel
+        op een andere tegel staat dan de vorige keer. Geeft True terug als er gezocht is.
+        """
+        navigation_grid = self.navigation_grid
+        goal_grid_x, goal_grid_y = navigation_grid.world_to_grid(goal_pos[0], goal_pos[1])
+        if not (0 <= goal_grid_x < navigation_grid.grid_width and 0 <= goal_grid_y < navigation_grid.grid_height):
+            return False
+
+        goal_index = goal_grid_y * navigation_grid.grid_width + goal_grid_x
+        if goal_index == self.goal_index:
+            return False
+
+        self.goal_index = goal_index
+        self._calculate_field()
+        self.recalculation_count += 1
+        return True
+
+    def _calculate_field(self):
+        """Dijkstra vanaf het doel over het hele grid (of tot maximum_cost)."""
+        grid_width = self.navigation_grid.grid_width
+        grid_height = self.navigation_grid.grid_height
+        blocked_tiles = self.navigation_grid.blocked_tiles
+        goal_index = self.goal_index
+        maximum_cost = self.maximum_cost
+
+        next_tile_indices = array("i", [-1]) * (grid_width * grid_height)
+        next_tile_indices[goal_index] = goal_index
+        self.next_tile_indices = next_tile_indices
+
+        distance_to_goal = {goal_index: 0.0}
+        open_set = [(0.0, goal_index)]
+        visited = set()
+
+        while open_set:
+            current_cost, current_index = heapq.heappop(open_set)
+            if current_index in visited:
+                continue
+            visited.add(current_index)
+
+            # een bezette tegel krijgt wel een richting (een hond kan er half op staan),
+            # maar je kunt er niet doorheen lopen, dus hij geeft niets door
+            if blocked_tiles[current_index] and current_index != goal_index:
+                continue
+
+            current_x = current_index % grid_width
+            current_y = current_index // grid_width
+
+            for dx, dy, move_cost in NEIGHBOR_DIRECTIONS:
+                neighbor_x = current_x + dx
+                neighbor_y = current_y + dy
+                if not (0 <= neighbor_x < grid_width and 0 <= neighbor_y < grid_height):
+                    continue
+
+                neighbor_index = neighbor_y * grid_width + neighbor_x
+                if neighbor_index in visited:
+                    continue
+
+                tentative_cost = current_cost + move_cost
+                if maximum_cost is not None and tentative_cost > maximum_cost:
+                    continue
+
+                if tentative_cost < distance_to_goal.get(neighbor_index, float("inf")):
+                    distance_to_goal[neighbor_index] = tentative_cost
+                    # vanaf de buur is de huidige tegel de volgende stap richting het doel
+                    next_tile_indices[neighbor_index] = current_index
+                    heapq.heappush(open_set, (tentative_cost, neighbor_index))
+
+    def get_next_waypoint(self, world_x, world_y):
+        """
+        Geeft het midden (in pixels) van de volgende tegel richting het doel terug.
+        None als de positie op de doeltegel staat of het doel niet bereikbaar is.
+        """
+        navigation_grid = self.navigation_grid
+        grid_x, grid_y = navigation_grid.world_to_grid(world_x, world_y)
+        if not (0 <= grid_x < navigation_grid.grid_width and 0 <= grid_y < navigation_grid.grid_height):
+            return None
+
+        tile_index = grid_y * navigation_grid.grid_width + grid_x
+        next_index = self.next_tile_indices[tile_index]
+        if next_index < 0 or tile_index == self.goal_index:
+            return None
+        return navigation_grid.grid_to_world(next_index % navigation_grid.grid_width, next_index // navigation_grid.grid_width)
+
+
+def a_star(start_pos, goal_pos, walls, tile_size=48, grid_width=100, grid_height=100):
+    """
+    A* pathfinding op een grid met duidelijke variabelenamen.
+    walls mag een kant-en-klaar NavGrid zijn; een lijst met muren wordt
+    voor elke aanroep eerst omgezet naar een NavGrid (langzaam, alleen voor oude code).
+    """
+    return find_path(start_pos, goal_pos, walls, tile_size, grid_width, grid_height)
+
+
+def find_path(start_pos, goal_pos, walls, tile_size=48, grid_width=100, grid_height=100,
+              algorithm="a_star", search_statistics=None):
+    """
+    Zoekt een pad met het gekozen algoritme uit SEARCH_ALGORITHMS en geeft de waypoints
+    (het midden van elke tegel, zonder het startpunt) terug, of None als er geen pad is.
+    "jump_point" slaat op open stukken de symmetrische tussenknopen over, maar geeft
+    dezelfde soort lijst met aansluitende tegels terug als "a_star".
+    Met een dict als search_statistics worden daar de aantallen knopen in gezet.
+    """
+    if isinstance(walls, NavGrid):
+        navigation_grid = walls
+    else:
+        navigation_grid = NavGrid.from_walls(walls, tile_size, grid_width, grid_height)
+
+    if algorithm == "a_star":
+        search_function = _search_grid
+    elif algorithm == "jump_point":
+        search_function = _search_jump_points
+    else:
+        raise ValueError(f"Onbekend zoekalgoritme: {algorithm}")
 
     # start en richting
-    start_grid_x, start_grid_y = world_to_grid(start_pos[0], start_pos[1])
-    goal_grid_x, goal_grid_y = world_to_grid(goal_pos[0], goal_pos[1])
-    goal_node = (goal_grid_x, goal_grid_y)
-
-    # muren
-    occupied_tiles = set()
-    
-    for wall in walls:
-        # De rect van de muur in pixels
-        wall_x, wall_y, wall_width, wall_height = wall
-        
-        # Bereken welke grid-vakjes deze muur bedekt
-        start_tile_x = int(wall_x // tile_size)
-        start_tile_y = int(wall_y // tile_size)
-        
-        # Hoeveel tegels breed en hoog is deze muur?
-        tiles_wide = int(wall_width / tile_size) + 1
-        tiles_high = int(wall_height / tile_size) + 1
-        
-        # Voeg al deze tegels toe aan de bezette set
-        for offset_x in range(tiles_wide):
-            for offset_y in range(tiles_high):
-                occupied_tiles.add((start_tile_x + offset_x, start_tile_y + offset_y))
+    start_grid_x, start_grid_y = navigation_grid.world_to_grid(start_pos[0], start_pos[1])
+    goal_grid_x, goal_grid_y = navigation_grid.world_to_grid(goal_pos[0], goal_pos[1])
+
+    node_path = search_function(
+        navigation_grid, (start_grid_x, start_grid_y), (goal_grid_x, goal_grid_y), search_statistics
+    )
+    if node_path is None:
+        # geen pad gevonden dus niets doen
+        return None
+
+    # grid weer omzetten naar map pixels, het startpunt zelf hoort niet in het pad
+    return [navigation_grid.grid_to_world(grid_x, grid_y) for grid_x, grid_y in node_path[1:]]
+
+
+def _search_grid(navigation_grid, start_node, goal_node, search_statistics=None):
+    """
+    Het eigenlijke A* algoritme op het NavGrid.
+    Werkt intern met platte tegel-indexen en geeft de lijst met grid-knooppunten
+    van start tot en met doel terug, of None als er geen pad is.
+    """
+    grid_width = navigation_grid.grid_width
+    grid_height = navigation_grid.grid_height
+    blocked_tiles = navigation_grid.blocked_tiles
+
+    start_grid_x, start_grid_y = start_node
+    goal_grid_x, goal_grid_y = goal_node
+
+    # buiten het grid kan geen pad beginnen of eindigen
+    if not (0 <= start_grid_x < grid_width and 0 <= start_grid_y < grid_height):
+        return None
+    if not (0 <= goal_grid_x < grid_width and 0 <= goal_grid_y < grid_height):
+        return None
+
+    start_index = start_grid_y * grid_width + start_grid_x
+    goal_index = goal_grid_y * grid_width + goal_grid_x
 
-    # A* Algoritme
     open_set = []
-    
-    start_h_score = manhattan((start_grid_x, start_grid_y), goal_node)
-    heapq.heappush(open_set, (0 + start_h_score, 0, (start_grid_x, start_grid_y)))
-    
+    start_h_score = abs(start_grid_x - goal_grid_x) + abs(start_grid_y - goal_grid_y)
+    heapq.heappush(open_set, (start_h_score, 0, start_index))
+
     came_from = {}
-    g_score = { (start_grid_x, start_grid_y): 0 }
+    g_score = {start_index: 0}
     visited = set()
 
-    directions = [
-        # Recht
-        (0, 1), (1, 0), (0, -1), (-1, 0),
-        # Diagonaal  
-        (1, 1), (1, -1), (-1, 1), (-1, -1) 
-    ]
-
     while open_set:
         # Haal de node met de laagste F-score op
         # de f score bepaald hoe ver iets is
         # lager is dus beter
+        _, current_g, current_index = heapq.heappop(open_set)
 
-        _, current_g, current_node = heapq.heappop(open_set)
-        
-        if current_node in visited:
+        if current_index in visited:
             continue
-        visited.add(current_node)
+        visited.add(current_index)
 
         # Doel bereikt?
-        if current_node == goal_node:
-            # Pad maken
-            path = []
-            while current_node in came_from:
-                # grid weer omzetten naar map pexels
-                world_x, world_y = grid_to_world(*current_node)
-                path.append((world_x, world_y))
-                current_node = came_from[current_node]
-            
-            # startpunt
-            path.append(start_pos) 
-            path.reverse()
-            
-            # geef pad terug
-            return path[1:] if len(path) > 1 else []
+        if current_index == goal_index:
+            _store_search_statistics(search_statistics, len(visited), len(g_score))
+            node_path = []
+            while current_index in came_from:
+                node_path.append((current_index % grid_width, current_index // grid_width))
+                current_index = came_from[current_index]
+            node_path.append((start_grid_x, start_grid_y))
+            node_path.reverse()
+            return node_path
 
         # buren check
-        current_x, current_y = current_node
-        
-        for dx, dy in directions:
-            neighbor_node = (current_x + dx, current_y + dy)
-            neighbor_x, neighbor_y = neighbor_node
+        current_x = current_index % grid_width
+        current_y = current_index // grid_width
+        current_g = g_score[current_index]
+
+        for dx, dy, move_cost in NEIGHBOR_DIRECTIONS:
+            neighbor_x = current_x + dx
+            neighbor_y = current_y + dy
 
             # 1. check grenzen
             if not (0 <= neighbor_x < grid_width and 0 <= neighbor_y < grid_height):
                 continue
-            
+
+            neighbor_index = neighbor_y * grid_width + neighbor_x
+
             # 2. check muur
-            if neighbor_node in occupied_tiles:
+            if blocked_tiles[neighbor_index]:
                 continue
-            
-            # heck of we er al geweest
-            if neighbor_node in visited:
+
+            # check of we er al geweest zijn
+            if neighbor_index in visited:
+                continue
+
+            tentative_g = current_g + move_cost
+
+            if neighbor_index not in g_score or tentative_g < g_score[neighbor_index]:
+                came_from[neighbor_index] = current_index
+                g_score[neighbor_index] = tentative_g
+
+                f_score = tentative_g + abs(neighbor_x - goal_grid_x) + abs(neighbor_y - goal_grid_y)
+                heapq.heappush(open_set, (f_score, tentative_g, neighbor_index))
+
+    _store_search_statistics(search_statistics, len(visited), len(g_score))
+    return None
+
+
+def _store_search_statistics(search_statistics, expanded_node_count, generated_node_count):
+    """Zet de aantallen uitgebreide en aangemaakte knopen van een zoektocht in het dict (als dat er is)."""
+    if search_statistics is not None:
+        search_statistics["expanded_node_count"] = expanded_node_count
+        search_statistics["generated_node_count"] = generated_node_count
+
+
+def _search_jump_points(navigation_grid, start_node, goal_node, search_statistics=None):
+    """
+    Jump Point Search op het NavGrid: A* die alleen op springpunten stopt.
+    Vanaf een knoop wordt in een rechte lijn doorgelopen tot er een muur komt, het doel bereikt
+    is of er een gedwongen buur is (een buur die alleen via deze tegel kort te bereiken is).
+    Diagonaal mag net als bij _search_grid langs de hoek van een muur.
+    Werkt met platte indexen in het grid met een bezette rand, zodat er geen grenzen gecontroleerd hoeven te worden.
+    Geeft de lijst met aansluitende grid-knooppunten van start tot en met doel terug, of None.
+    """
+    grid_width = navigation_grid.grid_width
+    grid_height = navigation_grid.grid_height
+
+    start_grid_x, start_grid_y = start_node
+    goal_grid_x, goal_grid_y = goal_node
+
+    # buiten het grid kan geen pad beginnen of eindigen
+    if not (0 <= start_grid_x < grid_width and 0 <= start_grid_y < grid_height):
+        return None
+    if not (0 <= goal_grid_x < grid_width and 0 <= goal_grid_y < grid_height):
+        return None
+
+    jump_point_tables = navigation_grid.get_jump_point_tables()
+    blocked_tiles = jump_point_tables.row_blocked_tiles
+    padded_width = jump_point_tables.padded_width
+    padded_height = jump_point_tables.padded_height
+    start_index = (start_grid_y + 1) * padded_width + start_grid_x + 1
+    goal_index = (goal_grid_y + 1) * padded_width + goal_grid_x + 1
+    goal_column_index = (goal_grid_x + 1) * padded_height + goal_grid_y + 1
+
+    def jump_straight(tile_index, dx, dy):
+        # zoekt in een keer langs de rij of kolom naar het eerste springpunt, None bij een muur
+        if not dy:
+            return _scan_line(
+                blocked_tiles, jump_point_tables.row_forward_edges, jump_point_tables.row_backward_edges,
+                tile_index, dx, padded_width, goal_index
+            )
+        column_index = (tile_index % padded_width) * padded_height + tile_index // padded_width
+        jump_column_index = _scan_line(
+            jump_point_tables.column_blocked_tiles, jump_point_tables.column_forward_edges,
+            jump_point_tables.column_backward_edges, column_index, dy, padded_height, goal_column_index
+        )
+        if jump_column_index is None:
+            return None
+        return (jump_column_index % padded_height) * padded_width + jump_column_index // padded_height
+
+    def jump(tile_index, dx, dy):
+        if not (dx and dy):
+            return jump_straight(tile_index, dx, dy)
+
+        # diagonaal: stop ook als een van de twee rechte richtingen vanaf hier een springpunt vindt
+        horizontal_step = dx
+        vertical_step = dy * padded_width
+        step = horizontal_step + vertical_step
+        while True:
+            tile_index += step
+            if blocked_tiles[tile_index]:
+                return None
+            if tile_index == goal_index:
+                return tile_index
+            if (blocked_tiles[tile_index - horizontal_step] and not blocked_tiles[tile_index - horizontal_step + vertical_step]) or \
+                    (blocked_tiles[tile_index - vertical_step] and not blocked_tiles[tile_index + horizontal_step - vertical_step]):
+                return tile_index
+            if jump_straight(tile_index, dx, 0) is not None or jump_straight(tile_index, 0, dy) is not None:
+                return tile_index
+
+    def get_search_directions(tile_index, dx, dy):
+        # de richtingen die vanaf een springpunt nog zin hebben: de natuurlijke en de gedwongen buren
+        if dx and dy:
+            search_directions = [(dx, dy), (dx, 0), (0, dy)]
+            if blocked_tiles[tile_index - dx]:
+                search_directions.append((-dx, dy))
+            if blocked_tiles[tile_index - dy * padded_width]:
+                search_directions.append((dx, -dy))
+        elif dx:
+            search_directions = [(dx, 0)]
+            if blocked_tiles[tile_index + padded_width]:
+                search_directions.append((dx, 1))
+            if blocked_tiles[tile_index - padded_width]:
+                search_directions.append((dx, -1))
+        else:
+            search_directions = [(0, dy)]
+            if blocked_tiles[tile_index + 1]:
+                search_directions.append((1, dy))
+            if blocked_tiles[tile_index - 1]:
+                search_directions.append((-1, dy))
+        return search_directions
+
+    open_set = []
+    start_h_score = abs(start_grid_x - goal_grid_x) + abs(start_grid_y - goal_grid_y)
+    heapq.heappush(open_set, (start_h_score, 0, start_index))
+
+    came_from = {}
+    g_score = {start_index: 0}
+    visited = set()
+    goal_padded_x = goal_grid_x + 1
+    goal_padded_y = goal_grid_y + 1
+
+    while open_set:
+        _, current_g, current_index = heapq.heappop(open_set)
+
+        if current_index in visited:
+            continue
+        visited.add(current_index)
+
+        if current_index == goal_index:
+            _store_search_statistics(search_statistics, len(visited), len(g_score))
+            jump_point_path = [current_index]
+            while current_index in came_from:
+                current_index = came_from[current_index]
+                jump_point_path.append(current_index)
+            jump_point_path.reverse()
+            # terug naar grid-knooppunten zonder de rand
+            return _fill_jump_point_path(
+                [(jump_point_index % padded_width - 1, jump_point_index // padded_width - 1) for jump_point_index in jump_point_path]
+            )
+
+        current_x = current_index % padded_width
+        current_y = current_index // padded_width
+
+        # de start heeft geen richting en kijkt dus alle kanten op
+        if current_index == start_index:
+            search_directions = [(dx, dy) for dx, dy, _ in NEIGHBOR_DIRECTIONS]
+        else:
+            parent_index = came_from[current_index]
+            parent_x = parent_index % padded_width
+            parent_y = parent_index // padded_width
+            search_directions = get_search_directions(
+                current_index,
+                (current_x > parent_x) - (current_x < parent_x),
+                (current_y > parent_y) - (current_y < parent_y),
+            )
+
+        for dx, dy in search_directions:
+            neighbor_index = jump(current_index, dx, dy)
+            if neighbor_index is None or neighbor_index in visited:
                 continue
 
-            # Kosten berekenen: 1.4 voor diagonaal (wortel 2), 1.0 voor recht
-            move_cost = 1.4 if dx != 0 and dy != 0 else 1.0
-            tentative_g = g_score[current_node] + move_cost
+            jump_x = neighbor_index % padded_width
+            jump_y = neighbor_index // padded_width
+            step_count = max(abs(jump_x - current_x), abs(jump_y - current_y))
+            tentative_g = current_g + step_count * (1.4 if dx and dy else 1.0)
+
+            if neighbor_index not in g_score or tentative_g < g_score[neighbor_index]:
+                came_from[neighbor_index] = current_index
+                g_score[neighbor_index] = tentative_g
+
+                f_score = tentative_g + abs(jump_x - goal_padded_x) + abs(jump_y - goal_padded_y)
+                heapq.heappush(open_set, (f_score, tentative_g, neighbor_index))
+
+    _store_search_statistics(search_statistics, len(visited), len(g_score))
+    return None
+
+
+def _scan_line(line_tiles, forward_edges, backward_edges, line_index, direction, side_step, goal_index):
+    """
+    Rechte sprong langs een lijn (rij of kolom) van de tabellen van JumpPointTables.
+    Geeft de index van het eerste springpunt na line_index terug: het doel, of een tegel met een
+    gedwongen buur (de tegel ernaast aan een kant is bezet en de tegel schuin vooruit vrij).
+    None als de lijn eerst tegen een muur loopt.
+    """
+    if direction > 0:
+        wall_index = line_tiles.find(1, line_index + 1)
+        jump_index = wall_index
+        edge_index = forward_edges.find(1, line_index + 1 + side_step, jump_index + side_step)
+        if edge_index >= 0:
+            jump_index = edge_index - side_step
+        edge_index = forward_edges.find(1, line_index + 1 - side_step, jump_index - side_step)
+        if edge_index >= 0:
+            jump_index = edge_index + side_step
+        if line_index < goal_index < jump_index:
+            return goal_index
+    else:
+        wall_index = line_tiles.rfind(1, 0, line_index)
+        jump_index = wall_index
+        edge_index = backward_edges.rfind(1, jump_index + 1 + side_step, line_index + side_step)
+        if edge_index >= 0:
+            jump_index = edge_index - side_step
+        edge_index = backward_edges.rfind(1, jump_index + 1 - side_step, line_index - side_step)
+        if edge_index >= 0:
+            jump_index = edge_index + side_step
+        if jump_index < goal_index < line_index:
+            return goal_index
+
+    return None if jump_index == wall_index else jump_index
+
 
-            if neighbor_node not in g_score or tentative_g < g_score[neighbor_node]:
-                came_from[neighbor_node] = current_node
-                g_score[neighbor_node] = tentative_g
-                
-                f_score = tentative_g + manhattan(neighbor_node, goal_node)
-                heapq.heappush(open_set, (f_score, tentative_g, neighbor_node))
+def _fill_jump_point_path(jump_point_nodes):
+    """Vult de tegels tussen opeenvolgende springpunten in, zodat elke stap naar een buurtegel gaat."""
+    node_path = [jump_point_nodes[0]]
+    for jump_x, jump_y in jump_point_nodes[1:]:
+        previous_x, previous_y = node_path[-1]
+        dx = (jump_x > previous_x) - (jump_x < previous_x)
+        dy = (jump_y > previous_y) - (jump_y < previous_y)
+        for step_index in range(1, max(abs(jump_x - previous_x), abs(jump_y - previous_y)) + 1):
+            node_path.append((previous_x + step_index * dx, previous_y + step_index * dy))
+    return node_path
 
-    # geen pad gevonden dus niets doen
-    return None  
 
 def manhattan(point_a, point_b):
     """Bereken afstand tussen twee grid-punten (x1, y1) en (x2, y2)."""
-    return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
\ No newline at end of file
+    return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
@@ -1,4 +1,5 @@
 import pygame
+from src.asset_cache import asset_cache
 from src.colors import BLUE, LIGHT_BLUE
 
 class Player:
@@ -34,29 +35,29 @@ class Player:
         self.is_moving_boolean = False
         self.is_facing_right_boolean = True
 
-        # inladen van de animaties
+        # inladen van de animaties, met een gespiegelde versie voor als de speler naar links kijkt
         self.idle_animation_sprites = self.load_animation_spritesheet("assets/player/Player_Idle.png", 4)
         self.walking_animation_sprites = self.load_animation_spritesheet("assets/player/Player_Walking.png", 6)
+        self.idle_animation_sprites_flipped = self.load_animation_spritesheet("assets/player/Player_Idle.png", 4, flip_horizontal=True)
+        self.walking_animation_sprites_flipped = self.load_animation_spritesheet("assets/player/Player_Walking.png", 6, flip_horizontal=True)
         
         self.current_active_sprite_surface = self.idle_animation_sprites[0]
+        self.current_flipped_sprite_surface = self.idle_animation_sprites_flipped[0]
 
-    def load_animation_spritesheet(self, file_path_string, total_frames_number):
-        extracted_frames_list = []
+    def load_animation_spritesheet(self, file_path_string, total_frames_number, flip_horizontal=False):
+        # de frames komen uit de gedeelde asset cache, dus elke sheet wordt maar een keer geladen en geschaald
         try:
-            full_sheet_surface = pygame.image.load(file_path_string).convert_alpha()
-            for index in range(total_frames_number):
-                source_rectangle = pygame.Rect(index * self.base_frame_size_pixels, 0, self.base_frame_size_pixels, self.base_frame_size_pixels)
-                temp_surface = pygame.Surface((self.base_frame_size_pixels, self.base_frame_size_pixels), pygame.SRCALPHA)
-                temp_surface.blit(full_sheet_surface, (0, 0), source_rectangle)
-                
-                # schaal de sprite naar de grote visuele maat
-                scaled_surface = pygame.transform.scale(temp_surface, (self.sprite_render_size_pixels, self.sprite_render_size_pixels))
-                extracted_frames_list.append(scaled_surface)
+            return asset_cache.get_frames(
+                file_path_string,
+                total_frames_number,
+                self.base_frame_size_pixels,
+                scale_size=(self.sprite_render_size_pixels, self.sprite_render_size_pixels),
+                flip_horizontal=flip_horizontal
+            )
         except pygame.error:
             fallback_surface = pygame.Surface((self.size_width, self.size_height))
             fallback_surface.fill(LIGHT_BLUE)
-            extracted_frames_list.append(fallback_surface)
-        return extracted_frames_list
+            return (fallback_surface,)
 
     def move(self, horizontal_input, vertical_input, walls_list):
         self.is_moving_boolean = horizontal_input != 0 or vertical_input != 0
@@ -77,6 +78,9 @@ class Player:
     
     def _collides_with_walls(self, walls_list):
         player_hitbox_rectangle = pygame.Rect(self.position_coordinate_x, self.position_coordinate_y, self.size_width, self.size_height)
+        # een tilemap kan zelf snel de tegels onder de hitbox testen
+        if hasattr(walls_list, "collides_with_rect"):
+            return walls_list.collides_with_rect(player_hitbox_rectangle)
         for wall in walls_list:
             if player_hitbox_rectangle.colliderect(wall):
                 return True
@@ -97,19 +101,21 @@ class Player:
 
         self.animation_timer_value += self.animation_speed_rate
         active_list = self.walking_animation_sprites if self.is_moving_boolean else self.idle_animation_sprites
+        flipped_list = self.walking_animation_sprites_flipped if self.is_moving_boolean else self.idle_animation_sprites_flipped
         
         if self.animation_timer_value >= len(active_list):
             self.animation_timer_value = 0
             
         self.current_animation_frame_index = int(self.animation_timer_value)
         self.current_active_sprite_surface = active_list[self.current_animation_frame_index]
+        self.current_flipped_sprite_surface = flipped_list[self.current_animation_frame_index]
 
     def draw_at_position(self, screen_surface, screen_coordinate_x, screen_coordinate_y):
         if self.is_invincible_boolean and (self.invincibility_timer_frames // 5) % 2 == 0:
             return 
 
         if not self.is_facing_right_boolean:
-            final_sprite_surface = pygame.transform.flip(self.current_active_sprite_surface, True, False)
+            final_sprite_surface = self.current_flipped_sprite_surface
         else:
             final_sprite_surface = self.current_active_sprite_surface
 
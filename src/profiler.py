@@ -0,0 +1,193 @@
+# src/profiler.py
+import csv
+import time
+from collections import deque
+
+import pygame
+from src.fonts import get_font
+
+# De onderdelen van een frame die gemeten worden, in de volgorde van de overlay en de CSV
+PROFILED_SECTIONS = (
+    "events", "update", "player_move", "enemy_update", "a_star",
+    "draw", "background", "entities", "lighting", "minigame", "ui", "flip",
+)
+
+# De profiler die nu meet, None betekent dat meten niets kost
+_active_profiler = None
+
+
+class _ProfiledSection:
+    """Context manager die de tijd van een blok bij een onderdeel van het huidige frame optelt."""
+
+    __slots__ = ("frame_profiler", "section_name", "start_time")
+
+    def __init__(self, frame_profiler, section_name):
+        self.frame_profiler = frame_profiler
+        self.section_name = section_name
+        self.start_time = 0.0
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.frame_profiler.add_section_time(self.section_name, time.perf_counter() - self.start_time)
+        return False
+
+
+class _DisabledSection:
+    """Lege context manager voor als er geen profiler actief is."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        return False
+
+
+_DISABLED_SECTION = _DisabledSection()
+
+
+def set_active_profiler(frame_profiler):
+    """Zet de profiler die profile_section gebruikt (None om het meten uit te zetten)."""
+    global _active_profiler
+    _active_profiler = frame_profiler
+
+
+def get_active_profiler():
+    """Geeft de actieve profiler terug, of None."""
+    return _active_profiler
+
+
+def profile_section(section_name):
+    """
+    Meet een blok code als onderdeel van het huidige frame:
+        with profile_section("lighting"):
+            ...
+    Een onderdeel dat vaker per frame voorkomt (zoals a_star) wordt opgeteld.
+    """
+    if _active_profiler is None:
+        return _DISABLED_SECTION
+    return _ProfiledSection(_active_profiler, section_name)
+
+
+class FrameProfiler:
+    """
+    Houdt per frame de tijd van elk onderdeel bij in een ringbuffer van de laatste history_size frames
+    (met history_size None worden alle frames bewaard, bijvoorbeeld voor een replay).
+    Kan een overlay tekenen met gemiddelden en de p99 frametijd, en alle frames naar CSV schrijven.
+    Tijden worden in milliseconden opgeslagen.
+    """
+
+    def __init__(self, history_size=600, overlay_refresh_frames=15):
+        self.history_size = history_size
+        self.frame_durations = deque(maxlen=history_size)
+        self.frame_section_durations = deque(maxlen=history_size)
+        self.frame_indices = deque(maxlen=history_size)
+
+        self.frame_count = 0
+        self.frame_start_time = None
+        self.current_section_durations = {}
+
+        # de overlay wordt maar af en toe opnieuw gerenderd, anders kost hij zelf te veel
+        self.is_overlay_visible = False
+        self.overlay_refresh_frames = overlay_refresh_frames
+        self.overlay_surface = None
+        self.overlay_rendered_frame = -overlay_refresh_frames
+
+    def begin_frame(self):
+        """Start de meting van een nieuw frame."""
+        self.frame_start_time = time.perf_counter()
+        self.current_section_durations = {}
+
+    def end_frame(self):
+        """Sluit het frame af en zet zijn tijden in de ringbuffer."""
+        if self.frame_start_time is None:
+            return
+        self.frame_durations.append((time.perf_counter() - self.frame_start_time) * 1000.0)
+        self.frame_section_durations.append(self.current_section_durations)
+        self.frame_indices.append(self.frame_count)
+        self.frame_count += 1
+        self.frame_start_time = None
+
+    def section(self, section_name):
+        """Context manager die een blok als onderdeel van het huidige frame meet."""
+        return _ProfiledSection(self, section_name)
+
+    def add_section_time(self, section_name, duration_seconds):
+        """Telt een gemeten tijd (in seconden) op bij een onderdeel van het huidige frame."""
+        section_durations = self.current_section_durations
+        section_durations[section_name] = section_durations.get(section_name, 0.0) + duration_seconds * 1000.0
+
+    def get_average_section_time(self, section_name, frame_count=60):
+        """Gemiddelde tijd in ms van een onderdeel over de laatste frame_count frames."""
+        recent_frames = list(self.frame_section_durations)[-frame_count:]
+        if not recent_frames:
+            return 0.0
+        return sum(section_durations.get(section_name, 0.0) for section_durations in recent_frames) / len(recent_frames)
+
+    def get_average_frame_time(self, frame_count=60):
+        """Gemiddelde frametijd in ms over de laatste frame_count frames."""
+        recent_durations = list(self.frame_durations)[-frame_count:]
+        if not recent_durations:
+            return 0.0
+        return sum(recent_durations) / len(recent_durations)
+
+    def get_frame_time_percentile(self, percentile=99):
+        """De frametijd in ms waar percentile procent van de frames in de ringbuffer onder blijft."""
+        if not self.frame_durations:
+            return 0.0
+        sorted_durations = sorted(self.frame_durations)
+        percentile_index = min(len(sorted_durations) - 1, int(len(sorted_durations) * percentile / 100))
+        return sorted_durations[percentile_index]
+
+    def dump_csv(self, file_path):
+        """Schrijft alle frames in de ringbuffer naar een CSV-bestand, een regel per frame."""
+        section_names = list(PROFILED_SECTIONS)
+        for section_durations in self.frame_section_durations:
+            for section_name in section_durations:
+                if section_name not in section_names:
+                    section_names.append(section_name)
+
+        with open(file_path, "w", newline="", encoding="utf-8") as file_handle:
+            csv_writer = csv.writer(file_handle)
+            csv_writer.writerow(["frame_index", "frame_ms"] + [f"{section_name}_ms" for section_name in section_names])
+            for frame_index, frame_duration, section_durations in zip(self.frame_indices, self.frame_durations, self.frame_section_durations):
+                csv_writer.writerow(
+                    [frame_index, f"{frame_duration:.4f}"]
+                    + [f"{section_durations.get(section_name, 0.0):.4f}" for section_name in section_names]
+                )
+        print(f"Profiler frames weggeschreven naar: {file_path}")
+
+    def toggle_overlay(self):
+        """Zet de overlay aan of uit."""
+        self.is_overlay_visible = not self.is_overlay_visible
+        self.overlay_rendered_frame = -self.overlay_refresh_frames
+
+    def draw_overlay(self, screen_surface):
+        """Tekent de overlay linksboven, als die aan staat, en geeft het getekende gebied terug."""
+        if not self.is_overlay_visible:
+            return None
+
+        if self.frame_count - self.overlay_rendered_frame >= self.overlay_refresh_frames:
+            self.overlay_surface = self._render_overlay()
+            self.overlay_rendered_frame = self.frame_count
+        return screen_surface.blit(self.overlay_surface, (10, 10))
+
+    def _render_overlay(self):
+        """Rendert de regels van de overlay op een half doorzichtig paneel."""
+        overlay_font = get_font(20)
+        text_lines = [
+            f"frame avg {self.get_average_frame_time():.2f} ms   p99 {self.get_frame_time_percentile(99):.2f} ms",
+        ]
+        for section_name in PROFILED_SECTIONS:
+            text_lines.append(f"{section_name:<14}{self.get_average_section_time(section_name):7.2f} ms")
+
+        line_height = overlay_font.get_linesize()
+        overlay_surface = pygame.Surface((300, line_height * len(text_lines) + 12), pygame.SRCALPHA)
+        overlay_surface.fill((0, 0, 0, 170))
+        for line_index, text_line in enumerate(text_lines):
+            overlay_surface.blit(overlay_font.render(text_line, True, (255, 255, 255)), (6, 6 + line_index * line_height))
+        return overlay_surface
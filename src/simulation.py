@@ -0,0 +1,322 @@
+import pygame
+from src.player import Player
+from src.enemy import Dog
+from src.enemy_swarm import EnemySwarm
+from src.chunked_tilemap import load_tilemap
+from src.game_random import seed_gameplay_random
+from src.path_service import PathRequestService
+from src.pathfinding import FlowField
+from src.profiler import profile_section
+from src.spatial_hash import SpatialHash
+from src.minigame import CellphoneInterface, OperatorMinigame, PythonTrackMinigame, PythonQuizMinigame
+
+
+class SimulationInput:
+    """
+    De invoer voor een enkele tick van de simulatie.
+    Bevat welke bewegingsrichtingen ingedrukt zijn en welke toetsen deze tick
+    zijn ingedrukt of losgelaten, als lijst van (event type, toets) paren.
+    """
+
+    def __init__(self, move_left=False, move_right=False, move_up=False, move_down=False, key_events=()):
+        self.move_left = move_left
+        self.move_right = move_right
+        self.move_up = move_up
+        self.move_down = move_down
+        self.key_events = list(key_events)
+
+
+class Simulation:
+    """
+    De kern van de spelwereld zonder rendering: speler, vijanden, tilemap,
+    minigames en berichten. Gaat een stap vooruit per aanroep van tick,
+    dus kan ook zonder scherm duizenden ticks per seconde draaien.
+    """
+
+    def __init__(self, map_file_path, screen_width_pixels, screen_height_pixels, tile_size=48,
+                 player_start_position=(1035, 800), enemy_start_positions=((500, 400), (1500, 400)),
+                 enemy_pathfinding_mode="a_star", use_enemy_swarm=False, use_path_service=False, random_seed=None,
+                 operator_difficulty="normal"):
+        # met een vaste seed verloopt de simulatie bij dezelfde invoer elke keer hetzelfde (opnames en replays)
+        if random_seed is not None:
+            seed_gameplay_random(random_seed)
+
+        # de schermgrootte is nodig om de telefoon van de minigames te centreren
+        self.screen_width_pixels = screen_width_pixels
+        self.screen_height_pixels = screen_height_pixels
+
+        self.player_character = Player(*player_start_position)
+        # bij grote aantallen staan de honden als numpy arrays in een swarm, de lijst bevat dan views
+        if use_enemy_swarm:
+            self.enemy_swarm = EnemySwarm(initial_capacity=len(enemy_start_positions))
+            self.enemy_list = [self.enemy_swarm.add_dog(start_x, start_y) for start_x, start_y in enemy_start_positions]
+        else:
+            self.enemy_swarm = None
+            self.enemy_list = [Dog(start_x, start_y) for start_x, start_y in enemy_start_positions]
+        for enemy in self.enemy_list:
+            enemy.pathfinding_mode = enemy_pathfinding_mode
+
+        # A* paden op worker threads in plaats van midden in de tick
+        self.path_service = PathRequestService() if use_path_service else None
+        for enemy in self.enemy_list:
+            enemy.path_service = self.path_service
+
+        # gedeeld stromingsveld naar de speler, wordt pas gemaakt als een vijand het gebruikt
+        self.player_flow_field = None
+
+        # spatial hash van de vijanden, de celgrootte is gelijk aan de afstotingsafstand
+        self.enemy_separation_distance = 90
+        self.enemy_spatial_hash = SpatialHash(cell_size=self.enemy_separation_distance)
+
+        # laad de map (een JSON-bestand, of een opgedeelde map met een manifest)
+        self.game_map = load_tilemap(map_file_path, tile_size=tile_size)
+        # alles binnen een schermgrootte rond de speler moet geladen zijn
+        self.streaming_radius_pixels = max(screen_width_pixels, screen_height_pixels)
+
+        self.depth_sorted_objects = []
+        self.is_paused = False
+        self.tick_count = 0
+
+        # minigame state
+        self.active_minigame_session = None
+        self.last_interaction_location = None
+        # het object waar de speler nu naast staat (voor een hint in de UI), elke tick bijgewerkt
+        self.interaction_radius_pixels = 40
+        self.nearby_interactable = None
+        # moeilijkheid van de operator shooter, een van de OPERATOR_DIFFICULTIES
+        self.operator_difficulty = operator_difficulty
+
+        # messages
+        self.active_info_message = ""
+        self.message_display_timer = 0
+
+    def run_ticks(self, simulation_input, tick_count):
+        """Voert een aantal ticks achter elkaar uit met dezelfde invoer."""
+        for _ in range(tick_count):
+            self.tick(simulation_input)
+
+    def tick(self, simulation_input):
+        """
+        Verwerkt de toetsen van deze tick en werkt daarna de wereld een stap bij.
+        """
+        self.tick_count += 1
+
+        for event_type, key in simulation_input.key_events:
+            # Als er een minigame actief is, gaan alle toetsen naar de telefoon
+            if self.active_minigame_session:
+                self.active_minigame_session.handle_input(pygame.event.Event(event_type, key=key))
+                continue
+
+            if event_type == pygame.KEYDOWN:
+                # Interactie met de wereld via de spatiebalk
+                if key == pygame.K_SPACE:
+                    self.interact()
+
+                # Pauzeer het spel met de Escape-toets
+                if key == pygame.K_ESCAPE:
+                    self.is_paused = not self.is_paused
+
+        self.update(simulation_input)
+
+    def interact(self):
+        """
+        Controleert of de speler naast een interactief object staat en start de bijbehorende actie.
+        """
+        interactable_object = self.find_nearby_interactable()
+        if interactable_object is None:
+            return
+        tile_type = interactable_object.tile_type
+        # een object van meerdere tegels heeft een vaste locatie, van welke kant de speler ook komt
+        row_index, column_index = interactable_object.row_index, interactable_object.column_index
+
+        # Logica voor de Operator Shooter (Tegel 2)
+        if tile_type == 2:
+            if (row_index, column_index) not in self.player_character.completed_minigame_locations:
+                self.last_interaction_location = (row_index, column_index)
+                self.open_minigame(OperatorMinigame(360, 490, difficulty=self.operator_difficulty))
+            else:
+                self.show_info_message("You have already mastered this challenge!", 120)
+
+        # Logica voor het Informatiebord (Tegel 3)
+        elif tile_type == 3:
+            self.show_info_message(
+                "This is the church of Py, search the garden for objects and press spacebar next to them to absorb their keys or something",
+                270
+            )
+
+        # Logica voor de Python Track Minigame (Tegel 4)
+        elif tile_type == 4:
+            if (row_index, column_index) not in self.player_character.completed_minigame_locations:
+                self.last_interaction_location = (row_index, column_index)
+                self.open_minigame(PythonTrackMinigame(360, 490))
+            else:
+                # Toon een melding als de speler deze track al heeft voltooid
+                self.show_info_message("This track has already been conquered!", 120)
+
+        # Logica voor de Python Quiz (Tegel 5)
+        elif tile_type == 5:
+            if (row_index, column_index) not in self.player_character.completed_minigame_locations:
+                self.last_interaction_location = (row_index, column_index)
+                self.open_minigame(PythonQuizMinigame(360, 580))
+            else:
+                self.show_info_message("This quiz has already been completed!", 120)
+
+        # Logica voor de Finale Poort (Tegel 9)
+        elif tile_type == 9:
+            if self.player_character.keys_collected_count >= 3:
+                self.show_info_message("Well done, you have seen the power of python and mastered it. (end of game currently)", 180)
+            else:
+                self.show_info_message("You don't respect the power of python yet, even though the door it is judging you to be unworthy of walking through it", 180)
+
+    def find_nearby_interactable(self):
+        """Het interactieve object naast de speler (binnen interaction_radius_pixels van zijn middelpunt), of None."""
+        return self.game_map.get_nearest_interactable(
+            self.player_character.position_coordinate_x + self.player_character.size_width // 2,
+            self.player_character.position_coordinate_y + self.player_character.size_height // 2,
+            self.interaction_radius_pixels
+        )
+
+    def open_minigame(self, logic_module):
+        """Opent de telefoon met de gegeven minigame."""
+        self.active_minigame_session = CellphoneInterface(
+            self.screen_width_pixels,
+            self.screen_height_pixels,
+            logic_module
+        )
+
+    def show_info_message(self, message_text, duration_frames):
+        """Toont een informatiebericht voor een aantal frames."""
+        self.active_info_message = message_text
+        self.message_display_timer = duration_frames
+
+    def update(self, simulation_input):
+        # controleer of de telefoon op dit moment open staat
+        if self.active_minigame_session:
+            with profile_section("minigame"):
+                self.active_minigame_session.update()
+
+            # kijk of de minigame sessie net is afgelopen
+            if not self.active_minigame_session.is_active:
+                # pak de eindscore van de applicatie die op de telefoon draaide
+                final_score_points = self.active_minigame_session.current_application.total_score_points
+
+                if final_score_points >= 100:
+                    # voeg de locatie toe aan de lijst met voltooide uitdagingen
+                    if self.last_interaction_location not in self.player_character.completed_minigame_locations:
+                        self.player_character.keys_collected_count += 1
+                        self.player_character.completed_minigame_locations.add(self.last_interaction_location)
+                        self.show_info_message("You feel closer to python", 180)
+
+                # sluit de telefoon sessie af
+                self.active_minigame_session = None
+
+            return
+
+        # controleer of het spel op pauze staat via het menu
+        if self.is_paused:
+            return
+
+        # vanaf hier begint de normale logica van de wereld
+        horizontal_movement = 0
+        vertical_movement = 0
+
+        if simulation_input.move_left:
+            horizontal_movement -= self.player_character.move_speed
+        if simulation_input.move_right:
+            horizontal_movement += self.player_character.move_speed
+        if simulation_input.move_up:
+            vertical_movement -= self.player_character.move_speed
+        if simulation_input.move_down:
+            vertical_movement += self.player_character.move_speed
+
+        # laad bij grote maps de regio's rond de speler voordat er iets beweegt
+        self.game_map.stream_around(
+            self.player_character.position_coordinate_x,
+            self.player_character.position_coordinate_y,
+            self.streaming_radius_pixels
+        )
+        with profile_section("player_move"):
+            self.player_character.move(horizontal_movement, vertical_movement, self.game_map)
+            self.player_character.update()
+
+        # werk de vijanden bij
+        player_current_position = (self.player_character.position_coordinate_x, self.player_character.position_coordinate_y)
+        player_flow_field = self.update_player_flow_field()
+
+        # lever de paden af die de workers sinds de vorige tick gevonden hebben
+        if self.path_service is not None:
+            self.path_service.poll_results()
+
+        if self.enemy_swarm is not None:
+            with profile_section("enemy_update"):
+                self.enemy_swarm.update(player_current_position, self.game_map, tile_size=self.game_map.tile_size, flow_field=player_flow_field)
+        else:
+            for enemy in self.enemy_list:
+                with profile_section("enemy_update"):
+                    enemy.update(player_current_position, self.game_map, tile_size=self.game_map.tile_size, flow_field=player_flow_field)
+
+        # afstoting tussen vijanden, alleen buren uit de spatial hash worden bekeken
+        self.enemy_spatial_hash.rebuild(self.enemy_list)
+        for enemy in self.enemy_list:
+            enemy.separate_from_other_enemies(
+                self.enemy_list,
+                separation_distance=self.enemy_separation_distance,
+                spatial_hash=self.enemy_spatial_hash
+            )
+
+        # schade aan de speler, alleen vijanden in de cellen rond de speler kunnen raken
+        # (een paar pixels marge omdat de afstoting de vijanden na het vullen nog iets verschuift)
+        nearby_enemies = self.enemy_spatial_hash.query_rect(
+            self.player_character.position_coordinate_x - 2,
+            self.player_character.position_coordinate_y - 2,
+            self.player_character.size_width + 4,
+            self.player_character.size_height + 4
+        )
+        for enemy in nearby_enemies:
+            if self.detect_collision(self.player_character, enemy):
+                self.player_character.take_damage(10)
+
+        # kijk waar de speler nu naast staat
+        self.nearby_interactable = self.find_nearby_interactable()
+
+        # sorteer de objecten voor het diepte effect
+        self.depth_sorted_objects = [self.player_character] + self.enemy_list
+        self.depth_sorted_objects.sort(key=lambda object_instance: object_instance.position_coordinate_y)
+
+        # werk de timer van de informatieberichten bij
+        if self.message_display_timer > 0:
+            self.message_display_timer -= 1
+        else:
+            self.active_info_message = ""
+
+    def close(self):
+        """Stopt het achtergrondwerk van de simulatie (de workers van de path service)."""
+        if self.path_service is not None:
+            self.path_service.shutdown()
+
+    def update_player_flow_field(self):
+        """
+        Werkt het gedeelde stromingsveld naar de speler bij, als er vijanden zijn die het gebruiken.
+        Er wordt alleen opnieuw gezocht als de speler op een andere tegel staat of de map is veranderd.
+        """
+        if not any(enemy.pathfinding_mode == "flow_field" for enemy in self.enemy_list):
+            return None
+
+        navigation_grid = self.game_map.get_navigation_grid()
+        if self.player_flow_field is None or self.player_flow_field.navigation_grid is not navigation_grid:
+            self.player_flow_field = FlowField(navigation_grid)
+
+        self.player_flow_field.update((
+            self.player_character.position_coordinate_x + self.player_character.size_width // 2,
+            self.player_character.position_coordinate_y + self.player_character.size_height // 2
+        ))
+        return self.player_flow_field
+
+    def detect_collision(self, object_one, object_two):
+        """Controleert of twee objecten elkaar overlappen."""
+        return (
+            object_one.position_coordinate_x < object_two.position_coordinate_x + object_two.size_width and
+            object_one.position_coordinate_x + object_one.size_width > object_two.position_coordinate_x and
+            object_one.position_coordinate_y < object_two.position_coordinate_y + object_two.size_height and
+            object_one.position_coordinate_y + object_one.size_height > object_two.position_coordinate_y
+        )
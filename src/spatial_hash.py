@@ -0,0 +1,64 @@
+# src/spatial_hash.py
+
+
+class SpatialHash:
+    """
+    Uniform spatial hash voor bewegende objecten (vijanden).
+    Elk object wordt in alle cellen gezet die zijn hitbox overlapt, zodat een
+    query alleen de objecten in de buurt teruggeeft in plaats van allemaal.
+    Wordt elke frame opnieuw gevuld met rebuild.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Maakt alle cellen leeg."""
+        self.cells.clear()
+
+    def rebuild(self, entities):
+        """Vult de hash opnieuw met de huidige posities van de objecten."""
+        self.cells.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity):
+        """Zet een object in alle cellen die zijn hitbox raakt."""
+        cell_size = self.cell_size
+        column_start = int(entity.position_coordinate_x // cell_size)
+        column_end = int((entity.position_coordinate_x + entity.size_width) // cell_size)
+        row_start = int(entity.position_coordinate_y // cell_size)
+        row_end = int((entity.position_coordinate_y + entity.size_height) // cell_size)
+
+        for row_index in range(row_start, row_end + 1):
+            for column_index in range(column_start, column_end + 1):
+                cell_key = (column_index, row_index)
+                cell_entities = self.cells.get(cell_key)
+                if cell_entities is None:
+                    self.cells[cell_key] = [entity]
+                else:
+                    cell_entities.append(entity)
+
+    def query_rect(self, left, top, width, height):
+        """Geeft alle objecten terug in de cellen die deze rechthoek raakt (elk object een keer)."""
+        cell_size = self.cell_size
+        column_start = int(left // cell_size)
+        column_end = int((left + width) // cell_size)
+        row_start = int(top // cell_size)
+        row_end = int((top + height) // cell_size)
+
+        found_entities = []
+        seen_entity_ids = set()
+        for row_index in range(row_start, row_end + 1):
+            for column_index in range(column_start, column_end + 1):
+                for entity in self.cells.get((column_index, row_index), ()):
+                    entity_id = id(entity)
+                    if entity_id not in seen_entity_ids:
+                        seen_entity_ids.add(entity_id)
+                        found_entities.append(entity)
+        return found_entities
+
+    def query_radius(self, center_x, center_y, radius):
+        """Geeft de kandidaten terug binnen een vierkant van radius rondom een punt."""
+        return self.query_rect(center_x - radius, center_y - radius, radius * 2, radius * 2)
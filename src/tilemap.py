@@ -2,10 +2,22 @@
 import json
 from typing import Dict, List, Optional, Tuple
 
+import numpy
 import pygame
 
+from src.asset_cache import asset_cache
 # Importeer de kleurconstanten voor gebruik als fallback
 from src.colors import *
+from src.hierarchical_pathfinding import HierarchicalPathfinder
+from src.interactable_index import InteractableIndex, InteractableObject
+from src.map_format import BINARY_MAP_EXTENSION, read_binary_map
+from src.pathfinding import NavGrid
+
+# Tegeltypes waar de speler en vijanden niet doorheen mogen lopen
+BLOCKING_TILE_TYPES = (1, 2, 3, 4)
+
+# Aantal tegels per kant van een voorgebakken stuk (chunk) van een laag
+TILE_CHUNK_SIZE = 16
 
 
 class Tilemap:
@@ -26,7 +38,24 @@ class Tilemap:
 
         self.map_width: int = 0
         self.map_height: int = 0
-        self.walls: List[pygame.Rect] = []
+        # lijst met muur-Rects, wordt pas opgebouwd als iemand self.walls opvraagt
+        self._wall_rectangles: Optional[List[pygame.Rect]] = None
+
+        # Plat grid (een byte per tegel) met 1 voor blokkerende tegels, voor snelle collision queries
+        self.blocking_tiles: bytearray = bytearray()
+
+        # Navigatie-grid voor pathfinding, wordt pas opgebouwd als het nodig is
+        self.navigation_grid: Optional[NavGrid] = None
+
+        # HPA* pathfinder op het navigatie-grid, houdt zijn clusters bij als de map verandert
+        self.hierarchical_pathfinder: Optional[HierarchicalPathfinder] = None
+
+        # alle interactieve objecten van de map, opgebouwd samen met de muren
+        self.interactable_index = InteractableIndex(tile_size)
+
+        # Voorgebakken chunks per laag: {laag: {(chunk kolom, chunk rij): surface of None}}
+        # None betekent dat de chunk alleen lege tegels heeft en niet getekend hoeft te worden
+        self.layer_chunk_surfaces: Dict[str, Dict[Tuple[int, int], Optional[pygame.Surface]]] = {}
 
         # Variabele voor de grote achtergrondafbeelding
         self.background_image: Optional[pygame.Surface] = None
@@ -44,7 +73,7 @@ class Tilemap:
         Laadt een grote afbeelding die als achtergrond voor het level dient.
         """
         try:
-            image = pygame.image.load(path).convert()
+            image = asset_cache.get_image(path, has_alpha=False)
             self.background_image = image
             print(f"Grote achtergrond succesvol geladen: {path}")
         except pygame.error as error_message:
@@ -52,25 +81,53 @@ class Tilemap:
 
     def load_from_file(self, file_path: str) -> None:
         """
-        Laadt de levelgegevens (het grid) vanuit een JSON-bestand.
+        Laadt de levelgegevens (het grid) vanuit een JSON-bestand of een binair mapbestand.
         """
+        if file_path.endswith(BINARY_MAP_EXTENSION):
+            self.load_from_binary(file_path)
+            return
+
         try:
             with open(file_path, "r", encoding="utf-8") as file_handle:
                 data = json.load(file_handle)
 
-            if "grid" in data:
-                grid_data = data["grid"]
-                self.layers["collision"] = grid_data
-                self.layers["background"] = [] 
-            else:
-                self.layers = data
+            self.load_from_data(data)
+            print(f"Map data succesvol geladen: {file_path}")
+
+        except Exception as error_message:
+            print(f"Fout opgetreden bij het laden van de map: {error_message}")
+
+    def load_from_data(self, data: Dict[str, List[List[int]]]) -> None:
+        """
+        Laadt de levelgegevens uit een al ingelezen dictionary,
+        in hetzelfde formaat als de JSON-bestanden.
+        """
+        if "grid" in data:
+            grid_data = data["grid"]
+            self.layers["collision"] = grid_data
+            self.layers["background"] = [] 
+        else:
+            self.layers = data
 
-            # Bepaal de afmetingen van de map op basis van de collision-laag
-            collision_layer = self.layers.get("collision", [])
-            self.map_height = len(collision_layer)
-            self.map_width = len(collision_layer[0]) if collision_layer else 0
+        # Bepaal de afmetingen van de map op basis van de collision-laag
+        collision_layer = self.layers.get("collision", [])
+        self.map_height = len(collision_layer)
+        self.map_width = len(collision_layer[0]) if collision_layer else 0
 
-            # Genereer de muren voor collision detectie
+        # Alle lagen zijn nieuw, dus oude chunks weggooien
+        self.layer_chunk_surfaces = {}
+
+        # Genereer de muren voor collision detectie
+        self._generate_walls()
+
+    def load_from_binary(self, file_path: str) -> None:
+        """
+        Laadt een binair mapbestand (zie src/map_format.py). De lagen worden niet ingelezen
+        maar als numpy arrays op het bestand gemapt, dus laden kost bijna niets.
+        """
+        try:
+            self.map_width, self.map_height, self.layers = read_binary_map(file_path)
+            self.layer_chunk_surfaces = {}
             self._generate_walls()
             print(f"Map data succesvol geladen: {file_path}")
 
@@ -79,11 +136,22 @@ class Tilemap:
 
     def _generate_walls(self) -> None:
         """
-        Genereert een lijst met pygame.Rect objecten voor alle tegels 
+        Werkt het grid met blokkerende tegels bij voor alle tegels
         waar de speler niet doorheen mag lopen (muren, interactiepunten en borden).
+        De lijst met pygame.Rect muren wordt pas bij de eerste self.walls opnieuw gemaakt.
         """
-        self.walls = []
+        self._wall_rectangles = None
+        self.blocking_tiles = bytearray(self.map_width * self.map_height)
+        # de collision is veranderd, dus het navigatie-grid moet opnieuw gebouwd worden
+        self.navigation_grid = None
         grid = self.layers.get("collision", [])
+        self.interactable_index.build(grid)
+
+        if isinstance(grid, numpy.ndarray):
+            # array-laag uit een binair mapbestand: alles in een keer met numpy
+            blocking_grid = numpy.isin(grid, BLOCKING_TILE_TYPES)
+            self.blocking_tiles = bytearray(blocking_grid.astype(numpy.uint8).tobytes())
+            return
 
         for y_index, row in enumerate(grid):
             for x_index, tile_type in enumerate(row):
@@ -93,21 +161,163 @@ class Tilemap:
                 # Tegel 4: Minigame Jumper (blokkeert ook beweging)
                 # Tegel 5: Minigame Quiz
                 # Tegel 9: deur voor de kerk
-                if tile_type in (1, 2, 3, 4): 
-                    wall_rectangle = pygame.Rect(
-                        x_index * self.tile_size,
-                        y_index * self.tile_size,
-                        self.tile_size,
-                        self.tile_size,
-                    )
-                    self.walls.append(wall_rectangle)
+                if tile_type in BLOCKING_TILE_TYPES:
+                    self.blocking_tiles[y_index * self.map_width + x_index] = 1
+
+    @property
+    def walls(self) -> List[pygame.Rect]:
+        """
+        Geeft een lijst met pygame.Rect objecten voor alle blokkerende tegels.
+        De spel-loop gebruikt blocking_tiles en het navigatie-grid; deze lijst
+        wordt alleen gebouwd als iemand hem echt opvraagt en daarna hergebruikt.
+        """
+        if self._wall_rectangles is None:
+            if not self.blocking_tiles:
+                self._wall_rectangles = []
+            else:
+                blocking_grid = numpy.frombuffer(self.blocking_tiles, dtype=numpy.uint8).reshape(self.map_height, self.map_width)
+                row_indices, column_indices = numpy.nonzero(blocking_grid)
+                self._wall_rectangles = [
+                    pygame.Rect(x_index * self.tile_size, y_index * self.tile_size, self.tile_size, self.tile_size)
+                    for y_index, x_index in zip(row_indices.tolist(), column_indices.tolist())
+                ]
+        return self._wall_rectangles
+
+    @walls.setter
+    def walls(self, wall_rectangles: List[pygame.Rect]) -> None:
+        self._wall_rectangles = wall_rectangles
+
+    def get_navigation_grid(self) -> NavGrid:
+        """
+        Geeft het navigatie-grid voor pathfinding terug.
+        Het grid wordt een keer gebouwd en hergebruikt tot de map verandert.
+        """
+        if self.navigation_grid is None:
+            self.navigation_grid = NavGrid.from_tilemap(self)
+        return self.navigation_grid
+
+    def get_hierarchical_pathfinder(self, cluster_size: int = 16) -> HierarchicalPathfinder:
+        """
+        Geeft de HPA* pathfinder voor deze map terug. De doorgangen tussen clusters worden een keer
+        per map bepaald; na een verandering van tegels worden alleen de geraakte clusters bijgewerkt.
+        """
+        navigation_grid = self.get_navigation_grid()
+        hierarchical_pathfinder = self.hierarchical_pathfinder
+        if (
+            hierarchical_pathfinder is None
+            or hierarchical_pathfinder.cluster_size != cluster_size
+            or hierarchical_pathfinder.navigation_grid.grid_width != navigation_grid.grid_width
+            or hierarchical_pathfinder.navigation_grid.grid_height != navigation_grid.grid_height
+        ):
+            self.hierarchical_pathfinder = HierarchicalPathfinder(navigation_grid, cluster_size)
+        elif hierarchical_pathfinder.navigation_grid is not navigation_grid:
+            hierarchical_pathfinder.update_navigation_grid(navigation_grid)
+        return self.hierarchical_pathfinder
+
+    def set_tile(self, layer_name: str, column_index: int, row_index: int, tile_type: int) -> None:
+        """
+        Verandert een tegel in een laag. Bij de collision-laag worden de muren
+        en het navigatie-grid automatisch bijgewerkt.
+        """
+        if layer_name not in self.layers:
+            return
+        if not (0 <= row_index < self.map_height and 0 <= column_index < self.map_width):
+            return
+
+        self.layers[layer_name][row_index][column_index] = tile_type
+        # alleen de chunk met deze tegel hoeft opnieuw gebakken te worden
+        layer_chunks = self.layer_chunk_surfaces.get(layer_name)
+        if layer_chunks is not None:
+            layer_chunks.pop((column_index // TILE_CHUNK_SIZE, row_index // TILE_CHUNK_SIZE), None)
+        if layer_name == "collision":
+            self._generate_walls()
+
+    def is_tile_blocking(self, column_index: int, row_index: int) -> bool:
+        """
+        Geeft aan of de tegel op de gegeven grid-positie beweging blokkeert.
+        Tegels buiten de map blokkeren niet, net als bij de lijst met muren.
+        """
+        if 0 <= column_index < self.map_width and 0 <= row_index < self.map_height:
+            return self.blocking_tiles[row_index * self.map_width + column_index] == 1
+        return False
+
+    def collides_with_rect(self, rectangle: pygame.Rect) -> bool:
+        """
+        Controleert of een hitbox een blokkerende tegel raakt.
+        Alleen de paar tegels die de hitbox overlapt worden getest,
+        dus de kosten hangen niet af van de grootte van de map.
+        """
+        if rectangle.width <= 0 or rectangle.height <= 0:
+            return False
+
+        column_start = max(0, rectangle.left // self.tile_size)
+        column_end = min(self.map_width - 1, (rectangle.right - 1) // self.tile_size)
+        row_start = max(0, rectangle.top // self.tile_size)
+        row_end = min(self.map_height - 1, (rectangle.bottom - 1) // self.tile_size)
+
+        for row_index in range(row_start, row_end + 1):
+            row_offset = row_index * self.map_width
+            for column_index in range(column_start, column_end + 1):
+                if self.blocking_tiles[row_offset + column_index]:
+                    return True
+        return False
+
+    def collides_with_rects(self, lefts, tops, widths, heights) -> numpy.ndarray:
+        """
+        Gevectoriseerde versie van collides_with_rect voor veel hitboxen tegelijk
+        (numpy arrays met float posities). Geeft per hitbox True/False terug.
+        Posities worden net als bij pygame.Rect naar nul afgerond.
+        """
+        hitbox_count = len(lefts)
+        collisions = numpy.zeros(hitbox_count, dtype=bool)
+        if hitbox_count == 0 or self.map_width == 0 or self.map_height == 0:
+            return collisions
+
+        blocking_grid = numpy.frombuffer(self.blocking_tiles, dtype=numpy.uint8).reshape(self.map_height, self.map_width)
+
+        left_pixels = numpy.trunc(lefts).astype(numpy.int64)
+        top_pixels = numpy.trunc(tops).astype(numpy.int64)
+        right_pixels = left_pixels + widths
+        bottom_pixels = top_pixels + heights
+
+        column_start = numpy.maximum(0, left_pixels // self.tile_size)
+        column_end = numpy.minimum(self.map_width - 1, (right_pixels - 1) // self.tile_size)
+        row_start = numpy.maximum(0, top_pixels // self.tile_size)
+        row_end = numpy.minimum(self.map_height - 1, (bottom_pixels - 1) // self.tile_size)
+
+        # loop alleen over de paar tegel-offsets die een hitbox kan overlappen
+        maximum_columns = int(numpy.max(widths)) // self.tile_size + 2
+        maximum_rows = int(numpy.max(heights)) // self.tile_size + 2
+        for row_offset in range(maximum_rows):
+            row_indices = row_start + row_offset
+            rows_valid = row_indices <= row_end
+            for column_offset in range(maximum_columns):
+                column_indices = column_start + column_offset
+                tiles_valid = rows_valid & (column_indices <= column_end)
+                if not tiles_valid.any():
+                    continue
+                collisions[tiles_valid] |= blocking_grid[row_indices[tiles_valid], column_indices[tiles_valid]] == 1
+
+        return collisions
 
     def draw_background(self, screen: pygame.Surface, camera_x: float = 0, camera_y: float = 0) -> None:
         """
         Tekent de achtergrondafbeelding op het scherm, rekening houdend met de camera-positie.
+        Alleen het stuk van de afbeelding dat de camera ziet wordt geblit.
         """
         if self.background_image:
-            screen.blit(self.background_image, (-camera_x, -camera_y))
+            # zelfde afronding als een blit op (-camera_x, -camera_y)
+            offset_x = int(-camera_x)
+            offset_y = int(-camera_y)
+            destination_x = max(0, offset_x)
+            destination_y = max(0, offset_y)
+            visible_area = pygame.Rect(
+                destination_x - offset_x,
+                destination_y - offset_y,
+                screen.get_width() - destination_x,
+                screen.get_height() - destination_y,
+            )
+            screen.blit(self.background_image, (destination_x, destination_y), visible_area)
         else:
             # Fallback: teken de muren als gekleurde blokken als de afbeelding ontbreekt
             self.draw_layer(screen, "collision", camera_x, camera_y)
@@ -115,47 +325,111 @@ class Tilemap:
     def draw_layer(self, screen, layer_name, camera_x, camera_y):
         """
         Tekent een specifieke laag tegels. Wordt voornamelijk als fallback gebruikt.
+        De laag is opgedeeld in chunks van TILE_CHUNK_SIZE x TILE_CHUNK_SIZE tegels die een keer
+        worden gebakken, dus alleen de paar chunks binnen het zichtveld worden geblit.
         """
-        if layer_name not in self.layers:
+        if layer_name not in self.layers or self.map_width == 0 or self.map_height == 0:
             return
-        
-        grid = self.layers[layer_name]
-        for y_index, row in enumerate(grid):
-            for x_index, tile_type in enumerate(row):
-                if tile_type == 0: 
+
+        chunk_pixel_size = TILE_CHUNK_SIZE * self.tile_size
+        chunk_column_count = (self.map_width + TILE_CHUNK_SIZE - 1) // TILE_CHUNK_SIZE
+        chunk_row_count = (self.map_height + TILE_CHUNK_SIZE - 1) // TILE_CHUNK_SIZE
+
+        # Bepaal welke chunks binnen het zichtveld van het scherm vallen
+        chunk_column_start = max(0, int(camera_x // chunk_pixel_size))
+        chunk_column_end = min(chunk_column_count - 1, int((camera_x + screen.get_width()) // chunk_pixel_size))
+        chunk_row_start = max(0, int(camera_y // chunk_pixel_size))
+        chunk_row_end = min(chunk_row_count - 1, int((camera_y + screen.get_height()) // chunk_pixel_size))
+
+        layer_chunks = self.layer_chunk_surfaces.setdefault(layer_name, {})
+        for chunk_row in range(chunk_row_start, chunk_row_end + 1):
+            for chunk_column in range(chunk_column_start, chunk_column_end + 1):
+                chunk_key = (chunk_column, chunk_row)
+                if chunk_key in layer_chunks:
+                    chunk_surface = layer_chunks[chunk_key]
+                else:
+                    chunk_surface = self._bake_chunk(layer_name, chunk_column, chunk_row)
+                    layer_chunks[chunk_key] = chunk_surface
+
+                if chunk_surface is not None:
+                    screen.blit(
+                        chunk_surface,
+                        (chunk_column * chunk_pixel_size - camera_x, chunk_row * chunk_pixel_size - camera_y),
+                    )
+
+    def _bake_chunk(self, layer_name: str, chunk_column: int, chunk_row: int) -> Optional[pygame.Surface]:
+        """
+        Tekent de tegels van een chunk op een eigen transparante surface.
+        Geeft None terug als er in de chunk niets te tekenen is.
+        """
+        column_start = chunk_column * TILE_CHUNK_SIZE
+        column_end = min(self.map_width, column_start + TILE_CHUNK_SIZE)
+        row_start = chunk_row * TILE_CHUNK_SIZE
+        row_end = min(self.map_height, row_start + TILE_CHUNK_SIZE)
+
+        chunk_surface = None
+        for row_index in range(row_start, row_end):
+            for column_index in range(column_start, column_end):
+                tile_type = self.get_tile_at(layer_name, column_index, row_index)
+                if not tile_type:
+                    continue
+
+                color = self.tile_colors.get(tile_type, (255, 0, 255))
+                if not color:
                     continue
-                
-                screen_position_x = x_index * self.tile_size - camera_x
-                screen_position_y = y_index * self.tile_size - camera_y
 
-                # Teken de tegel alleen als deze binnen het zichtveld van het scherm valt
-                if -self.tile_size < screen_position_x < screen.get_width() and \
-                   -self.tile_size < screen_position_y < screen.get_height():
-                    color = self.tile_colors.get(tile_type, (255, 0, 255))
-                    if color:
-                        pygame.draw.rect(screen, color, (screen_position_x, screen_position_y, self.tile_size, self.tile_size))
+                if chunk_surface is None:
+                    chunk_surface = pygame.Surface(
+                        ((column_end - column_start) * self.tile_size, (row_end - row_start) * self.tile_size),
+                        pygame.SRCALPHA,
+                    )
+                pygame.draw.rect(
+                    chunk_surface,
+                    color,
+                    (
+                        (column_index - column_start) * self.tile_size,
+                        (row_index - row_start) * self.tile_size,
+                        self.tile_size,
+                        self.tile_size,
+                    ),
+                )
+        return chunk_surface
+
+    def get_nearest_interactable(self, world_coordinate_x, world_coordinate_y, search_radius) -> Optional[InteractableObject]:
+        """
+        Geeft het dichtstbijzijnde interactieve object (2, 3, 4, 5 of 9) binnen een straal rondom een punt,
+        of None. Komt uit de index, dus goedkoop genoeg om elk frame te vragen.
+        """
+        return self.interactable_index.query_nearest(world_coordinate_x, world_coordinate_y, search_radius)
 
     def get_interaction_tile_info(self, world_coordinate_x, world_coordinate_y, search_radius):
         """
-        Zoekt naar interactieve tegels (2, 3, 4 of 9) binnen een straal rondom de speler.
-        Geeft het ID en de exacte locatie in het grid terug.
+        Zoekt naar interactieve tegels (2, 3, 4, 5 of 9) binnen een straal rondom de speler.
+        Geeft het ID en de locatie van het object in het grid terug (de eerste tegel van het object).
         """
-        grid_column_start = int((world_coordinate_x - search_radius) // self.tile_size)
-        grid_column_end = int((world_coordinate_x + search_radius) // self.tile_size)
-        grid_row_start = int((world_coordinate_y - search_radius) // self.tile_size)
-        grid_row_end = int((world_coordinate_y + search_radius) // self.tile_size)
+        interactable_object = self.get_nearest_interactable(world_coordinate_x, world_coordinate_y, search_radius)
+        if interactable_object is None:
+            return None, None, None
+        return interactable_object.tile_type, interactable_object.row_index, interactable_object.column_index
 
-        collision_grid = self.layers.get("collision", [])
-        
-        for row_index in range(grid_row_start, grid_row_end + 1):
-            for column_index in range(grid_column_start, grid_column_end + 1):
-                if 0 <= row_index < self.map_height and 0 <= column_index < self.map_width:
-                    tile_value = collision_grid[row_index][column_index]
-                    
-                    if tile_value in (2, 3, 4, 5, 9):
-                        return tile_value, row_index, column_index
-                        
-        return None, None, None
+    def get_tile_at(self, layer_name, column_index, row_index):
+        """
+        Geeft de tegelwaarde terug op een grid-positie (kolom, rij), of None buiten de map.
+        """
+        if layer_name not in self.layers:
+            return None
+        if 0 <= row_index < self.map_height and 0 <= column_index < self.map_width:
+            grid = self.layers[layer_name]
+            # een laag kan leeg zijn (zoals de achtergrond bij oude maps)
+            if row_index < len(grid):
+                return grid[row_index][column_index]
+        return None
+
+    def stream_around(self, world_coordinate_x, world_coordinate_y, radius_pixels):
+        """
+        Zorgt dat het gebied rond een punt geladen is. Een gewone Tilemap heeft
+        altijd de hele map in het geheugen, dus hier hoeft niets te gebeuren.
+        """
 
     def get_tile(self, layer_name, world_coordinate_x, world_coordinate_y):
         """
@@ -1,5 +1,52 @@
+from functools import lru_cache
+
 import pygame
+from src.asset_cache import asset_cache
 from src.colors import *
+from src.fonts import get_font
+
+# Hint onderaan het scherm als de speler naast een interactief object staat, per tegeltype
+INTERACTION_PROMPT_TEXTS = {
+    2: "Press SPACE to use the operator shooter",
+    3: "Press SPACE to read the sign",
+    4: "Press SPACE to use the python track",
+    5: "Press SPACE to take the python quiz",
+    9: "Press SPACE to open the church door",
+}
+
+
+@lru_cache(maxsize=16)
+def render_interaction_prompt(prompt_text):
+    """Rendert de hint een keer met een donkere achtergrond."""
+    text_surface = get_font(26).render(prompt_text, True, WHITE)
+    prompt_surface = pygame.Surface((text_surface.get_width() + 24, text_surface.get_height() + 12))
+    prompt_surface.fill(BLACK)
+    prompt_surface.blit(text_surface, (12, 6))
+    return prompt_surface
+
+
+@lru_cache(maxsize=32)
+def layout_message_lines(message_text, font_size, max_line_width):
+    """
+    Splitst een bericht op in regels die binnen max_line_width passen (word wrap)
+    en rendert elke regel. Het resultaat wordt per (bericht, font, breedte) bewaard,
+    zodat hetzelfde bericht niet elke frame opnieuw wordt opgemaakt.
+    """
+    info_font = get_font(font_size)
+    words_list = message_text.split(' ')
+    lines_list = []
+    current_line_text = ""
+
+    for word in words_list:
+        test_line_text = current_line_text + word + " "
+        if info_font.size(test_line_text)[0] < max_line_width:
+            current_line_text = test_line_text
+        else:
+            lines_list.append(current_line_text)
+            current_line_text = word + " "
+    lines_list.append(current_line_text)
+
+    return tuple(info_font.render(line_text, True, WHITE) for line_text in lines_list)
 
 class UI:
     """
@@ -22,12 +69,25 @@ class UI:
         self.screen_height_pixels = screen_height_pixels
         
         # Initialiseer het lettertype voor de interface
-        self.user_interface_font = pygame.font.Font(None, 36)
+        self.user_interface_font = get_font(36)
+
+        # Het halfdoorzichtige vak voor informatieberichten wordt maar een keer gemaakt
+        self.message_box_width_pixels = 640
+        self.message_box_height_pixels = 140
+        self.message_container_surface = pygame.Surface((self.message_box_width_pixels, self.message_box_height_pixels))
+        self.message_container_surface.set_alpha(230)
+        self.message_container_surface.fill(BLACK)
+
+        # Gecachte panelen, worden alleen opnieuw getekend als de waarde verandert
+        self.health_panel_surface = None
+        self.health_panel_cache_key = None
+        self.keys_panel_surface = None
+        self.keys_panel_position = (0, 0)
+        self.keys_panel_cache_key = None
 
         # Probeer de afbeelding voor de sleutels te laden
         try:
-            self.key_icon_surface = pygame.image.load("assets/key.png").convert_alpha()
-            self.key_icon_surface = pygame.transform.scale(self.key_icon_surface, (32, 32))
+            self.key_icon_surface = asset_cache.get_image("assets/key.png", scale_size=(32, 32))
         except pygame.error:
             # Als het bestand niet bestaat, gebruiken we geen afbeelding
             self.key_icon_surface = None
@@ -42,100 +102,123 @@ class UI:
     def draw_health_bar(self, screen_surface, player_instance):
         """
         Tekent de gezondheidsbalk van de speler aan de linkerkant van het scherm.
+        Het paneel wordt alleen opnieuw gerenderd als de gezondheid verandert.
         """
+        cache_key = (player_instance.health, player_instance.max_health)
+        if cache_key != self.health_panel_cache_key:
+            self.health_panel_surface = self._render_health_panel(player_instance)
+            self.health_panel_cache_key = cache_key
+
+        screen_surface.blit(self.health_panel_surface, (self.HEALTH_BAR_X_POSITION, self.HEALTH_BAR_Y_POSITION))
+
+    def _render_health_panel(self, player_instance):
+        """Rendert de balk en de HP-tekst samen op een doorzichtig oppervlak."""
         bar_width = self.HEALTH_BAR_WIDTH
         bar_height = self.HEALTH_BAR_HEIGHT
-        coordinate_x = self.HEALTH_BAR_X_POSITION
-        coordinate_y = self.HEALTH_BAR_Y_POSITION
-        
+
+        health_text_surface = self.user_interface_font.render(
+            f"HP: {int(player_instance.health)}/{player_instance.max_health}", 
+            True, 
+            WHITE
+        )
+        panel_width = bar_width + self.TEXT_OFFSET_X_COORDINATE + health_text_surface.get_width()
+        panel_height = max(bar_height, health_text_surface.get_height())
+        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+
         # Teken de achtergrond van de balk (donkerrood)
-        pygame.draw.rect(screen_surface, DARK_RED, (coordinate_x, coordinate_y, bar_width, bar_height))
+        pygame.draw.rect(panel_surface, DARK_RED, (0, 0, bar_width, bar_height))
         
         # Bereken de breedte van de huidige gezondheid en teken de groene balk
         health_percentage = player_instance.health / player_instance.max_health
         current_health_bar_width = int(bar_width * health_percentage)
-        pygame.draw.rect(screen_surface, GREEN, (coordinate_x, coordinate_y, current_health_bar_width, bar_height))
+        pygame.draw.rect(panel_surface, GREEN, (0, 0, current_health_bar_width, bar_height))
         
         # Teken een witte rand om de balk
-        pygame.draw.rect(screen_surface, WHITE, (coordinate_x, coordinate_y, bar_width, bar_height), 1)
+        pygame.draw.rect(panel_surface, WHITE, (0, 0, bar_width, bar_height), 1)
         
         # Teken de HP-tekst naast de balk
-        health_text_surface = self.user_interface_font.render(
-            f"HP: {int(player_instance.health)}/{player_instance.max_health}", 
-            True, 
-            WHITE
-        )
-        screen_surface.blit(
-            health_text_surface, 
-            (coordinate_x + bar_width + self.TEXT_OFFSET_X_COORDINATE, coordinate_y)
-        )
+        panel_surface.blit(health_text_surface, (bar_width + self.TEXT_OFFSET_X_COORDINATE, 0))
+        return panel_surface
     
     def draw_info_message(self, screen_surface, message_text):
         """
         Tekent een tekstvak in het midden onderaan het scherm met automatische tekstafbreking.
+        De opgemaakte regels komen uit een cache, dus alleen een nieuw bericht wordt gerenderd.
         """
-        box_width_pixels = 640
-        box_height_pixels = 140
+        box_width_pixels = self.message_box_width_pixels
+        box_height_pixels = self.message_box_height_pixels
         
         # Gebruik de correcte variabelenamen voor de schermresolutie
         box_coordinate_x = (self.screen_width_pixels - box_width_pixels) // 2
         box_coordinate_y = self.screen_height_pixels - box_height_pixels - 60
 
-        # Maak een transparant oppervlak voor de container
-        message_container_surface = pygame.Surface((box_width_pixels, box_height_pixels))
-        message_container_surface.set_alpha(230)
-        message_container_surface.fill(BLACK)
-        screen_surface.blit(message_container_surface, (box_coordinate_x, box_coordinate_y))
+        # Het transparante oppervlak voor de container
+        screen_surface.blit(self.message_container_surface, (box_coordinate_x, box_coordinate_y))
         
         # Teken de witte rand van de container
         pygame.draw.rect(screen_surface, WHITE, (box_coordinate_x, box_coordinate_y, box_width_pixels, box_height_pixels), 2)
 
-        # Logica om de tekst op te splitsen in meerdere regels (word wrap)
-        info_font = pygame.font.Font(None, 30)
-        words_list = message_text.split(' ')
-        lines_list = []
-        current_line_text = ""
-
-        for word in words_list:
-            test_line_text = current_line_text + word + " "
-            if info_font.size(test_line_text)[0] < box_width_pixels - 40:
-                current_line_text = test_line_text
-            else:
-                lines_list.append(current_line_text)
-                current_line_text = word + " "
-        lines_list.append(current_line_text)
-
         # Teken elke regel tekst in het venster
-        for line_index, line_text in enumerate(lines_list):
-            text_line_surface = info_font.render(line_text, True, WHITE)
+        for line_index, text_line_surface in enumerate(layout_message_lines(message_text, 30, box_width_pixels - 40)):
             screen_surface.blit(
                 text_line_surface, 
                 (box_coordinate_x + 20, box_coordinate_y + 25 + (line_index * 32))
             )
 
+    def draw_interaction_prompt(self, screen_surface, tile_type):
+        """Tekent de hint voor het interactieve object waar de speler naast staat, midden onderaan."""
+        prompt_text = INTERACTION_PROMPT_TEXTS.get(tile_type)
+        if prompt_text is None:
+            return
+        prompt_surface = render_interaction_prompt(prompt_text)
+        screen_surface.blit(prompt_surface, prompt_surface.get_rect(midbottom=(self.screen_width_pixels // 2, self.screen_height_pixels - 24)))
+
     def draw_keys_inventory(self, screen_surface, player_instance):
         """
         Tekent de verzamelde sleutels rechtsboven in het scherm.
+        Het paneel wordt alleen opnieuw gerenderd als het aantal sleutels verandert.
         """
+        if player_instance.keys_collected_count != self.keys_panel_cache_key:
+            self._render_keys_panel(player_instance.keys_collected_count)
+            self.keys_panel_cache_key = player_instance.keys_collected_count
+
+        screen_surface.blit(self.keys_panel_surface, self.keys_panel_position)
+
+    def _render_keys_panel(self, keys_collected_count):
+        """Rendert de sleutel-iconen en de teller samen op een doorzichtig oppervlak."""
         # Startpunt aan de rechterkant van het scherm
         inventory_coordinate_x = self.screen_width_pixels - 50
         inventory_coordinate_y = 30
         spacing_pixels = 40
+        icon_size_pixels = 32 if self.key_icon_surface else 25
+
+        keys_status_text = f"Keys: {keys_collected_count} / 3"
+        text_surface = self.user_interface_font.render(keys_status_text, True, (255, 255, 255))
+        text_x = self.screen_width_pixels - text_surface.get_width() - 20
+        text_y = inventory_coordinate_y + 45
+
+        # Bepaal het gebied dat het paneel op het scherm beslaat
+        leftmost_icon_x = inventory_coordinate_x - max(0, keys_collected_count - 1) * spacing_pixels
+        panel_left = min(leftmost_icon_x, text_x)
+        panel_top = inventory_coordinate_y
+        panel_right = max(inventory_coordinate_x + icon_size_pixels, text_x + text_surface.get_width())
+        panel_bottom = text_y + text_surface.get_height()
+        panel_surface = pygame.Surface((panel_right - panel_left, panel_bottom - panel_top), pygame.SRCALPHA)
 
         # Teken een icoon voor elke verzamelde sleutel
-        for key_index in range(player_instance.keys_collected_count):
-            render_location_x = inventory_coordinate_x - (key_index * spacing_pixels)
+        for key_index in range(keys_collected_count):
+            render_location_x = inventory_coordinate_x - (key_index * spacing_pixels) - panel_left
+            render_location_y = inventory_coordinate_y - panel_top
             
             if self.key_icon_surface:
-                screen_surface.blit(self.key_icon_surface, (render_location_x, inventory_coordinate_y))
+                panel_surface.blit(self.key_icon_surface, (render_location_x, render_location_y))
             else:
                 # Fallback: geel vierkantje als de afbeelding ontbreekt
-                pygame.draw.rect(screen_surface, (255, 215, 0), (render_location_x, inventory_coordinate_y, 25, 25))
-                pygame.draw.rect(screen_surface, (255, 255, 255), (render_location_x, inventory_coordinate_y, 25, 25), 2)
+                pygame.draw.rect(panel_surface, (255, 215, 0), (render_location_x, render_location_y, 25, 25))
+                pygame.draw.rect(panel_surface, (255, 255, 255), (render_location_x, render_location_y, 25, 25), 2)
 
         # Teken de tekst-teller
-        keys_status_text = f"Keys: {player_instance.keys_collected_count} / 3"
-        text_surface = self.user_interface_font.render(keys_status_text, True, (255, 255, 255))
-        text_x = self.screen_width_pixels - text_surface.get_width() - 20
-        text_y = inventory_coordinate_y + 45
-        screen_surface.blit(text_surface, (text_x, text_y))
\ No newline at end of file
+        panel_surface.blit(text_surface, (text_x - panel_left, text_y - panel_top))
+
+        self.keys_panel_surface = panel_surface
+        self.keys_panel_position = (panel_left, panel_top)
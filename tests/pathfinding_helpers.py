@@ -0,0 +1,36 @@
+"""Gedeelde hulpfuncties voor de pathfinding tests."""
+import random
+
+from src.tilemap import Tilemap
+
+
+def maak_doolhof_tilemap(map_width=48, map_height=40, seed=5):
+    # muur rondom, lange muren met gaten en losse blokken, zodat paden langs meerdere clusters moeten
+    random_generator = random.Random(seed)
+    grid = [[0] * map_width for _ in range(map_height)]
+    for row_index in range(map_height):
+        for column_index in range(map_width):
+            if row_index in (0, map_height - 1) or column_index in (0, map_width - 1):
+                grid[row_index][column_index] = 1
+            elif column_index % 12 == 6 and row_index % 9 not in (3, 4, 5):
+                grid[row_index][column_index] = 1
+            elif random_generator.random() < 0.05:
+                grid[row_index][column_index] = 1
+    # houd de hoeken vrij voor start en doel
+    for row_index in range(1, 5):
+        for column_index in range(1, 5):
+            grid[row_index][column_index] = 0
+            grid[map_height - 1 - row_index][map_width - 1 - column_index] = 0
+
+    tilemap_instance = Tilemap(tile_size=48)
+    tilemap_instance.load_from_data({"collision": grid})
+    return tilemap_instance
+
+
+def controleer_pad(navigation_grid, path, goal_position):
+    # elke stap gaat naar een buurtegel die vrij is, en het pad eindigt op de tegel van het doel
+    tile_path = [navigation_grid.world_to_grid(*waypoint) for waypoint in path]
+    for (previous_x, previous_y), (grid_x, grid_y) in zip(tile_path, tile_path[1:]):
+        assert max(abs(grid_x - previous_x), abs(grid_y - previous_y)) == 1
+        assert not navigation_grid.is_blocked(grid_x, grid_y)
+    assert tile_path[-1] == navigation_grid.world_to_grid(*goal_position)
@@ -0,0 +1,30 @@
+import pygame
+from src.asset_cache import AssetCache, asset_cache
+from src.player import Player
+
+
+def test_images_are_loaded_once_and_variants_are_cached():
+    # dezelfde afbeelding en dezelfde variant mogen maar een keer gemaakt worden
+    cache_instance = AssetCache()
+    first_icon = cache_instance.get_image("assets/key.png", scale_size=(32, 32))
+    second_icon = cache_instance.get_image("assets/key.png", scale_size=(32, 32))
+    flipped_icon = cache_instance.get_image("assets/key.png", scale_size=(32, 32), flip_horizontal=True)
+
+    assert first_icon is second_icon
+    assert first_icon.get_size() == (32, 32)
+    assert cache_instance.disk_load_count == 1
+    assert pygame.image.tobytes(flipped_icon, "RGBA") == pygame.image.tobytes(pygame.transform.flip(first_icon, True, False), "RGBA")
+
+
+def test_players_share_pre_flipped_frames():
+    # een tweede speler leest niets meer van schijf en tekenen hoeft niet meer te spiegelen
+    first_player = Player(0, 0)
+    load_count_before = asset_cache.disk_load_count
+    second_player = Player(10, 10)
+
+    assert asset_cache.disk_load_count == load_count_before
+    assert second_player.walking_animation_sprites is first_player.walking_animation_sprites
+
+    for right_frame, left_frame in zip(first_player.walking_animation_sprites, first_player.walking_animation_sprites_flipped):
+        expected_frame = pygame.transform.flip(right_frame, True, False)
+        assert pygame.image.tobytes(left_frame, "RGBA") == pygame.image.tobytes(expected_frame, "RGBA")
@@ -0,0 +1,106 @@
+import random
+
+import pygame
+from src.chunked_tilemap import ChunkedTilemap, convert_map_to_regions, load_tilemap
+from src.simulation import Simulation, SimulationInput
+from src.tilemap import Tilemap
+
+GARDEN_MAP = "assets/maps/Garden_1.json"
+
+
+def maak_opgedeelde_garden(tmp_path, maximum_loaded_regions=4):
+    # kleine regio's en een klein budget, zodat er veel geladen en weggegooid wordt
+    convert_map_to_regions(GARDEN_MAP, str(tmp_path), region_size=8)
+    chunked_tilemap = ChunkedTilemap(maximum_loaded_regions=maximum_loaded_regions)
+    chunked_tilemap.load_from_file(str(tmp_path))
+    return chunked_tilemap
+
+
+def test_chunked_tilemap_matches_full_tilemap(tmp_path):
+    full_tilemap = load_tilemap(GARDEN_MAP)
+    chunked_tilemap = maak_opgedeelde_garden(tmp_path)
+    assert (chunked_tilemap.map_width, chunked_tilemap.map_height) == (full_tilemap.map_width, full_tilemap.map_height)
+
+    random_generator = random.Random(11)
+    for _ in range(500):
+        world_x = random_generator.randint(-100, full_tilemap.map_width * 48 + 100)
+        world_y = random_generator.randint(-100, full_tilemap.map_height * 48 + 100)
+        hitbox = pygame.Rect(world_x, world_y, random_generator.randint(1, 120), random_generator.randint(1, 120))
+
+        assert chunked_tilemap.get_tile("collision", world_x, world_y) == full_tilemap.get_tile("collision", world_x, world_y)
+        assert chunked_tilemap.collides_with_rect(hitbox) == full_tilemap.collides_with_rect(hitbox)
+        assert chunked_tilemap.get_interaction_tile_info(world_x, world_y, 60) == full_tilemap.get_interaction_tile_info(world_x, world_y, 60)
+        assert len(chunked_tilemap.loaded_regions) <= 4
+
+    assert chunked_tilemap.get_navigation_grid().blocked_tiles == full_tilemap.get_navigation_grid().blocked_tiles
+
+
+def test_chunked_tilemap_keeps_changed_regions(tmp_path):
+    # een veranderde tegel mag niet verdwijnen als zijn regio uit het budget valt
+    chunked_tilemap = maak_opgedeelde_garden(tmp_path, maximum_loaded_regions=1)
+    chunked_tilemap.set_tile("collision", 2, 2, 1)
+    chunked_tilemap.stream_around(1500, 900, 400)
+
+    assert chunked_tilemap.is_tile_blocking(2, 2)
+
+
+def test_changed_regions_stay_within_budget(tmp_path):
+    # veranderde regio's worden gewoon weggegooid, de veranderingen komen terug bij het opnieuw laden
+    chunked_tilemap = maak_opgedeelde_garden(tmp_path, maximum_loaded_regions=2)
+    changed_positions = [(column_index, 3) for column_index in range(1, chunked_tilemap.map_width, 8)]
+    for column_index, row_index in changed_positions:
+        chunked_tilemap.set_tile("collision", column_index, row_index, 1)
+        assert len(chunked_tilemap.loaded_regions) <= 2
+
+    chunked_tilemap.stream_around(1500, 900, 0)
+    for column_index, row_index in changed_positions:
+        assert chunked_tilemap.get_tile_at("collision", column_index, row_index) == 1
+        assert chunked_tilemap.is_tile_blocking(column_index, row_index)
+    assert len(chunked_tilemap.loaded_regions) <= 2
+
+
+def test_stream_around_keeps_nearest_regions_when_radius_exceeds_budget(tmp_path):
+    chunked_tilemap = maak_opgedeelde_garden(tmp_path, maximum_loaded_regions=2)
+    region_pixel_size = chunked_tilemap.region_size * chunked_tilemap.tile_size
+    center_x, center_y = region_pixel_size * 1.5, region_pixel_size * 1.5
+    chunked_tilemap.stream_around(center_x, center_y, region_pixel_size * 2)
+
+    assert len(chunked_tilemap.loaded_regions) == 2
+    # de regio onder het punt is als laatste geladen en dus niet door de andere weggeduwd
+    assert list(chunked_tilemap.loaded_regions)[-1] == (1, 1)
+    assert chunked_tilemap.has_warned_about_stream_radius
+
+
+def test_set_tile_patches_navigation_grid(tmp_path):
+    chunked_tilemap = maak_opgedeelde_garden(tmp_path)
+    full_tilemap = load_tilemap(GARDEN_MAP)
+    chunked_tilemap.get_navigation_grid()
+
+    # ook tegels op de grens van een regio en aan de rand van de map
+    for column_index, row_index, tile_type in ((7, 7, 1), (8, 8, 1), (7, 7, 0), (0, 0, 0), (chunked_tilemap.map_width - 1, 5, 1)):
+        region_load_count = chunked_tilemap.region_load_count
+        chunked_tilemap.set_tile("collision", column_index, row_index, tile_type)
+        full_tilemap.set_tile("collision", column_index, row_index, tile_type)
+        navigation_grid = chunked_tilemap.get_navigation_grid()
+        # alleen de regio van de tegel en zijn buren links en boven, niet de hele map
+        assert chunked_tilemap.region_load_count - region_load_count <= 4
+        assert navigation_grid.blocked_tiles == full_tilemap.get_navigation_grid().blocked_tiles
+
+
+def test_simulation_runs_on_chunked_map(tmp_path):
+    # dezelfde invoer moet op een opgedeelde map precies hetzelfde spel geven
+    convert_map_to_regions(GARDEN_MAP, str(tmp_path), region_size=8)
+    simulations = [Simulation(map_path, 1440, 960) for map_path in (GARDEN_MAP, str(tmp_path))]
+    assert isinstance(simulations[0].game_map, Tilemap)
+    assert isinstance(simulations[1].game_map, ChunkedTilemap)
+
+    for tick_index in range(400):
+        simulation_input = SimulationInput(move_left=tick_index % 200 < 100, move_up=tick_index % 120 < 40)
+        for simulation_instance in simulations:
+            simulation_instance.tick(simulation_input)
+
+    positions = [
+        [(entity.position_coordinate_x, entity.position_coordinate_y) for entity in [simulation_instance.player_character] + simulation_instance.enemy_list]
+        for simulation_instance in simulations
+    ]
+    assert positions[0] == positions[1]
@@ -0,0 +1,53 @@
+import pygame
+from src import enemy as enemy_module
+from src.colors import GRAY, RED
+from src.enemy import GLITCH_CHARACTERS, Dog, get_glitch_frames
+
+
+def weiger_font(*arguments, **keyword_arguments):
+    raise AssertionError("het font systeem mag hier niet gebruikt worden")
+
+
+def test_glitch_frames_are_shared_and_spawning_skips_fonts(monkeypatch):
+    enemy_module._glitch_frame_pools.clear()
+    # honden maken mag geen fonts laden of tekst renderen
+    monkeypatch.setattr(pygame.font, "SysFont", weiger_font)
+    monkeypatch.setattr(pygame.font, "Font", weiger_font)
+    monkeypatch.setattr(enemy_module, "_glitch_font", None)
+    dog_list = [Dog(index * 30, 100) for index in range(50)]
+    assert not enemy_module._glitch_frame_pools
+    monkeypatch.undo()
+
+    pygame.font.init()
+    screen_surface = pygame.Surface((400, 300))
+    for dog in dog_list:
+        dog.draw_at_position(screen_surface, 10, 10)
+    # een pool per (grootte, kleur), gedeeld door alle honden
+    assert list(enemy_module._glitch_frame_pools) == [(80, 40, GRAY)]
+
+    dog_list[0].current_state = "chase"
+    dog_list[0].draw_at_position(screen_surface, 10, 10)
+    assert set(enemy_module._glitch_frame_pools) == {(80, 40, GRAY), (80, 40, RED)}
+    assert get_glitch_frames(80, 40, GRAY) is enemy_module._glitch_frame_pools[(80, 40, GRAY)]
+
+
+def test_glitch_frames_keep_glyph_overflow():
+    # vroeger werden de tekens direct op het scherm getekend en staken ze buiten de vijand uit
+    pygame.font.init()
+    enemy_module._glitch_frame_pools.clear()
+    frame_pool = get_glitch_frames(80, 40, GRAY)
+
+    widest_glyph_width = max(enemy_module._get_glitch_glyph(character, GRAY).get_width() for character in GLITCH_CHARACTERS)
+    highest_glyph_height = max(enemy_module._get_glitch_glyph(character, GRAY).get_height() for character in GLITCH_CHARACTERS)
+    for frame_surface in frame_pool:
+        assert frame_surface.get_width() >= 80 - 15 + widest_glyph_width
+        assert frame_surface.get_height() >= 40 - 15 + highest_glyph_height
+        # de gloed ligt over de vijand
+        assert frame_surface.get_at((0, 0)).a > 0
+
+    # over de hele pool steekt er wel iets buiten de vijand uit
+    overflow_alpha = sum(
+        pygame.surfarray.array_alpha(frame_surface)[80:, :].sum() + pygame.surfarray.array_alpha(frame_surface)[:, 40:].sum()
+        for frame_surface in frame_pool
+    )
+    assert overflow_alpha > 0
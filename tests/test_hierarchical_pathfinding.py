@@ -0,0 +1,51 @@
+import random
+
+from src.hierarchical_pathfinding import HierarchicalPathfinder
+from src.pathfinding import a_star
+from tests.pathfinding_helpers import controleer_pad, maak_doolhof_tilemap
+
+
+def test_hierarchical_path_agrees_with_a_star():
+    tilemap_instance = maak_doolhof_tilemap()
+    navigation_grid = tilemap_instance.get_navigation_grid()
+    hierarchical_pathfinder = tilemap_instance.get_hierarchical_pathfinder(cluster_size=8)
+
+    random_generator = random.Random(3)
+    for _ in range(60):
+        start_position = (random_generator.randint(48, 46 * 48), random_generator.randint(48, 38 * 48))
+        goal_position = (random_generator.randint(48, 46 * 48), random_generator.randint(48, 38 * 48))
+
+        flat_path = a_star(start_position, goal_position, navigation_grid)
+        full_path = hierarchical_pathfinder.find_path(start_position, goal_position, refined_segment_count=None)
+        # bereikbaar volgens de een betekent bereikbaar volgens de ander
+        assert (flat_path is None) == (full_path is None)
+        if full_path:
+            controleer_pad(navigation_grid, full_path, goal_position)
+            # alleen het volgende stuk uitwerken geeft het begin van hetzelfde pad
+            next_segment = hierarchical_pathfinder.find_path(start_position, goal_position)
+            assert next_segment == full_path[:len(next_segment)]
+
+
+def test_hierarchical_pathfinder_updates_only_changed_clusters():
+    tilemap_instance = maak_doolhof_tilemap()
+    hierarchical_pathfinder = tilemap_instance.get_hierarchical_pathfinder(cluster_size=8)
+    start_position, goal_position = (2 * 48, 2 * 48), (44 * 48, 36 * 48)
+    assert hierarchical_pathfinder.find_path(start_position, goal_position, refined_segment_count=None)
+
+    # alle afstanden binnen de clusters uitrekenen, dan een tegel linksboven dichtzetten
+    for cluster_row in range(hierarchical_pathfinder.cluster_rows):
+        for cluster_column in range(hierarchical_pathfinder.cluster_columns):
+            hierarchical_pathfinder._get_intra_edges((cluster_column, cluster_row))
+    far_cluster_edges = hierarchical_pathfinder.intra_edges[(5, 4)]
+
+    tilemap_instance.set_tile("collision", 3, 3, 1)
+    assert tilemap_instance.get_hierarchical_pathfinder(cluster_size=8) is hierarchical_pathfinder
+    assert hierarchical_pathfinder.navigation_grid is tilemap_instance.get_navigation_grid()
+    assert (0, 0) not in hierarchical_pathfinder.intra_edges
+    assert hierarchical_pathfinder.intra_edges[(5, 4)] is far_cluster_edges
+
+    # na het bijwerken moet het resultaat hetzelfde zijn als met een nieuw opgebouwde pathfinder
+    rebuilt_pathfinder = HierarchicalPathfinder(tilemap_instance.get_navigation_grid(), cluster_size=8)
+    assert hierarchical_pathfinder.border_entrances == rebuilt_pathfinder.border_entrances
+    assert hierarchical_pathfinder.find_path(start_position, goal_position, refined_segment_count=None) == \
+        rebuilt_pathfinder.find_path(start_position, goal_position, refined_segment_count=None)
@@ -0,0 +1,69 @@
+import random
+
+from src.enemy import Dog
+from src.incremental_pathfinding import DStarLitePlanner
+from src.pathfinding import a_star
+from src.tilemap import Tilemap
+from tests.pathfinding_helpers import controleer_pad, maak_doolhof_tilemap
+
+
+def test_incremental_planner_follows_moving_goal_and_tile_changes():
+    tilemap_instance = maak_doolhof_tilemap()
+    incremental_planner = DStarLitePlanner(tilemap_instance.get_navigation_grid())
+
+    random_generator = random.Random(4)
+    start_position, goal_position = (2 * 48, 2 * 48), (44 * 48, 36 * 48)
+    for step_index in range(150):
+        # start en doel lopen een stukje, af en toe springt het doel of verandert er een tegel
+        start_position = (
+            min(46 * 48, max(48, start_position[0] + random_generator.randint(-100, 100))),
+            min(38 * 48, max(48, start_position[1] + random_generator.randint(-100, 100))),
+        )
+        goal_position = (
+            min(46 * 48, max(48, goal_position[0] + random_generator.randint(-150, 150))),
+            min(38 * 48, max(48, goal_position[1] + random_generator.randint(-150, 150))),
+        )
+        if step_index % 10 == 0:
+            tilemap_instance.set_tile("collision", random_generator.randint(1, 46), random_generator.randint(1, 38), step_index % 20 // 10)
+        if step_index % 25 == 0:
+            goal_position = (random_generator.randint(48, 46 * 48), random_generator.randint(48, 38 * 48))
+
+        navigation_grid = tilemap_instance.get_navigation_grid()
+        flat_path = a_star(start_position, goal_position, navigation_grid)
+        incremental_path = incremental_planner.find_path(start_position, goal_position, navigation_grid)
+        # bereikbaar volgens de een betekent bereikbaar volgens de ander
+        assert (flat_path is None) == (incremental_path is None)
+        if incremental_path:
+            controleer_pad(navigation_grid, incremental_path, goal_position)
+
+    # de kosten zijn bewaard en hersteld in plaats van elke keer opnieuw uitgerekend
+    assert incremental_planner.reset_count == 1
+
+
+def test_incremental_path_does_not_overshoot_stale_root():
+    # het doel loopt terug naar de achtervolger maar blijft binnen de drift, de wortel blijft dus staan;
+    # het pad mag dan niet eerst naar de oude wortel lopen en weer terug
+    tilemap_instance = Tilemap(tile_size=48)
+    tilemap_instance.load_from_data({"collision": [[0] * 40 for _ in range(5)]})
+    navigation_grid = tilemap_instance.get_navigation_grid()
+    incremental_planner = DStarLitePlanner(navigation_grid)
+
+    incremental_planner.find_path((1 * 48 + 24, 2 * 48 + 24), (36 * 48 + 24, 2 * 48 + 24))
+    old_goal_index = incremental_planner.goal_index
+    incremental_path = incremental_planner.find_path((2 * 48 + 24, 2 * 48 + 24), (31 * 48 + 24, 2 * 48 + 24))
+
+    assert incremental_planner.goal_index == old_goal_index
+    assert len(incremental_path) == len(a_star((2 * 48 + 24, 2 * 48 + 24), (31 * 48 + 24, 2 * 48 + 24), navigation_grid))
+    controleer_pad(navigation_grid, incremental_path, (31 * 48 + 24, 2 * 48 + 24))
+
+
+def test_dog_uses_incremental_planner():
+    tilemap_instance = maak_doolhof_tilemap()
+    dog = Dog(2 * 48, 2 * 48)
+    dog.pathfinding_mode = "incremental"
+    dog.current_state = "chase"
+
+    dog._recalculate_path_if_needed((44 * 48, 36 * 48), tilemap_instance)
+    assert dog.incremental_planner is not None
+    assert dog.current_path and dog.current_target_node == dog.current_path[0]
+    controleer_pad(tilemap_instance.get_navigation_grid(), dog.current_path, (44 * 48 + 24, 36 * 48 + 46))
@@ -0,0 +1,88 @@
+import pygame
+import pytest
+
+from src.input_recording import InputRecorder, load_input_recording
+from src.minigame import PythonQuizMinigame
+from src.simulation import Simulation, SimulationInput
+
+
+def maak_quiz_invoer(tick_index):
+    # de speler opent de quiz, geeft een paar antwoorden en loopt daarna rond
+    if tick_index == 0:
+        return SimulationInput(key_events=[(pygame.KEYDOWN, pygame.K_SPACE)])
+    if tick_index < 1100 and tick_index % 50 == 0:
+        return SimulationInput(key_events=[(pygame.KEYDOWN, pygame.K_1), (pygame.KEYUP, pygame.K_1)])
+    return SimulationInput(move_left=tick_index % 80 < 30, move_down=tick_index % 80 > 50)
+
+
+def maak_shooter_invoer(tick_index):
+    # de speler opent de operator shooter, houdt de spatiebalk vast en beweegt heen en weer
+    if tick_index in (0, 1):
+        return SimulationInput(key_events=[(pygame.KEYDOWN, pygame.K_SPACE)])
+    if tick_index % 60 == 2:
+        moving_key = pygame.K_LEFT if tick_index % 120 == 2 else pygame.K_RIGHT
+        return SimulationInput(key_events=[
+            (pygame.KEYUP, pygame.K_LEFT), (pygame.KEYUP, pygame.K_RIGHT), (pygame.KEYDOWN, moving_key)
+        ])
+    return SimulationInput()
+
+
+def lees_minigame_toestand(minigame_logic):
+    # alles wat bij een replay precies hetzelfde moet zijn
+    if isinstance(minigame_logic, PythonQuizMinigame):
+        return minigame_logic.total_score_points, minigame_logic.questions_data
+    return (
+        minigame_logic.total_score_points,
+        minigame_logic.difficulty,
+        [(enemy.text_content, enemy.position_coordinate_x, enemy.position_coordinate_y) for enemy in minigame_logic.operator_pool],
+        len(minigame_logic.projectile_pool),
+    )
+
+
+@pytest.mark.parametrize("maak_invoer, player_start_position, operator_difficulty, tick_count", [
+    (maak_quiz_invoer, (1536, 300), "normal", 1400),
+    (maak_shooter_invoer, (576, 920), "bullet_hell", 600),
+])
+def test_replay_reproduces_recorded_session(tmp_path, maak_invoer, player_start_position, operator_difficulty, tick_count):
+    recording_path = str(tmp_path / "sessie.prec")
+    recorded_simulation = Simulation(
+        "assets/maps/Garden_1.json", 1440, 960, player_start_position=player_start_position,
+        random_seed=11, operator_difficulty=operator_difficulty
+    )
+    input_recorder = InputRecorder(recording_path, 11, "assets/maps/Garden_1.json", operator_difficulty)
+    minigame_logic = None
+    for tick_index in range(tick_count):
+        simulation_input = maak_invoer(tick_index)
+        input_recorder.record_tick(simulation_input)
+        recorded_simulation.tick(simulation_input)
+        if tick_index == 0:
+            minigame_logic = recorded_simulation.active_minigame_session.current_application
+    input_recorder.close()
+
+    input_recording = load_input_recording(recording_path)
+    assert input_recording.random_seed == 11
+    assert input_recording.operator_difficulty == operator_difficulty
+    assert len(input_recording.tick_inputs) == tick_count
+
+    # tussendoor wordt de random bron door iets anders gebruikt, de seed moet dat weer rechtzetten
+    PythonQuizMinigame(360, 580)
+
+    # de replay neemt seed, map en moeilijkheid uit de opname, net als Game
+    replayed_simulation = Simulation(
+        input_recording.map_file_path, 1440, 960, player_start_position=player_start_position,
+        random_seed=input_recording.random_seed, operator_difficulty=input_recording.operator_difficulty
+    )
+    replayed_minigame_logic = None
+    while not input_recording.is_finished():
+        replayed_simulation.tick(input_recording.next_input())
+        if replayed_minigame_logic is None:
+            replayed_minigame_logic = replayed_simulation.active_minigame_session.current_application
+
+    # dezelfde minigame, dezelfde score en de speler en vijanden op dezelfde plek
+    assert lees_minigame_toestand(replayed_minigame_logic) == lees_minigame_toestand(minigame_logic)
+    assert minigame_logic.total_score_points > 0
+    assert (replayed_simulation.player_character.position_coordinate_x, replayed_simulation.player_character.position_coordinate_y) == \
+        (recorded_simulation.player_character.position_coordinate_x, recorded_simulation.player_character.position_coordinate_y)
+    assert [(enemy.position_coordinate_x, enemy.position_coordinate_y) for enemy in replayed_simulation.enemy_list] == \
+        [(enemy.position_coordinate_x, enemy.position_coordinate_y) for enemy in recorded_simulation.enemy_list]
+
@@ -0,0 +1,86 @@
+import math
+
+import numpy
+import pygame
+import pytest
+from src.light_system import LightSystem, _radial_light_mask_cache, generate_radial_light_mask
+
+
+def maak_oud_lichtmasker(light_radius):
+    # het oude masker: elke pixel los met math.hypot en een kwadratische falloff
+    mask_size = light_radius * 2
+    light_mask = pygame.Surface((mask_size, mask_size), pygame.SRCALPHA)
+    for pixel_y in range(mask_size):
+        for pixel_x in range(mask_size):
+            distance_from_center = math.hypot(pixel_x - light_radius, pixel_y - light_radius)
+            if distance_from_center < light_radius:
+                fade_factor = distance_from_center / light_radius
+                darkness_alpha = int(255 * fade_factor * fade_factor)
+            else:
+                darkness_alpha = 255
+            light_mask.set_at((pixel_x, pixel_y), (0, 0, 0, darkness_alpha))
+    return light_mask
+
+
+def oude_belichting(screen, light_mask, light_radius, player_position, player_size):
+    # de oude lichtpass: een zwarte overlay zo groot als het scherm met het masker erin vermenigvuldigd
+    darkness_overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    darkness_overlay.fill((0, 0, 0, 255))
+    player_center_x = int(player_position[0] + player_size[0] // 2)
+    player_center_y = int(player_position[1] + player_size[1] // 2)
+    darkness_overlay.blit(light_mask, (player_center_x - light_radius, player_center_y - light_radius), special_flags=pygame.BLEND_RGBA_MULT)
+    screen.blit(darkness_overlay, (0, 0))
+
+
+def maak_gekleurd_scherm(screen_width=160, screen_height=120):
+    # een scherm met een kleurverloop, zodat elke fout in de blending zichtbaar wordt
+    screen = pygame.Surface((screen_width, screen_height))
+    screen_pixels = pygame.surfarray.pixels3d(screen)
+    screen_pixels[:, :, 0] = numpy.arange(screen_width, dtype=numpy.uint8)[:, None]
+    screen_pixels[:, :, 1] = numpy.arange(screen_height, dtype=numpy.uint8)[None, :] * 2
+    screen_pixels[:, :, 2] = 200
+    del screen_pixels
+    return screen
+
+
+@pytest.mark.parametrize("light_radius", [1, 2, 5, 12, 25])
+def test_radial_light_mask_matches_per_pixel_formula(light_radius):
+    _radial_light_mask_cache.clear()
+    new_alpha = pygame.surfarray.array_alpha(generate_radial_light_mask(light_radius))
+    old_alpha = pygame.surfarray.array_alpha(maak_oud_lichtmasker(light_radius))
+    assert numpy.array_equal(new_alpha, old_alpha)
+    assert not pygame.surfarray.array3d(generate_radial_light_mask(light_radius)).any()
+
+
+def test_radial_light_mask_cache():
+    _radial_light_mask_cache.clear()
+    light_mask = generate_radial_light_mask(20, 2.0)
+    # dezelfde (straal, falloff) geeft hetzelfde object terug, een andere falloff een nieuw masker
+    assert generate_radial_light_mask(20, 2.0) is light_mask
+    assert generate_radial_light_mask(20, 3.0) is not light_mask
+    assert len(_radial_light_mask_cache) == 2
+
+    lighting_system = LightSystem(160, 120, light_radius=20)
+    lighting_system.prepare_light_radii([10, 20])
+    assert lighting_system.radial_light_mask is light_mask
+    lighting_system.set_light_radius(10)
+    assert lighting_system.radial_light_mask is _radial_light_mask_cache[(10, 2.0)]
+    assert len(_radial_light_mask_cache) == 3
+
+
+@pytest.mark.parametrize("player_position", [
+    (60, 30),     # licht helemaal in beeld
+    (-20, 70),    # licht valt links en onder buiten beeld
+    (130, -40),   # licht valt rechts en boven buiten beeld
+    (-300, 40),   # licht helemaal buiten beeld
+])
+def test_apply_lighting_matches_full_screen_overlay(player_position):
+    light_radius, player_size = 30, (16, 24)
+    lighting_system = LightSystem(160, 120, light_radius=light_radius)
+    new_screen = maak_gekleurd_scherm()
+    old_screen = maak_gekleurd_scherm()
+
+    lighting_system.apply_lighting(new_screen, player_position, player_size)
+    oude_belichting(old_screen, lighting_system.radial_light_mask, light_radius, player_position, player_size)
+
+    assert numpy.array_equal(pygame.surfarray.array3d(new_screen), pygame.surfarray.array3d(old_screen))
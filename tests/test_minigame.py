@@ -0,0 +1,68 @@
+import pygame
+
+from src.fonts import render_text
+from src.game_random import seed_gameplay_random
+from src.minigame import OPERATOR_DIFFICULTIES, OperatorMinigame, prepare_minigame_text
+
+
+def maak_operator_minigame(difficulty="normal"):
+    # een operator shooter zonder nieuwe operators tijdens de test
+    seed_gameplay_random(2)
+    operator_minigame = OperatorMinigame(360, 490, difficulty=difficulty)
+    operator_minigame.operator_spawn_interval_frames = 10 ** 9
+    return operator_minigame
+
+
+def test_projectile_hits_operator_across_column_border():
+    operator_minigame = maak_operator_minigame()
+    # de operator ligt over de grens van twee kolommen (x 60 tot 100), de kogels eronder in beide kolommen
+    for operator_x in (60, 200):
+        falling_operator = operator_minigame.operator_pool.acquire(360, ["+"], ["=+"])
+        falling_operator.is_python_operator = False
+        falling_operator.position_coordinate_x = operator_x
+        falling_operator.position_coordinate_y = 100
+        falling_operator.movement_speed = 0
+    operator_minigame.projectile_pool.acquire(95, 122)
+    operator_minigame.projectile_pool.acquire(90, 122)
+    # deze kogel gaat net naast de tweede operator langs
+    operator_minigame.projectile_pool.acquire(240, 122)
+
+    operator_minigame.update()
+
+    # een operator geraakt door een van de twee kogels, de andere kogel vliegt door
+    assert operator_minigame.total_score_points == 20
+    assert [falling_operator.position_coordinate_x for falling_operator in operator_minigame.operator_pool] == [200]
+    remaining_positions = sorted(projectile.position_coordinate_x for projectile in operator_minigame.projectile_pool)
+    assert len(remaining_positions) == 2 and remaining_positions[1] == 240
+    assert len(operator_minigame.operator_pool.free_objects) == 1
+
+
+def test_bullet_hell_reuses_projectiles():
+    operator_minigame = maak_operator_minigame("bullet_hell")
+    operator_minigame.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
+    for _ in range(200):
+        operator_minigame.update()
+
+    # honderden kogels tegelijk, maar na de eerste ronde komen ze uit de pool in plaats van nieuw
+    active_count = len(operator_minigame.projectile_pool)
+    created_count = active_count + len(operator_minigame.projectile_pool.free_objects)
+    assert active_count > 200
+    assert created_count < 7 * 50
+
+    operator_minigame.handle_input(pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE))
+    for _ in range(60):
+        operator_minigame.update()
+    assert len(operator_minigame.projectile_pool) == 0
+
+
+def test_operator_score_text_is_prepared_for_every_difficulty():
+    # na het vooraf renderen mag de score van elke moeilijkheid niets nieuws meer renderen
+    pygame.font.init()
+    prepare_minigame_text()
+    cache_misses = render_text.cache_info().misses
+    for difficulty in OPERATOR_DIFFICULTIES:
+        operator_minigame = maak_operator_minigame(difficulty)
+        operator_minigame.total_score_points = operator_minigame.target_score_points - 5
+        operator_minigame.draw(pygame.Surface((360, 490)))
+    assert render_text.cache_info().misses == cache_misses
@@ -0,0 +1,85 @@
+from concurrent.futures import Future
+
+from src.enemy import Dog
+from src.path_service import PathRequestService
+from src.pathfinding import a_star
+from src.simulation import Simulation, SimulationInput
+from src.tilemap import Tilemap
+
+
+class HandmatigeExecutor:
+    # voert aanvragen pas uit als de test dat zegt, zodat "een later frame" te testen is
+    def __init__(self):
+        self.queued_jobs = []
+
+    def submit(self, function, *arguments, **keyword_arguments):
+        future = Future()
+        self.queued_jobs.append((future, function, arguments, keyword_arguments))
+        return future
+
+    def run_all(self):
+        for future, function, arguments, keyword_arguments in self.queued_jobs:
+            if future.set_running_or_notify_cancel():
+                future.set_result(function(*arguments, **keyword_arguments))
+        self.queued_jobs = []
+
+    def shutdown(self, wait=True):
+        self.queued_jobs = []
+
+
+def laad_garden():
+    tilemap_instance = Tilemap()
+    tilemap_instance.load_from_file("assets/maps/Garden_1.json")
+    return tilemap_instance
+
+
+def test_newest_request_supersedes_older_one():
+    tilemap_instance = laad_garden()
+    navigation_grid = tilemap_instance.get_navigation_grid()
+    manual_executor = HandmatigeExecutor()
+    path_service = PathRequestService(executor=manual_executor)
+    requester = object()
+
+    path_service.request_path(requester, (120, 120), (900, 500), navigation_grid)
+    path_service.request_path(requester, (120, 120), (1500, 300), navigation_grid)
+    manual_executor.run_all()
+
+    assert path_service.poll_results() == 1
+    assert path_service.superseded_request_count == 1
+    assert path_service.take_result(requester) == a_star((120, 120), (1500, 300), navigation_grid)
+    assert not path_service.has_result(requester)
+
+
+def test_dog_keeps_old_path_until_result_arrives():
+    tilemap_instance = laad_garden()
+    manual_executor = HandmatigeExecutor()
+    path_service = PathRequestService(executor=manual_executor)
+
+    dog_instance = Dog(500, 400)
+    dog_instance.path_service = path_service
+    old_path = [(600, 420), (650, 420)]
+    dog_instance.current_path = list(old_path)
+    dog_instance.current_target_node = old_path[0]
+
+    # de timer is om: er wordt een aanvraag gedaan, maar het oude pad blijft staan
+    dog_instance._recalculate_path_if_needed((1000, 700), tilemap_instance)
+    assert path_service.has_pending_request(dog_instance)
+    assert dog_instance.current_path == old_path
+
+    manual_executor.run_all()
+    path_service.poll_results()
+    dog_instance._recalculate_path_if_needed((1000, 700), tilemap_instance)
+    assert dog_instance.current_path == a_star((540, 420), (1024, 746), tilemap_instance.get_navigation_grid())
+
+
+def test_simulation_with_path_service_chases_player():
+    # met echte worker threads moeten de honden de speler nog steeds achtervolgen
+    simulation_instance = Simulation("assets/maps/Garden_1.json", 1440, 960, player_start_position=(1000, 700), use_path_service=True)
+    try:
+        start_distances = [abs(enemy.position_coordinate_x - 1000) for enemy in simulation_instance.enemy_list]
+        simulation_instance.run_ticks(SimulationInput(), 120)
+        assert simulation_instance.path_service.submitted_request_count > 0
+        for enemy, start_distance in zip(simulation_instance.enemy_list, start_distances):
+            assert abs(enemy.position_coordinate_x - 1000) < start_distance
+    finally:
+        simulation_instance.close()
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+from src.pathfinding import FlowField, NavGrid, a_star, find_path
+from src.tilemap import Tilemap
+
+
+@pytest.fixture
+def garden_tilemap():
+    # de echte tuin map, zodat de tests dezelfde muren zien als de game
+    tilemap_instance = Tilemap(tile_size=48)
+    tilemap_instance.load_from_file("assets/maps/Garden_1.json")
+    return tilemap_instance
+
+
+def test_navgrid_from_tilemap_matches_walls(garden_tilemap):
+    # het grid uit de tegels moet gelijk zijn aan het grid uit de lijst met muren
+    grid_from_tiles = NavGrid.from_tilemap(garden_tilemap)
+    grid_from_walls = NavGrid.from_walls(
+        garden_tilemap.walls, 48, garden_tilemap.map_width, garden_tilemap.map_height
+    )
+
+    assert grid_from_tiles.grid_width == 40
+    assert grid_from_tiles.grid_height == 22
+    assert grid_from_tiles.blocked_tiles == grid_from_walls.blocked_tiles
+
+
+def test_a_star_with_navgrid_avoids_walls(garden_tilemap):
+    # het pad mag nooit over een bezette tegel lopen
+    navigation_grid = garden_tilemap.get_navigation_grid()
+    path = a_star((100, 250), (1700, 900), navigation_grid)
+
+    assert path
+    assert path[-1] == navigation_grid.grid_to_world(*navigation_grid.world_to_grid(1700, 900))
+    for world_x, world_y in path:
+        assert not navigation_grid.is_blocked(*navigation_grid.world_to_grid(world_x, world_y))
+
+    # de oude aanroep met een lijst muren moet nog steeds even lang zijn
+    legacy_path = a_star((100, 250), (1700, 900), garden_tilemap.walls, tile_size=48)
+    assert len(legacy_path) == len(path)
+
+
+def test_navigation_grid_rebuilt_after_tile_change(garden_tilemap):
+    # het grid blijft hetzelfde object tot de map verandert
+    first_grid = garden_tilemap.get_navigation_grid()
+    assert garden_tilemap.get_navigation_grid() is first_grid
+
+    garden_tilemap.set_tile("collision", 10, 8, 1)
+    rebuilt_grid = garden_tilemap.get_navigation_grid()
+
+    assert rebuilt_grid is not first_grid
+    assert rebuilt_grid.is_blocked(10, 8)
+
+
+def test_flow_field_leads_to_goal(garden_tilemap):
+    # door steeds de volgende tegel te volgen moet je bij het doel uitkomen
+    navigation_grid = garden_tilemap.get_navigation_grid()
+    flow_field = FlowField(navigation_grid)
+    assert flow_field.update((1700, 900))
+
+    current_position = (100, 250)
+    for _ in range(200):
+        next_waypoint = flow_field.get_next_waypoint(*current_position)
+        if next_waypoint is None:
+            break
+        current_position = next_waypoint
+    assert navigation_grid.world_to_grid(*current_position) == navigation_grid.world_to_grid(1700, 900)
+
+    # op dezelfde tegel blijven geeft geen nieuwe zoektocht
+    assert not flow_field.update((1710, 910))
+    assert flow_field.recalculation_count == 1
+
+
+def test_jump_point_search_matches_a_star(garden_tilemap):
+    # zelfde soort pad (aansluitende vrije tegels tot het doel), even lang, maar met minder uitgebreide knopen
+    navigation_grid = garden_tilemap.get_navigation_grid()
+    a_star_statistics = {}
+    jump_point_statistics = {}
+    a_star_path = find_path((100, 250), (1700, 900), navigation_grid, search_statistics=a_star_statistics)
+    jump_point_path = find_path(
+        (100, 250), (1700, 900), navigation_grid, algorithm="jump_point", search_statistics=jump_point_statistics
+    )
+    assert len(jump_point_path) == len(a_star_path)
+    assert jump_point_path[-1] == a_star_path[-1]
+    assert jump_point_statistics["expanded_node_count"] < a_star_statistics["expanded_node_count"]
+
+    previous_tile = navigation_grid.world_to_grid(100, 250)
+    for world_x, world_y in jump_point_path:
+        tile = navigation_grid.world_to_grid(world_x, world_y)
+        assert max(abs(tile[0] - previous_tile[0]), abs(tile[1] - previous_tile[1])) == 1
+        assert not navigation_grid.is_blocked(*tile)
+        previous_tile = tile
+
+    # bereikbaar volgens de een betekent bereikbaar volgens de ander, ook vanaf een bezette tegel
+    random_generator = random.Random(7)
+    for _ in range(100):
+        start_position = (random_generator.randint(0, 40 * 48), random_generator.randint(0, 22 * 48))
+        goal_position = (random_generator.randint(0, 40 * 48), random_generator.randint(0, 22 * 48))
+        assert (a_star(start_position, goal_position, navigation_grid) is None) == \
+            (find_path(start_position, goal_position, navigation_grid, algorithm="jump_point") is None)
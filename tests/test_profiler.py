@@ -0,0 +1,42 @@
+import csv
+
+from src.profiler import FrameProfiler, profile_section, set_active_profiler
+from src.simulation import Simulation, SimulationInput
+
+
+def test_profiler_records_simulation_sections(tmp_path):
+    # de onderdelen van de simulatie moeten per frame in de ringbuffer komen
+    frame_profiler = FrameProfiler(history_size=20)
+    simulation_instance = Simulation("assets/maps/Garden_1.json", 1440, 960, player_start_position=(700, 400))
+
+    set_active_profiler(frame_profiler)
+    try:
+        for _ in range(30):
+            frame_profiler.begin_frame()
+            with profile_section("update"):
+                simulation_instance.tick(SimulationInput(move_left=True))
+            frame_profiler.end_frame()
+    finally:
+        set_active_profiler(None)
+
+    assert len(frame_profiler.frame_durations) == 20
+    assert frame_profiler.frame_count == 30
+    for section_name in ("update", "player_move", "enemy_update"):
+        assert frame_profiler.get_average_section_time(section_name) > 0
+    assert frame_profiler.get_frame_time_percentile(99) >= frame_profiler.get_average_frame_time() > 0
+
+    csv_path = tmp_path / "frames.csv"
+    frame_profiler.dump_csv(str(csv_path))
+    with open(csv_path, newline="", encoding="utf-8") as file_handle:
+        csv_rows = list(csv.DictReader(file_handle))
+    assert len(csv_rows) == 20
+    assert csv_rows[0]["frame_index"] == "10"
+    assert float(csv_rows[0]["update_ms"]) > 0
+
+
+def test_profile_section_is_free_without_profiler():
+    # zonder actieve profiler wordt er niets gemeten of opgeslagen
+    set_active_profiler(None)
+    with profile_section("lighting") as first_section, profile_section("ui") as second_section:
+        pass
+    assert first_section is second_section
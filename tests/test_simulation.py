@@ -0,0 +1,86 @@
+import pygame
+from src.simulation import Simulation, SimulationInput
+
+
+def maak_simulatie(player_start_position=(1035, 800)):
+    # een simulatie zonder scherm, precies zoals de game hem aanmaakt
+    return Simulation("assets/maps/Garden_1.json", 1440, 960, player_start_position=player_start_position)
+
+
+def test_simulation_runs_headless():
+    # de wereld moet zonder scherm vooruit kunnen en elke keer hetzelfde doen (de snelheid meet de benchmark)
+    simulations = [maak_simulatie(), maak_simulatie()]
+    start_x = simulations[0].player_character.position_coordinate_x
+    for simulation_instance in simulations:
+        simulation_instance.run_ticks(SimulationInput(move_right=True), 2000)
+
+    assert [simulation_instance.tick_count for simulation_instance in simulations] == [2000, 2000]
+    player_character = simulations[0].player_character
+    assert player_character.position_coordinate_x > start_x
+    # de speler loopt tegen een muur aan maar niet erdoorheen
+    assert not simulations[0].game_map.collides_with_rect(pygame.Rect(
+        player_character.position_coordinate_x, player_character.position_coordinate_y,
+        player_character.size_width, player_character.size_height
+    ))
+    world_states = [
+        [(entity.position_coordinate_x, entity.position_coordinate_y) for entity in [simulation_instance.player_character] + simulation_instance.enemy_list]
+        for simulation_instance in simulations
+    ]
+    assert world_states[0] == world_states[1]
+
+
+def test_simulation_tracks_nearby_interactable():
+    # naast de quiz weet de simulatie elke tick welk object er in de buurt is
+    simulation_instance = maak_simulatie(player_start_position=(1536, 300))
+    simulation_instance.tick(SimulationInput())
+    assert simulation_instance.nearby_interactable.tile_type == 5
+
+    simulation_instance.player_character.position_coordinate_x = 700
+    simulation_instance.tick(SimulationInput())
+    assert simulation_instance.nearby_interactable is None
+
+
+def test_completing_quiz_rewards_key():
+    # de speler staat naast de quiz (tegel 5) en beantwoordt alles goed
+    simulation_instance = maak_simulatie(player_start_position=(1536, 300))
+    simulation_instance.tick(SimulationInput(key_events=[(pygame.KEYDOWN, pygame.K_SPACE)]))
+
+    quiz_session = simulation_instance.active_minigame_session
+    assert quiz_session is not None
+    # de quiz is een object van 2x2 tegels, de locatie is zijn eerste tegel
+    assert simulation_instance.last_interaction_location == (6, 30)
+
+    while simulation_instance.active_minigame_session:
+        quiz_logic = quiz_session.current_application
+        correct_answer = quiz_logic.questions_data[quiz_logic.current_question_index]["c"]
+        simulation_instance.tick(SimulationInput(key_events=[(pygame.KEYDOWN, pygame.K_1 + correct_answer)]))
+        simulation_instance.run_ticks(SimulationInput(), 45)
+
+    assert simulation_instance.player_character.keys_collected_count == 1
+    assert simulation_instance.active_info_message == "You feel closer to python"
+
+
+def test_enemy_swarm_matches_individual_dogs():
+    # de numpy swarm moet precies hetzelfde doen als losse Dog objecten
+    enemy_start_positions = [(100 + index * 43, 250 + (index % 7) * 90) for index in range(30)]
+    simulations = [
+        Simulation(
+            "assets/maps/Garden_1.json", 1440, 960,
+            player_start_position=(900, 500),
+            enemy_start_positions=enemy_start_positions,
+            enemy_pathfinding_mode="flow_field",
+            use_enemy_swarm=use_enemy_swarm
+        )
+        for use_enemy_swarm in (False, True)
+    ]
+
+    for tick_index in range(300):
+        simulation_input = SimulationInput(move_left=tick_index % 90 < 30, move_down=tick_index % 90 > 60)
+        for simulation_instance in simulations:
+            simulation_instance.tick(simulation_input)
+
+    enemy_states = [
+        [(enemy.position_coordinate_x, enemy.position_coordinate_y, enemy.current_state) for enemy in simulation_instance.enemy_list]
+        for simulation_instance in simulations
+    ]
+    assert enemy_states[0] == enemy_states[1]
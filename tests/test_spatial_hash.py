@@ -0,0 +1,74 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+from src.enemy import Dog
+from src.simulation import Simulation
+from src.spatial_hash import SpatialHash
+
+
+def maak_object(position_x, position_y, size_width=40, size_height=20):
+    return SimpleNamespace(position_coordinate_x=position_x, position_coordinate_y=position_y, size_width=size_width, size_height=size_height)
+
+
+def maak_honden_op_celgrenzen(seed, cell_size=90):
+    # honden rond de hoeken van cellen, zodat buren vaak in een andere cel liggen
+    random_generator = random.Random(seed)
+    return [
+        (random_generator.choice((1, 2, 3)) * cell_size + random_generator.uniform(-35, 35),
+         random_generator.choice((1, 2)) * cell_size + random_generator.uniform(-35, 35))
+        for _ in range(random_generator.randint(2, 25))
+    ]
+
+
+def test_spatial_hash_queries():
+    spatial_hash = SpatialHash(cell_size=100)
+    # over de grens van vier cellen, binnen een cel, en ver weg
+    object_on_corner = maak_object(90, 90)
+    object_in_cell = maak_object(120, 20)
+    object_far_away = maak_object(950, 950)
+    spatial_hash.rebuild([object_on_corner, object_in_cell, object_far_away])
+
+    assert set(spatial_hash.cells) >= {(0, 0), (1, 0), (0, 1), (1, 1), (9, 9)}
+    # een object in meer cellen komt maar een keer terug
+    assert spatial_hash.query_rect(0, 0, 250, 250) == [object_on_corner, object_in_cell]
+    assert spatial_hash.query_rect(10, 150, 20, 20) == [object_on_corner]
+    assert spatial_hash.query_radius(960, 960, 20) == [object_far_away]
+    assert spatial_hash.query_radius(500, 500, 40) == []
+
+    # rebuild vergeet de oude posities
+    object_in_cell.position_coordinate_x = 520
+    spatial_hash.rebuild([object_in_cell])
+    assert spatial_hash.query_rect(0, 0, 250, 250) == []
+    assert spatial_hash.query_radius(530, 30, 10) == [object_in_cell]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_hashed_separation_and_damage_match_all_pairs(seed):
+    start_positions = maak_honden_op_celgrenzen(seed)
+    all_pairs_dogs = [Dog(start_x, start_y) for start_x, start_y in start_positions]
+    hashed_dogs = [Dog(start_x, start_y) for start_x, start_y in start_positions]
+
+    # de oude lus: elke hond tegen alle andere
+    for dog in all_pairs_dogs:
+        dog.separate_from_other_enemies(all_pairs_dogs, separation_distance=90)
+    # zoals Simulation.update: een keer vullen, daarna alleen de buren uit de hash
+    spatial_hash = SpatialHash(cell_size=90)
+    spatial_hash.rebuild(hashed_dogs)
+    for dog in hashed_dogs:
+        dog.separate_from_other_enemies(hashed_dogs, separation_distance=90, spatial_hash=spatial_hash)
+
+    for all_pairs_dog, hashed_dog in zip(all_pairs_dogs, hashed_dogs):
+        assert hashed_dog.position_coordinate_x == pytest.approx(all_pairs_dog.position_coordinate_x)
+        assert hashed_dog.position_coordinate_y == pytest.approx(all_pairs_dog.position_coordinate_y)
+
+    # schade: de speler staat op een hoek van vier cellen, midden tussen de honden
+    player_character = maak_object(180 - 24, 90 - 48, 48, 96)
+    detect_collision = Simulation.detect_collision
+    all_pairs_hits = [dog for dog in all_pairs_dogs if detect_collision(None, player_character, dog)]
+    nearby_dogs = spatial_hash.query_rect(
+        player_character.position_coordinate_x - 2, player_character.position_coordinate_y - 2,
+        player_character.size_width + 4, player_character.size_height + 4
+    )
+    hashed_hits = [dog for dog in nearby_dogs if detect_collision(None, player_character, dog)]
+    assert sorted(hashed_dogs.index(dog) for dog in hashed_hits) == [all_pairs_dogs.index(dog) for dog in all_pairs_hits]
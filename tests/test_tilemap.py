@@ -0,0 +1,131 @@
+import json
+import random
+
+import pygame
+from src.map_format import convert_json_map
+from src.player import Player
+from src.tilemap import Tilemap
+
+
+def maak_tilemap(tmp_path, collision_grid, tile_size=48):
+    # schrijf een kleine map weg en laad hem zoals de game dat doet
+    map_file = tmp_path / "test_map.json"
+    map_file.write_text(json.dumps({"collision": collision_grid}))
+    tilemap_instance = Tilemap(tile_size=tile_size)
+    tilemap_instance.load_from_file(str(map_file))
+    return tilemap_instance
+
+
+def test_collides_with_rect_matches_wall_list(tmp_path):
+    # de snelle tegel-query moet hetzelfde antwoord geven als alle muren aflopen
+    random_generator = random.Random(3)
+    collision_grid = [[random_generator.choice((0, 0, 0, 1, 2, 5, 9)) for _ in range(12)] for _ in range(9)]
+    tilemap_instance = maak_tilemap(tmp_path, collision_grid)
+
+    for _ in range(500):
+        hitbox = pygame.Rect(
+            random_generator.randint(-60, 600),
+            random_generator.randint(-60, 450),
+            random_generator.randint(1, 100),
+            random_generator.randint(1, 100),
+        )
+        expected = any(hitbox.colliderect(wall) for wall in tilemap_instance.walls)
+        assert tilemap_instance.collides_with_rect(hitbox) == expected
+
+
+def test_player_stops_at_tilemap_wall(tmp_path):
+    # de speler moet ook stoppen als de tilemap zelf als muren wordt meegegeven
+    tilemap_instance = maak_tilemap(tmp_path, [[0, 0, 0, 1], [0, 0, 0, 1], [0, 0, 0, 1]])
+    player_instance = Player(90, 10)
+
+    player_instance.move(10, 0, tilemap_instance)
+    assert player_instance.position_coordinate_x == 90
+
+    player_instance.move(-10, 0, tilemap_instance)
+    assert player_instance.position_coordinate_x == 80
+
+
+def teken_tegels_los(tilemap_instance, screen, camera_x, camera_y):
+    # de oude manier van tekenen: elke tegel los met pygame.draw.rect
+    for row_index, row in enumerate(tilemap_instance.layers["collision"]):
+        for column_index, tile_type in enumerate(row):
+            color = tilemap_instance.tile_colors.get(tile_type, (255, 0, 255))
+            if tile_type != 0 and color:
+                pygame.draw.rect(screen, color, (
+                    column_index * tilemap_instance.tile_size - camera_x,
+                    row_index * tilemap_instance.tile_size - camera_y,
+                    tilemap_instance.tile_size,
+                    tilemap_instance.tile_size,
+                ))
+
+
+def test_chunked_draw_layer_matches_per_tile_drawing(tmp_path):
+    # de gebakken chunks moeten precies hetzelfde beeld geven, ook na het veranderen van een tegel
+    random_generator = random.Random(5)
+    collision_grid = [[random_generator.choice((0, 0, 0, 1, 2, 3, 7)) for _ in range(40)] for _ in range(35)]
+    tilemap_instance = maak_tilemap(tmp_path, collision_grid, tile_size=16)
+
+    for camera_x, camera_y in ((0, 0), (130, 77), (400, 300)):
+        if camera_x == 400:
+            tilemap_instance.set_tile("collision", 30, 25, 3)
+            tilemap_instance.set_tile("collision", 31, 25, 0)
+
+        chunked_screen = pygame.Surface((320, 240))
+        tilemap_instance.draw_layer(chunked_screen, "collision", camera_x, camera_y)
+        expected_screen = pygame.Surface((320, 240))
+        teken_tegels_los(tilemap_instance, expected_screen, camera_x, camera_y)
+
+        assert pygame.image.tobytes(chunked_screen, "RGB") == pygame.image.tobytes(expected_screen, "RGB")
+
+
+def test_binary_map_matches_json_map(tmp_path):
+    # het binaire formaat moet precies dezelfde map opleveren als de JSON-map
+    binary_map_path = str(tmp_path / "Garden_1.pmap")
+    convert_json_map("assets/maps/Garden_1.json", binary_map_path)
+
+    json_tilemap = Tilemap()
+    json_tilemap.load_from_file("assets/maps/Garden_1.json")
+    binary_tilemap = Tilemap()
+    binary_tilemap.load_from_file(binary_map_path)
+
+    assert (binary_tilemap.map_width, binary_tilemap.map_height) == (json_tilemap.map_width, json_tilemap.map_height)
+    assert binary_tilemap.walls == json_tilemap.walls
+    assert binary_tilemap.blocking_tiles == json_tilemap.blocking_tiles
+    assert binary_tilemap.get_navigation_grid().blocked_tiles == json_tilemap.get_navigation_grid().blocked_tiles
+    assert binary_tilemap.layers["collision"].tolist() == json_tilemap.layers["collision"]
+
+    for world_x, world_y in ((1000, 300), (1536, 300), (20, 20), (-5, 40), (5000, 5000)):
+        assert binary_tilemap.get_tile("collision", world_x, world_y) == json_tilemap.get_tile("collision", world_x, world_y)
+        assert binary_tilemap.get_interaction_tile_info(world_x, world_y, 60) == json_tilemap.get_interaction_tile_info(world_x, world_y, 60)
+
+    # veranderen kan in het geheugen, het bestand zelf blijft hetzelfde
+    binary_tilemap.set_tile("collision", 5, 5, 1)
+    assert binary_tilemap.is_tile_blocking(5, 5)
+    reloaded_tilemap = Tilemap()
+    reloaded_tilemap.load_from_file(binary_map_path)
+    assert reloaded_tilemap.layers["collision"][5][5] == json_tilemap.layers["collision"][5][5]
+
+
+def test_interactable_index_groups_objects_and_finds_nearest(tmp_path):
+    # een dubbele deur, een quiz van 2x2 en een los bord
+    collision_grid = [[0] * 10 for _ in range(8)]
+    collision_grid[1][3] = collision_grid[1][4] = 9
+    collision_grid[4][6] = collision_grid[4][7] = collision_grid[5][6] = collision_grid[5][7] = 5
+    collision_grid[6][1] = 3
+    tilemap_instance = maak_tilemap(tmp_path, collision_grid)
+
+    interactable_objects = tilemap_instance.interactable_index.interactable_objects
+    assert sorted((interactable_object.tile_type, interactable_object.row_index, interactable_object.column_index)
+                  for interactable_object in interactable_objects) == [(3, 6, 1), (5, 4, 6), (9, 1, 3)]
+
+    # van elke kant van de deur dezelfde locatie
+    assert tilemap_instance.get_interaction_tile_info(3 * 48 - 10, 72, 40) == (9, 1, 3)
+    assert tilemap_instance.get_interaction_tile_info(5 * 48 + 10, 72, 40) == (9, 1, 3)
+    assert tilemap_instance.get_interaction_tile_info(8 * 48 + 10, 6 * 48 - 5, 40) == (5, 4, 6)
+    assert tilemap_instance.get_nearest_interactable(8 * 48, 2 * 48, 40) is None
+
+    # tussen twee objecten in wint het dichtstbijzijnde
+    collision_grid[3][1] = 3
+    tilemap_instance = maak_tilemap(tmp_path, collision_grid)
+    assert tilemap_instance.get_interaction_tile_info(130, 120, 40) == (9, 1, 3)
+    assert tilemap_instance.get_interaction_tile_info(110, 130, 40) == (3, 3, 1)